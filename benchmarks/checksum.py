@@ -0,0 +1,81 @@
+"""Compare the table driven check digits against the previous implementation.
+
+The previous implementation converted every digit with ``int`` and multiplied
+it by its weight in a generator, on every call. Now the products are looked up
+in the tables of ``brazilian_ids.functions.checksum.WeightedSum``.
+
+Run it with ``python benchmarks/checksum.py`` from the project root.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from brazilian_ids.functions.company import cnpj  # noqa: E402
+from brazilian_ids.functions.person import cpf, pis_pasep  # noqa: E402
+from brazilian_ids.functions.real_state import cno  # noqa: E402
+from brazilian_ids.functions.util import NONDIGIT_REGEX  # noqa: E402
+
+
+def legacy_cpf_verification_digits(value: str) -> tuple[int, int]:
+    value = NONDIGIT_REGEX.sub("", value)
+    digits = [int(k) for k in value[:10]]
+    cs = (sum(w * k for w, k in zip(cpf.CPF_WEIGHTS, digits)) % 11) % 10
+    digits.append(cs)
+    return (cs, ((sum(w * k for w, k in zip(cpf.CPF_WEIGHTS, digits[1:])) % 11) % 10))
+
+
+def legacy_cnpj_verification_digits(value: str) -> tuple[int, int]:
+    value = NONDIGIT_REGEX.sub("", value)
+    digits = [int(k) for k in value[:13]]
+    cs = sum(w * d for w, d in zip(cnpj.CNPJ_FIRST_WEIGHTS, digits)) % 11
+    check = 0 if cs < 2 else 11 - cs
+    digits.append(check)
+    cs = sum(w * k for w, k in zip(cnpj.CNPJ_SECOND_WEIGHTS, digits)) % 11
+    return (check, 0 if cs < 2 else 11 - cs)
+
+
+def legacy_pis_pasep_validation_digit(value: str) -> int:
+    value = NONDIGIT_REGEX.sub("", value)
+    result = sum(w * k for w, k in zip(pis_pasep.PIS_PASEP_WEIGHTS, [int(k) for k in value[:10]])) % 11
+    return 0 if result < 2 else 11 - result
+
+
+def legacy_cno_verification_digit(value: str) -> int:
+    value = NONDIGIT_REGEX.sub("", value)
+    digsum = sum(w * k for w, k in zip(cno.CNO_WEIGHTS, [int(k) for k in value[:11]]))
+    mod = sum(divmod(digsum % 100, 10)) % 10
+    return 0 if mod == 0 else 10 - mod
+
+
+CASES = (
+    ("cpf.verification_digits", legacy_cpf_verification_digits, cpf.verification_digits, cpf.random),
+    ("cnpj.verification_digits", legacy_cnpj_verification_digits, cnpj.verification_digits, cnpj.random),
+    ("pis_pasep.validation_digit", legacy_pis_pasep_validation_digit, pis_pasep.validation_digit, pis_pasep.random),
+    ("cno.verification_digit", legacy_cno_verification_digit, cno.verification_digit, cno.random),
+)
+
+
+def main() -> None:
+    repeat = 20
+
+    for name, legacy, current, random in CASES:
+        samples = [random(formatted=False) for _ in range(1000)]
+        assert [legacy(sample) for sample in samples] == [current(sample) for sample in samples]
+        results = {}
+        print(name)
+
+        for label, function in (("legacy", legacy), ("current", current)):
+            best = min(
+                timeit.repeat(lambda: [function(sample) for sample in samples], number=1, repeat=repeat)
+            )
+            results[label] = best
+            print(f"{label:>10}: {len(samples) / best:12,.0f} calls/sec")
+
+        print(f"{'speedup':>10}: {results['legacy'] / results['current']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Compare the single-pass ``cnpj.parse`` against the previous implementation.
+
+The previous implementation removed non-digit characters, padded and validated
+the CNPJ, then padded it again to format it, which normalized the same string
+about three times. It's copied here from the original module, with its
+validation and formatting functions.
+
+Run it with ``python benchmarks/cnpj_parse.py`` from the project root.
+"""
+
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from brazilian_ids.functions.company import cnpj  # noqa: E402
+from brazilian_ids.functions.util import NONDIGIT_REGEX  # noqa: E402
+
+# The code below is a copy of the original implementation, so the comparison
+# doesn't change when the module is optimized further.
+
+CNPJ_FIRST_WEIGHTS = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+CNPJ_SECOND_WEIGHTS = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+
+
+@dataclass
+class LegacyCNPJ:
+    cnpj: str
+    firm: int
+    establishment: int
+    first_digit: int
+    second_digit: int
+
+
+def legacy_is_valid(value: str, autopad: bool = True) -> bool:
+    value = NONDIGIT_REGEX.sub("", value)
+
+    if len(value) < cnpj.EXPECTED_DIGITS:
+        if not autopad:
+            return False
+        value = legacy_pad(value)
+
+    elif len(value) > cnpj.EXPECTED_DIGITS:
+        return False
+
+    if value == "00000000000000":
+        return False
+
+    digits = [int(k) for k in value[:13]]
+    cs = sum(w * k for w, k in zip(CNPJ_FIRST_WEIGHTS, digits[:-1])) % 11
+    cs = 0 if cs < 2 else 11 - cs
+    if cs != int(value[12]):
+        return False
+    cs = sum(w * d for w, d in zip(CNPJ_SECOND_WEIGHTS, digits)) % 11
+    cs = 0 if cs < 2 else 11 - cs
+    if cs != int(value[13]):
+        return False
+    return True
+
+
+def legacy_format(value: str) -> str:
+    value = legacy_pad(value)
+    fmt = "{0}.{1}.{2}/{3}-{4}"
+    return fmt.format(value[:2], value[2:5], value[5:8], value[8:12], value[12:])
+
+
+def legacy_pad(value: str, validate_after: bool = False) -> str:
+    padded = "%0.014i" % int(value)
+
+    if validate_after:
+        if not legacy_is_valid(padded):
+            raise cnpj.InvalidCnpjError(value)
+
+    return padded
+
+
+def legacy_parse(value: str) -> LegacyCNPJ:
+    """The ``parse`` implementation before the single-pass rework."""
+    value = NONDIGIT_REGEX.sub("", value)
+    value = legacy_pad(value, validate_after=True)
+
+    return LegacyCNPJ(
+        cnpj=legacy_format(value),
+        firm=int(value[:8]),
+        establishment=int(value[8:12]),
+        first_digit=int(value[-2]),
+        second_digit=int(value[-1]),
+    )
+
+
+def main() -> None:
+    samples = [cnpj.random(formatted=(i % 2 == 0)) for i in range(1000)]
+    repeat = 20
+    results = {}
+
+    for name, function in (("legacy", legacy_parse), ("current", cnpj.parse)):
+        best = min(
+            timeit.repeat(lambda: [function(sample) for sample in samples], number=1, repeat=repeat)
+        )
+        results[name] = best
+        print(f"{name:>8}: {len(samples) / best:12,.0f} parses/sec")
+
+    print(f"speedup: {results['legacy'] / results['current']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
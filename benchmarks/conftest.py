@@ -0,0 +1,143 @@
+"""Fixtures for the benchmarks.
+
+The corpora are generated with a fixed seed, so results can be compared
+between runs. Each ID type has the following corpora, all with ``SIZE`` IDs:
+
+- valid: valid IDs, only digits
+- invalid: the same IDs with a wrong verification digit
+- short: valid IDs with leading zeros removed, which require padding
+- punctuated: the valid IDs formatted
+"""
+
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from brazilian_ids.functions.company import cnpj  # noqa: E402
+from brazilian_ids.functions.labor_dispute import nupj  # noqa: E402
+from brazilian_ids.functions.location import cep, municipio  # noqa: E402
+from brazilian_ids.functions.person import cpf, pis_pasep  # noqa: E402
+from brazilian_ids.functions.real_state import cno, sql  # noqa: E402
+
+SIZE = 1000
+SEED = 20240923
+CORPORA = ("valid", "invalid", "short", "punctuated")
+
+
+def _wrong_digit(value: str) -> str:
+    return value[:-1] + str((int(value[-1]) + 1) % 10)
+
+
+def _cpf(rng: random.Random) -> str:
+    stem = str(rng.randint(1, 999999999)).zfill(9)
+    return stem + "".join(str(d) for d in cpf.verification_digits(stem))
+
+
+def _cnpj(rng: random.Random) -> str:
+    return cnpj.from_firm_id(str(rng.randint(1, 99999999)).zfill(8), "0001")
+
+
+def _pis_pasep(rng: random.Random) -> str:
+    stem = str(rng.randint(1, 9999999999)).zfill(10)
+    return stem + str(pis_pasep.validation_digit(stem))
+
+
+def _cno(rng: random.Random) -> str:
+    stem = str(rng.randint(1, 99999999999)).zfill(11)
+    return stem + str(cno.verification_digit(stem))
+
+
+def _sql(rng: random.Random) -> str:
+    stem = str(rng.randint(1, 9999999999)).zfill(10)
+    return stem + sql.verification_digit(stem + "0")
+
+
+def _nupj(rng: random.Random) -> str:
+    segment = rng.choice([4, 5, 6, 8])
+    court = rng.choice(sorted(nupj.COURTS_TRS[segment]))
+    tail = "{0}{1}{2}{3:04d}".format(rng.randint(2008, 2024), segment, court, rng.randint(0, 9999))
+    lawsuit = "{0:07d}".format(rng.randint(1, 9999999))
+    digits = 98 - int(lawsuit + tail + "00") % 97
+    return "{0}{1:02d}{2}".format(lawsuit, digits, tail)
+
+
+def _cep(rng: random.Random) -> str:
+    start, end = rng.choice(list(cep.CepRange().all_ranges()))
+    return "{0:08d}".format(rng.randint(start.sort_key, end.sort_key))
+
+
+def _municipio(rng: random.Random) -> str:
+    return rng.choice(CODES)
+
+
+CODES = [code for code, _ in municipio.MunicipioTable()]
+
+GENERATORS = {
+    "cpf": (_cpf, cpf.format),
+    "cnpj": (_cnpj, cnpj.format),
+    "pis_pasep": (_pis_pasep, pis_pasep.format),
+    "cno": (_cno, cno.format),
+    "sql": (_sql, sql.format),
+    "nupj": (_nupj, lambda v: "{0}-{1}.{2}.{3}.{4}.{5}".format(v[:7], v[7:9], v[9:13], v[13], v[14:16], v[16:])),
+    "cep": (_cep, cep.format),
+    "municipio": (_municipio, lambda v: "{0}.{1}-{2}".format(v[:2], v[2:5], v[5:])),
+}
+
+
+def build_corpora(kind: str) -> dict[str, list[str]]:
+    rng = random.Random(f"{SEED}-{kind}")
+    generate, formatter = GENERATORS[kind]
+    valid = [generate(rng) for _ in range(SIZE)]
+
+    # short ones must have at least one leading zero to remove
+    short = []
+
+    while len(short) < SIZE:
+        candidate = generate(rng)
+
+        if candidate.startswith("0") and candidate.strip("0"):
+            short.append(candidate.lstrip("0"))
+
+        elif kind in ("cep", "municipio"):
+            short.append(candidate[:5])
+
+    return {
+        "valid": valid,
+        "invalid": [_wrong_digit(value) for value in valid],
+        "short": short,
+        "punctuated": [formatter(value) for value in valid],
+    }
+
+
+@pytest.fixture(scope="session")
+def corpora():
+    """Return the corpora of all ID types, indexed by ID type and corpus name."""
+    return {kind: build_corpora(kind) for kind in GENERATORS}
+
+
+@pytest.fixture
+def measure_allocations(benchmark):
+    """Return a function that runs a callable once under ``tracemalloc`` and saves the results in the benchmark."""
+
+    def measure(function, calls: int = 1) -> None:
+        tracemalloc.start()
+
+        try:
+            before = tracemalloc.take_snapshot()
+            function()
+            after = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+        benchmark.extra_info["calls"] = calls
+        benchmark.extra_info["peak_bytes_per_call"] = round(peak / calls, 1)
+        benchmark.extra_info["retained_blocks"] = blocks
+
+    return measure
@@ -0,0 +1,115 @@
+"""Load test of ``brazilian_ids.server``.
+
+Starts the server in a separate process, once for each batch window, and
+sends single CPF validation requests from a number of concurrent keep-alive
+connections for a few seconds, reporting the requests per second, the
+latency percentiles and the average size of the batches.
+
+Run it with ``python benchmarks/server.py [--connections N] [--seconds N]
+[--windows MS ...] [--workers N]`` from the project root.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from brazilian_ids.functions.person import cpf  # noqa: E402
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for(port: int) -> None:
+    for _ in range(100):
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.05)
+        else:
+            writer.close()
+            return
+
+    raise RuntimeError("the server didn't start")
+
+
+async def call(reader, writer, method: str, path: str, body: bytes = b"") -> dict:
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = int(head.lower().split(b"content-length: ")[1].split(b"\r\n")[0])
+    return json.loads(await reader.readexactly(length))
+
+
+async def client(port: int, deadline: float, bodies: list[bytes], latencies: list[float]) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    i = 0
+
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        await call(reader, writer, "POST", "/validate/cpf", bodies[i % len(bodies)])
+        latencies.append(time.perf_counter() - started)
+        i += 1
+
+    writer.close()
+
+
+async def load(port: int, connections: int, seconds: float) -> tuple[list[float], dict]:
+    await wait_for(port)
+    bodies = [json.dumps({"value": cpf.random()}).encode() for _ in range(1000)]
+    latencies: list[float] = []
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(*(client(port, deadline, bodies, latencies) for _ in range(connections)))
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    stats = await call(reader, writer, "GET", "/stats")
+    writer.close()
+    return (latencies, stats)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 1, 5], metavar="MS")
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    print(f"{args.connections} connections, {args.seconds:g}s each")
+
+    for window in args.windows:
+        port = free_port()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "brazilian_ids.server", "--port", str(port), "--window", str(window)]
+            + ["--workers", str(args.workers)],
+            env=env,
+            stderr=subprocess.DEVNULL,
+        )
+
+        try:
+            latencies, stats = asyncio.run(load(port, args.connections, args.seconds))
+        finally:
+            server.terminate()
+            server.wait()
+
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        print(
+            f"window {window:g}ms: {len(latencies) / args.seconds:10,.0f} requests/sec,"
+            f" p50 {p50:.2f}ms, p99 {p99:.2f}ms, {stats['values'] / max(stats['batches'], 1):.1f} values per batch"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compare ``sqlite.validate_table`` against validating a table row by row.
+
+Each approach fills a ``cpf_valid`` column in a copy of the same table, stored
+in a temporary file:
+
+- row by row, committing each update, as a naive loop would do;
+- row by row, in a single transaction;
+- ``validate_table``, with ``fetchmany``, ``validate_many`` and
+  ``executemany`` per batch;
+- a single ``UPDATE`` statement calling the ``cpf_is_valid`` function.
+
+NumPy, which ``validate_table`` uses when available, is imported before the
+timings, so its import time isn't counted.
+
+Run it with ``python benchmarks/sqlite.py [rows]`` from the project root.
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from brazilian_ids import sqlite  # noqa: E402
+from brazilian_ids.functions.person import cpf  # noqa: E402
+from brazilian_ids.functions.util import numpy  # noqa: E402
+from brazilian_ids.kinds import check  # noqa: E402
+
+
+def create(path: Path, rows: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE customer (id INTEGER PRIMARY KEY, cpf TEXT, cpf_valid INTEGER)")
+
+    with conn:
+        conn.executemany(
+            "INSERT INTO customer (cpf) VALUES (?)",
+            ((cpf.random() if i % 4 else cpf.random()[:-1] + "0",) for i in range(rows)),
+        )
+
+    return conn
+
+
+def row_by_row(conn: sqlite3.Connection, commit_each: bool) -> None:
+    for rowid, value in conn.execute("SELECT rowid, cpf FROM customer").fetchall():
+        conn.execute("UPDATE customer SET cpf_valid = ? WHERE rowid = ?", (int(check(cpf, value)), rowid))
+
+        if commit_each:
+            conn.commit()
+
+    conn.commit()
+
+
+def single_update(conn: sqlite3.Connection) -> None:
+    sqlite.register(conn, ["cpf"])
+
+    with conn:
+        conn.execute("UPDATE customer SET cpf_valid = cpf_is_valid(cpf)")
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    approaches = {
+        "row by row, commit per row": lambda conn: row_by_row(conn, commit_each=True),
+        "row by row, one transaction": lambda conn: row_by_row(conn, commit_each=False),
+        "validate_table": lambda conn: sqlite.validate_table(conn, "customer", "cpf", "cpf"),
+        "UPDATE with cpf_is_valid": single_update,
+    }
+
+    try:
+        numpy()
+    except ImportError:
+        print("NumPy isn't available, validate_table checks one row at a time")
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{rows} rows")
+
+        for i, (name, approach) in enumerate(approaches.items()):
+            conn = create(Path(directory) / f"{i}.db", rows)
+            started = time.perf_counter()
+            approach(conn)
+            elapsed = time.perf_counter() - started
+            conn.close()
+            print(f"{name:30} {elapsed:8.3f}s {rows / elapsed:12,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
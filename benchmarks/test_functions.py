@@ -0,0 +1,74 @@
+"""Benchmarks of the functions of every ID module.
+
+Each benchmark calls a function once for every ID of a corpus (see
+``conftest.py``), so the operations per second reported by ``pytest-benchmark``
+must be multiplied by ``conftest.SIZE`` to get the calls per second. The peak
+memory allocated per call is saved in the ``extra_info`` of each benchmark.
+
+Run them with ``make benchmark``.
+"""
+
+import pytest
+
+from brazilian_ids.functions.company import cnpj
+from brazilian_ids.functions.labor_dispute import nupj
+from brazilian_ids.functions.location import cep, municipio
+from brazilian_ids.functions.person import cpf, pis_pasep
+from brazilian_ids.functions.real_state import cno, sql
+from conftest import CORPORA, SIZE
+
+FUNCTIONS = {
+    "cpf": (cpf.is_valid, cpf.format, cpf.pad, cpf.verification_digits),
+    "cnpj": (cnpj.is_valid, cnpj.format, cnpj.pad, cnpj.parse, cnpj.verification_digits),
+    "pis_pasep": (pis_pasep.is_valid, pis_pasep.format, pis_pasep.pad, pis_pasep.validation_digit),
+    "cno": (cno.is_valid, cno.format, cno.pad, cno.verification_digit),
+    "sql": (sql.is_valid, sql.format, sql.pad, sql.verification_digit),
+    "nupj": (nupj.is_valid, nupj.pad, nupj.parse),
+    "cep": (cep.is_valid, cep.is_valid_extended, cep.format, cep.parse, cep.parse_compact, cep.state_of),
+    "municipio": (municipio.is_valid, municipio.parse, municipio.is_registered, municipio.verification_digit),
+}
+
+RANDOM = {
+    "cpf": cpf.random,
+    "cnpj": cnpj.random,
+    "pis_pasep": pis_pasep.random,
+    "cno": cno.random,
+}
+
+CASES = [
+    pytest.param(kind, function, corpus, id=f"{kind}.{function.__name__}-{corpus}")
+    for kind, functions in FUNCTIONS.items()
+    for function in functions
+    for corpus in CORPORA
+]
+
+
+def call_all(function, values):
+    # invalid IDs make some functions raise, which is part of their cost
+    for value in values:
+        try:
+            function(value)
+        except ValueError:
+            pass
+
+
+@pytest.mark.parametrize("kind,function,corpus", CASES)
+def test_function(benchmark, measure_allocations, corpora, kind, function, corpus):
+    values = corpora[kind][corpus]
+    benchmark.group = f"{kind}.{function.__name__}"
+    measure_allocations(lambda: call_all(function, values), calls=len(values))
+    benchmark(call_all, function, values)
+
+
+@pytest.mark.parametrize("kind", RANDOM)
+@pytest.mark.parametrize("formatted", (False, True))
+def test_random(benchmark, measure_allocations, kind, formatted):
+    function = RANDOM[kind]
+    benchmark.group = f"{kind}.random"
+
+    def generate():
+        for _ in range(SIZE):
+            function(formatted=formatted)
+
+    measure_allocations(generate, calls=SIZE)
+    benchmark(generate)
@@ -0,0 +1,76 @@
+"""Functions and classes to validate several Brazilian IDs.
+
+The modules of each ID are available directly from this package, for example
+``brazilian_ids.cpf`` is the same module as
+``brazilian_ids.functions.person.cpf``:
+
+>>> import brazilian_ids
+>>> brazilian_ids.cpf.is_valid("529.982.247-25")
+True
+
+Nothing is imported together with this package: each module is imported only
+when it is used for the first time, so programs that need a single ID type
+(and that start frequently, like command line tools or serverless functions)
+don't pay for the others.
+"""
+
+from importlib import import_module
+
+# importing typing just for this would slow down the import of the package
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from brazilian_ids import columnar, kinds, parallel, pipeline, server, sqlite  # noqa: F401
+    from brazilian_ids.functions.company import cnpj  # noqa: F401
+    from brazilian_ids.functions.detection import detect, detect_many  # noqa: F401
+    from brazilian_ids.functions.extraction import extract  # noqa: F401
+    from brazilian_ids.functions.labor_dispute import nupj  # noqa: F401
+    from brazilian_ids.functions.location import cep, municipio  # noqa: F401
+    from brazilian_ids.functions.person import cpf, pis_pasep  # noqa: F401
+    from brazilian_ids.functions.real_state import cno, sql  # noqa: F401
+    from brazilian_ids.functions.validation import Reason  # noqa: F401
+    from brazilian_ids.idset import IdSet  # noqa: F401
+
+_MODULES = {
+    "cep": "brazilian_ids.functions.location.cep",
+    "cnpj": "brazilian_ids.functions.company.cnpj",
+    "cno": "brazilian_ids.functions.real_state.cno",
+    "cpf": "brazilian_ids.functions.person.cpf",
+    "municipio": "brazilian_ids.functions.location.municipio",
+    "nupj": "brazilian_ids.functions.labor_dispute.nupj",
+    "pis_pasep": "brazilian_ids.functions.person.pis_pasep",
+    "sql": "brazilian_ids.functions.real_state.sql",
+    "columnar": "brazilian_ids.columnar",
+    "kinds": "brazilian_ids.kinds",
+    "parallel": "brazilian_ids.parallel",
+    "pipeline": "brazilian_ids.pipeline",
+    "server": "brazilian_ids.server",
+    "sqlite": "brazilian_ids.sqlite",
+}
+
+_ATTRIBUTES = {
+    "detect": "brazilian_ids.functions.detection",
+    "detect_many": "brazilian_ids.functions.detection",
+    "extract": "brazilian_ids.functions.extraction",
+    "Reason": "brazilian_ids.functions.validation",
+    "IdSet": "brazilian_ids.idset",
+}
+
+__all__ = sorted([*_MODULES, *_ATTRIBUTES])
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        value = import_module(_MODULES[name])
+    elif name in _ATTRIBUTES:
+        value = getattr(import_module(_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # next accesses don't go through this function anymore
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
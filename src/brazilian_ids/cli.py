@@ -0,0 +1,110 @@
+"""Command line interface, installed as the ``brazilian-ids`` program.
+
+Example::
+
+    brazilian-ids validate --column document:cpf --column company:cnpj --format-ids customers.csv > validated.csv
+
+See ``brazilian-ids --help`` for all the options.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from brazilian_ids import pipeline
+
+
+def _column(spec: str) -> tuple[str, str]:
+    name, sep, kind = spec.rpartition(":")
+
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"'{spec}' must be in the format COLUMN:TYPE")
+
+    if kind not in pipeline.KINDS:
+        raise argparse.ArgumentTypeError(f"'{kind}' is not one of {', '.join(pipeline.KINDS)}")
+
+    return (name, kind)
+
+
+def _guess_format(path: str | None) -> str | None:
+    if path is None or path == "-":
+        return None
+
+    suffix = Path(path).suffix.lstrip(".").lower()
+
+    if suffix in ("json", "jsonl", "ndjson"):
+        return "jsonl"
+
+    if suffix == "csv":
+        return "csv"
+
+    return None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="brazilian-ids", description="Validate Brazilian IDs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser(
+        "validate",
+        help="validate columns of a CSV or JSONL file",
+        description="Validate columns of a CSV or JSONL file, writing the rows with the results.",
+    )
+    validate.add_argument("input", nargs="?", default="-", help="input file, or - for stdin (default)")
+    validate.add_argument("-o", "--output", default="-", help="output file, or - for stdout (default)")
+    validate.add_argument(
+        "-c",
+        "--column",
+        dest="columns",
+        action="append",
+        type=_column,
+        required=True,
+        metavar="COLUMN:TYPE",
+        help=f"column to validate and its ID type, one of: {', '.join(pipeline.KINDS)}. Can be repeated",
+    )
+    validate.add_argument("--input-format", choices=pipeline.FORMATS, help="default is guessed from the file name, or csv")
+    validate.add_argument("--output-format", choices=pipeline.FORMATS, help="default is the input format")
+    validate.add_argument("-f", "--format-ids", action="store_true", help="also add the formatted IDs")
+    validate.add_argument("-q", "--quiet", action="store_true", help="don't print the counters at the end")
+    return parser
+
+
+def validate(args: argparse.Namespace) -> int:
+    input_format = args.input_format or _guess_format(args.input) or "csv"
+    output_format = args.output_format or _guess_format(args.output) or input_format
+    input_stream = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+
+    try:
+        stats = pipeline.run(
+            input_stream,
+            output_stream,
+            columns=dict(args.columns),
+            input_format=input_format,
+            output_format=output_format,
+            apply_format=args.format_ids,
+        )
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+    if not args.quiet:
+        print(stats.report(), file=sys.stderr)
+
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "validate":
+        return validate(args)
+
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""Validation and formatting of whole columns of pandas or pyarrow.
+
+``df["cpf"].apply(cpf.is_valid)`` calls ``is_valid`` once per row. The
+functions of this module process the whole column at once instead: the
+non-digit characters are removed, the length of the IDs is checked and they
+are converted to integers by pyarrow compute kernels, and the verification
+digits are checked by the ``validate_many`` function of the ID module, on the
+resulting NumPy array.
+
+The supported ID types are those in ``KINDS``. The columns can be a pandas
+``Series`` or a pyarrow ``Array`` (or ``ChunkedArray``) of strings or
+integers, and the results have the same type: a ``Series`` with the same index
+and name, or a pyarrow ``Array``.
+
+The results match the ID modules:
+
+- ``is_valid`` is ``True`` for the IDs that ``validate`` (and ``is_valid``)
+  consider valid, and ``False`` for the others, including nulls and values
+  for which ``is_valid`` raises an exception, like empty strings;
+- ``format`` returns the same string as the ``format`` function of the module
+  for the valid IDs, and null for the invalid ones.
+
+Requires NumPy and pyarrow, install them with the ``columnar`` extra.
+"""
+
+from itertools import groupby
+from types import ModuleType
+
+from brazilian_ids.functions.company import cnpj
+from brazilian_ids.functions.person import cpf, pis_pasep
+from brazilian_ids.functions.real_state import cno, sql
+from brazilian_ids.functions.validation import Reason
+
+KINDS: dict[str, ModuleType] = {
+    "cpf": cpf,
+    "cnpj": cnpj,
+    "pis_pasep": pis_pasep,
+    "cno": cno,
+    "sql": sql,
+}
+"""The supported ID types and the module that handles each of them."""
+
+__PADDED = frozenset(("cpf", "cnpj", "pis_pasep", "cno"))
+
+
+def __pyarrow():
+    """Import and return the pyarrow module and its compute functions."""
+    try:
+        import pyarrow  # type: ignore[import-untyped]
+        import pyarrow.compute  # type: ignore[import-untyped]
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for columnar validation, install it with 'pip install brazilian_ids[columnar]'"
+        ) from e
+
+    return (pyarrow, pyarrow.compute)
+
+
+def __module(kind: str) -> ModuleType:
+    try:
+        return KINDS[kind]
+    except KeyError:
+        raise ValueError(f"The ID type '{kind}' is not supported, use one of {', '.join(KINDS)}") from None
+
+
+def __to_arrow(values):
+    """Convert a column to a pyarrow array of strings, returning also the pandas Series it came from, if any."""
+    pa, pc = __pyarrow()
+    series = None
+
+    if not isinstance(values, (pa.Array, pa.ChunkedArray)):
+        series = values
+        values = pa.array(values, from_pandas=True)
+
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+
+    if not pa.types.is_string(values.type):
+        values = pc.cast(values, pa.string())
+
+    return (values, series)
+
+
+def __from_arrow(result, series):
+    """Convert a result back to the type of the original column."""
+    if series is None:
+        return result
+
+    converted = result.to_pandas()
+    converted.index = series.index
+    converted.name = series.name
+    return converted
+
+
+def __digits(values):
+    """Remove the non-digit characters of a pyarrow array of strings.
+
+    The regular expression kernel is slow, so it's used only for the values
+    that still have other characters after removing the usual separators.
+    """
+    pa, pc = __pyarrow()
+    dirty = pc.invert(pc.fill_null(pc.ascii_is_decimal(values), True))
+
+    if not pc.any(dirty).as_py():
+        return values
+
+    cleaned = pc.filter(values, dirty)
+
+    for separator in (".", "-", "/", " "):
+        cleaned = pc.replace_substring(cleaned, pattern=separator, replacement="")
+
+    still = pc.invert(pc.ascii_is_decimal(cleaned))
+
+    if pc.any(still).as_py():
+        others = pc.replace_substring_regex(pc.filter(cleaned, still), pattern="[^0-9]", replacement="")
+        cleaned = pc.replace_with_mask(cleaned, still, others)
+
+    return pc.replace_with_mask(values, dirty, cleaned)
+
+
+def __check(values, kind: str, autopad: bool):
+    """Return the cleaned digits of a pyarrow array of strings, and a NumPy mask of the valid IDs among them."""
+    pa, pc = __pyarrow()
+    module = __module(kind)
+    width = module.EXPECTED_DIGITS
+
+    digits = __digits(values)
+    lengths = pc.fill_null(pc.utf8_length(digits), 0)
+    ok = pc.and_(pc.greater(lengths, 0), pc.less_equal(lengths, width))
+
+    if not (autopad and kind in __PADDED):
+        ok = pc.and_(ok, pc.equal(lengths, width))
+
+    # the IDs with a bad length become zeros, which are never valid
+    ok = ok.to_numpy(zero_copy_only=False)
+    integers = pc.cast(pc.if_else(pa.array(ok), digits, "0"), pa.uint64()).to_numpy(zero_copy_only=False)
+    valid = ok & (module.validate_many(integers) == Reason.VALID)
+    return (digits, valid)
+
+
+def is_valid(values, kind: str, autopad: bool = True):
+    """Check which IDs of a column are valid.
+
+    ``autopad`` has the same meaning of the ``is_valid`` functions of the
+    modules, and it's ignored for SQL, which is never padded.
+    """
+    pa, _ = __pyarrow()
+    values, series = __to_arrow(values)
+    _, valid = __check(values, kind, autopad)
+    return __from_arrow(pa.array(valid, type=pa.bool_()), series)
+
+
+def format(values, kind: str, autopad: bool = True):
+    """Format the valid IDs of a column, with nulls in place of the invalid ones."""
+    pa, pc = __pyarrow()
+    module = __module(kind)
+    values, series = __to_arrow(values)
+    digits, valid = __check(values, kind, autopad)
+    padded = pc.utf8_lpad(digits, width=module.EXPECTED_DIGITS, padding="0")
+
+    # the template is split in slices of digits and the separators between them
+    pieces = []
+    position = 0
+
+    for is_digit, chars in groupby(module.FORMAT_TEMPLATE, key=lambda char: char == "#"):
+        piece = "".join(chars)
+
+        if is_digit:
+            pieces.append(pc.utf8_slice_codeunits(padded, position, position + len(piece)))
+            position += len(piece)
+        else:
+            pieces.append(piece)
+
+    formatted = pc.binary_join_element_wise(*pieces, "")
+    return __from_arrow(pc.if_else(pa.array(valid), formatted, pa.scalar(None, pa.string())), series)
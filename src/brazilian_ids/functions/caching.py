@@ -0,0 +1,185 @@
+"""Optional caches for the results of ``parse`` and ``format`` functions.
+
+Streams of events usually repeat the same IDs over and over. The modules that
+support it have a ``caches`` attribute, a ``Caches`` instance, which is
+disabled by default and can be enabled per module:
+
+>>> from brazilian_ids.functions.company import cnpj
+>>> cnpj.caches.enable(maxsize=100_000)
+>>> cnpj.parse("11.222.333/0001-81") is cnpj.parse("11222333000181")
+True
+>>> cnpj.caches.stats()["parse"]
+CacheStats(hits=1, misses=1, evictions=0, size=1, maxsize=100000)
+
+The results are kept by the normalized digits of the IDs, so formatted and
+unformatted IDs share the same entry. Only successful results are cached:
+invalid IDs raise the same exceptions every time. The parsed objects are
+immutable, so the same instance can be safely returned to every caller.
+
+The least recently used entries are evicted once a cache is full. The caches
+can be used by multiple threads, but then their counters are approximate.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+
+DEFAULT_MAXSIZE = 65536
+
+MISSING = object()
+"""Returned by ``LRUCache.get`` for keys that aren't cached."""
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Counters of a cache, as returned by ``LRUCache.stats``."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of the lookups that found the key, or zero if there weren't any."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache:
+    """Mapping with at most ``maxsize`` entries, evicting the least recently used ones."""
+
+    __slots__ = ("__data", "__maxsize", "__hits", "__misses", "__evictions")
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.__data: OrderedDict = OrderedDict()
+        self.__maxsize = maxsize
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def get(self, key: Hashable):
+        """Return the value of a key, marking it as the most recently used, or ``MISSING``."""
+        try:
+            value = self.__data[key]
+            self.__data.move_to_end(key)
+        except KeyError:
+            # also when another thread evicted the key right after it was found
+            self.__misses += 1
+            return MISSING
+
+        self.__hits += 1
+        return value
+
+    def put(self, key: Hashable, value) -> None:
+        """Add (or replace) the value of a key, evicting the least recently used one if the cache is full."""
+        data = self.__data
+        data[key] = value
+        data.move_to_end(key)
+
+        while len(data) > self.__maxsize:
+            try:
+                data.popitem(last=False)
+            except KeyError:
+                break
+
+            self.__evictions += 1
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the counters."""
+        self.__data.clear()
+        self.__hits = self.__misses = self.__evictions = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.__hits, self.__misses, self.__evictions, len(self.__data), self.__maxsize)
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__data
+
+    def __repr__(self):
+        return "{0}(maxsize={1}, size={2})".format(self.__class__.__name__, self.__maxsize, len(self))
+
+
+class Caches:
+    """The caches of the functions of an ID module.
+
+    The ``parse`` and ``format`` attributes hold the ``LRUCache`` of those
+    functions, or ``None`` while their caches are disabled. Only the
+    ``functions`` given when creating the instance can be enabled, the
+    attributes of the others are always ``None``.
+    """
+
+    FUNCTIONS = ("parse", "format")
+    """The functions that can have a cache."""
+
+    __slots__ = ("parse", "format", "__functions")
+
+    def __init__(self, *functions: str) -> None:
+        unknown = set(functions) - set(self.FUNCTIONS)
+
+        if unknown:
+            raise ValueError(f"Can't cache {', '.join(sorted(unknown))}, use some of {', '.join(self.FUNCTIONS)}")
+
+        self.parse: LRUCache | None = None
+        self.format: LRUCache | None = None
+        self.__functions = functions
+
+    @property
+    def functions(self) -> tuple[str, ...]:
+        """Return the names of the functions that can be cached."""
+        return self.__functions
+
+    def __selected(self, functions: Iterable[str] | None) -> tuple[str, ...]:
+        if functions is None:
+            return self.__functions
+
+        functions = tuple(functions)
+        unknown = set(functions) - set(self.__functions)
+
+        if unknown:
+            raise ValueError(f"Can't cache {', '.join(sorted(unknown))}, use one of {', '.join(self.__functions)}")
+
+        return functions
+
+    def enable(self, maxsize: int = DEFAULT_MAXSIZE, functions: Iterable[str] | None = None) -> None:
+        """Enable the caches of ``functions`` (by default, all of them), each one with up to ``maxsize`` entries.
+
+        An enabled cache is replaced by an empty one."""
+        for function in self.__selected(functions):
+            setattr(self, function, LRUCache(maxsize))
+
+    def disable(self, functions: Iterable[str] | None = None) -> None:
+        """Disable the caches of ``functions`` (by default, all of them), releasing their entries."""
+        for function in self.__selected(functions):
+            setattr(self, function, None)
+
+    def clear(self) -> None:
+        """Remove the entries and reset the counters of the enabled caches."""
+        for function in self.__functions:
+            cache = getattr(self, function)
+
+            if cache is not None:
+                cache.clear()
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Return the counters of the enabled caches, by function name."""
+        return {
+            function: cache.stats()
+            for function in self.__functions
+            if (cache := getattr(self, function)) is not None
+        }
+
+    def __repr__(self):
+        enabled = [function for function in self.__functions if getattr(self, function) is not None]
+        return "{0}(functions={1}, enabled={2})".format(self.__class__.__name__, list(self.__functions), enabled)
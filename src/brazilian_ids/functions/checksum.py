@@ -0,0 +1,43 @@
+"""Table driven weighted sums of digits, used to calculate verification digits.
+
+For internal use only.
+"""
+
+from collections.abc import Sequence
+
+DIGIT_VALUES: dict[str | int, int] = {**{str(i): i for i in range(10)}, **{i: i for i in range(10)}}
+"""The integer value of a digit, given either as a ``str`` or an ``int``."""
+
+
+class WeightedSum:
+    """Weighted sum of the digits of an ID, with the products precomputed.
+
+    For each position, there is a table with the product of its weight by every
+    possible digit, indexed by the digit both as ``str`` and as ``int``. The
+    sum of the digits of a string (or of a list of integers) is then just a
+    sequence of lookups executed by ``map`` and ``sum``, without converting
+    each digit with ``int`` or multiplying it.
+
+    Like ``zip``, only the first ``len(weights)`` digits are used.
+    """
+
+    __slots__ = ("__weights", "__tables")
+
+    def __init__(self, weights: Sequence[int]) -> None:
+        self.__weights = tuple(weights)
+        self.__tables = tuple({digit: w * value for digit, value in DIGIT_VALUES.items()} for w in self.__weights)
+
+    @property
+    def weights(self) -> tuple[int, ...]:
+        return self.__weights
+
+    def __call__(self, digits: str | Sequence[int]) -> int:
+        return sum(map(dict.__getitem__, self.__tables, digits))
+
+    def __repr__(self):
+        return "{0}(weights={1})".format(self.__class__.__name__, list(self.__weights))
+
+
+def all_zeros(digits: str | Sequence[int]) -> bool:
+    """Check whether all the digits, as ``str`` or ``int``, are zeros."""
+    return not any(map(DIGIT_VALUES.__getitem__, digits))
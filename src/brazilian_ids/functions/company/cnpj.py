@@ -8,8 +8,12 @@ for more details.
 
 from random import randint, choice
 from dataclasses import dataclass
-from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.caching import MISSING, Caches
+from brazilian_ids.functions.checksum import DIGIT_VALUES, WeightedSum, all_zeros
+from brazilian_ids.functions.util import NONDIGIT_REGEX, bytes_digits, digits_matrix, digits_matrix_lengths, numpy
 from brazilian_ids.functions.exceptions import InvalidIdError, InvalidIdLengthError
+from brazilian_ids.functions.generation import DEFAULT_CHUNKSIZE, _digits, _generate
+from brazilian_ids.functions.validation import Reason, _codes, _length_checks, _length_reason
 
 
 class InvalidCnpjTypeMixin:
@@ -26,6 +30,7 @@ class InvalidCnpjError(InvalidCnpjTypeMixin, InvalidIdError):
 
 EXPECTED_DIGITS = 14
 EXPECTED_DIGITS_WITHOUT_VERIFICATION = 12
+FORMAT_TEMPLATE = "##.###.###/####-##"
 
 
 class InvalidCnpjLengthError(InvalidCnpjTypeMixin, InvalidIdLengthError):
@@ -35,7 +40,7 @@ class InvalidCnpjLengthError(InvalidCnpjTypeMixin, InvalidIdLengthError):
         super().__init__(id=cnpj, expected_digits=expected_digits)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CNPJ:
     """Representation of a CNPJ.
 
@@ -47,7 +52,7 @@ class CNPJ:
     - first_digit: the first verification digit
     - second_digit: the second verification digit
 
-    Should be obtained from the ``parse`` function."""
+    Should be obtained from the ``parse`` function. Instances are immutable."""
 
     cnpj: str
     firm: int
@@ -61,6 +66,54 @@ class CNPJ:
 
 CNPJ_FIRST_WEIGHTS = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
 CNPJ_SECOND_WEIGHTS = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+__FIRST_SUM = WeightedSum(CNPJ_FIRST_WEIGHTS)
+__SECOND_SUM = WeightedSum(CNPJ_SECOND_WEIGHTS)
+
+
+caches = Caches("parse", "format")
+"""Optional caches of ``parse`` and ``format``, disabled by default. See
+``brazilian_ids.functions.caching``."""
+
+
+def _is_valid_digits(cnpj: str) -> bool:
+    """Check whether an already clean and padded CNPJ is valid.
+
+    Expects a string with exactly ``EXPECTED_DIGITS`` digits."""
+    return __reason(cnpj) is Reason.VALID
+
+
+def __is_valid_sequence(digits: str | list[int]) -> bool:
+    """Check whether the 14 digits of a CNPJ, as a string or integers, are valid."""
+    return __reason(digits) is Reason.VALID
+
+
+def __check_digit(total: int) -> int:
+    """Calculate a check digit from the weighted sum of the previous digits."""
+    cs = total % 11
+    return 0 if cs < 2 else 11 - cs
+
+
+def __reason(digits: str | list[int]) -> Reason:
+    """Check the 14 digits of a CNPJ, as a string or integers, returning why they are invalid."""
+    # validate the first check digit
+    total = __FIRST_SUM(digits)
+
+    # 0 is invalid; smallest valid CNPJ is 191
+    if total == 0 and all_zeros(digits):
+        return Reason.ALL_ZEROS
+
+    if __check_digit(total) != DIGIT_VALUES[digits[12]]:
+        return Reason.FIRST_DIGIT
+    # validate the second check digit
+    if __check_digit(__SECOND_SUM(digits)) != DIGIT_VALUES[digits[13]]:
+        return Reason.SECOND_DIGIT
+    # both check digits are correct
+    return Reason.VALID
+
+
+def _format_digits(cnpj: str) -> str:
+    """Format an already clean and padded CNPJ."""
+    return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
 
 
 def is_valid(cnpj: str, autopad: bool = True) -> bool:
@@ -75,42 +128,137 @@ def is_valid(cnpj: str, autopad: bool = True) -> bool:
     elif len(cnpj) > EXPECTED_DIGITS:
         return False
 
-    # 0 is invalid; smallest valid CNPJ is 191
-    if cnpj == "00000000000000":
+    return _is_valid_digits(cnpj)
+
+
+def validate(cnpj: str, autopad: bool = True) -> Reason:
+    """Check whether CNPJ is valid, returning why it isn't.
+
+    Returns ``Reason.VALID`` (zero) for the same CNPJs accepted by
+    ``is_valid``, or the reason of the first check that failed.
+    """
+    cnpj = NONDIGIT_REGEX.sub("", cnpj)
+    reason = _length_reason(len(cnpj), EXPECTED_DIGITS, autopad)
+
+    if reason is not Reason.VALID:
+        return reason
+
+    return __reason(cnpj.zfill(EXPECTED_DIGITS))
+
+
+def is_valid_bytes(cnpj: bytes | bytearray | memoryview, autopad: bool = True) -> bool:
+    """Check whether a CNPJ given as bytes is valid. Optionally pad if is too
+    short.
+
+    Works directly on ``bytes``, ``bytearray`` or ``memoryview`` slices (for
+    example, from a memory mapped file) without decoding them to ``str``.
+    """
+    digits = bytes_digits(cnpj)
+
+    if len(digits) < EXPECTED_DIGITS:
+        if not autopad or not digits:
+            return False
+        digits = [0] * (EXPECTED_DIGITS - len(digits)) + digits
+
+    elif len(digits) > EXPECTED_DIGITS:
         return False
 
-    digits = [int(k) for k in cnpj[:13]]  # identifier digits
-    # validate the first check digit
-    cs = sum(w * k for w, k in zip(CNPJ_FIRST_WEIGHTS, digits[:-1])) % 11
-    cs = 0 if cs < 2 else 11 - cs
-    if cs != int(cnpj[12]):
-        return False  # first check digit is not correct
-    # validate the second check digit
-    cs = sum(w * d for w, d in zip(CNPJ_SECOND_WEIGHTS, digits)) % 11
-    cs = 0 if cs < 2 else 11 - cs
-    if cs != int(cnpj[13]):
-        return False  # second check digit is not correct
-    # both check digits are correct
-    return True
+    return __is_valid_sequence(digits)
 
 
 def verification_digits(cnpj: str) -> tuple[int, int]:
-    """Find two check digits needed to make a CNPJ valid."""
+    """Find two check digits needed to make a CNPJ valid.
+
+    Only the first 12 digits are used, any check digits already in ``cnpj``
+    are ignored."""
     cnpj = NONDIGIT_REGEX.sub("", cnpj)
 
     if len(cnpj) < EXPECTED_DIGITS_WITHOUT_VERIFICATION:
         raise InvalidCnpjLengthError(cnpj=cnpj)
 
-    digits = [int(k) for k in cnpj[:13]]
     # find the first check digit
-    cs = sum(w * d for w, d in zip(CNPJ_FIRST_WEIGHTS, digits)) % 11
-    check = 0 if cs < 2 else 11 - cs
+    check = __check_digit(__FIRST_SUM(cnpj))
     # find the second check digit
-    digits.append(check)
-    cs = sum(w * k for w, k in zip(CNPJ_SECOND_WEIGHTS, digits)) % 11
-    if cs < 2:
-        return (check, 0)
-    return (check, 11 - cs)
+    return (check, __check_digit(__SECOND_SUM(cnpj[:EXPECTED_DIGITS_WITHOUT_VERIFICATION] + str(check))))
+
+
+def __verification_digits_matrix(digits):
+    """Compute both check digits for every row of a matrix of CNPJ digits.
+
+    Only the first 12 columns are used."""
+    np = numpy()
+    first_weights = np.array(CNPJ_FIRST_WEIGHTS, dtype=np.int64)
+    second_weights = np.array(CNPJ_SECOND_WEIGHTS, dtype=np.int64)
+    stems = digits[:, :EXPECTED_DIGITS_WITHOUT_VERIFICATION]
+
+    cs = (stems @ first_weights) % 11
+    first = np.where(cs < 2, 0, 11 - cs)
+    cs = (stems @ second_weights[:-1] + first * second_weights[-1]) % 11
+    second = np.where(cs < 2, 0, 11 - cs)
+    return (first, second)
+
+
+def is_valid_many(cnpjs, autopad: bool = True):
+    """Check whether each CNPJ in a batch is valid. Optionally pad the ones that
+    are too short.
+
+    ``cnpjs`` can be any iterable of strings, or a NumPy array of strings or
+    unsigned integers. Returns a NumPy boolean array, with one element per
+    CNPJ.
+
+    Requires NumPy.
+    """
+    return validate_many(cnpjs, autopad=autopad) == Reason.VALID
+
+
+def validate_many(cnpjs, autopad: bool = True):
+    """Batch version of ``validate``.
+
+    Accepts the same ``cnpjs`` of ``is_valid_many``, but returns a NumPy array
+    with the ``Reason`` code of each CNPJ.
+
+    Requires NumPy.
+    """
+    digits, _, lengths = digits_matrix_lengths(cnpjs, width=EXPECTED_DIGITS, autopad=autopad)
+    first, second = __verification_digits_matrix(digits)
+    return _codes(
+        _length_checks(lengths, EXPECTED_DIGITS, autopad)
+        + [
+            (~digits.any(axis=1), Reason.ALL_ZEROS),
+            (first != digits[:, 12], Reason.FIRST_DIGIT),
+            (second != digits[:, 13], Reason.SECOND_DIGIT),
+        ]
+    )
+
+
+def verification_digits_many(cnpjs, autopad: bool = False):
+    """Find the two check digits needed to make each CNPJ in a batch valid.
+
+    Like ``verification_digits``, only the first 12 digits of each CNPJ are
+    used, so complete CNPJs can be given too, either as strings or integers
+    (an integer with up to 12 digits is taken as the 12 first digits of a
+    CNPJ, padded with zeros at the left). Returns a NumPy array with shape
+    (N, 2), with the first and second check digits of each CNPJ.
+
+    If a CNPJ has less than 12 digits, the ``InvalidCnpjLengthError`` is
+    raised, unless ``autopad`` is ``True``.
+
+    Requires NumPy.
+    """
+    np = numpy()
+
+    if not isinstance(cnpjs, np.ndarray):
+        cnpjs = list(cnpjs)
+
+    digits, valid = digits_matrix(
+        cnpjs, width=EXPECTED_DIGITS_WITHOUT_VERIFICATION, autopad=autopad, truncate=True
+    )
+
+    if not valid.all():
+        invalid = cnpjs[int(np.argmin(valid))]
+        raise InvalidCnpjLengthError(cnpj=NONDIGIT_REGEX.sub("", str(invalid)))
+
+    return np.stack(__verification_digits_matrix(digits), axis=1)
 
 
 def from_firm_id(
@@ -132,9 +280,19 @@ def from_firm_id(
 
 def format(cnpj: str) -> str:
     """Applies typical 00.000.000/0000-00 formatting to CNPJ."""
-    cnpj = pad(cnpj)
-    fmt = "{0}.{1}.{2}/{3}-{4}"
-    return fmt.format(cnpj[:2], cnpj[2:5], cnpj[5:8], cnpj[8:12], cnpj[12:])
+    padded = pad(cnpj)
+    cache = caches.format
+
+    if cache is None:
+        return _format_digits(padded)
+
+    formatted = cache.get(padded)
+
+    if formatted is MISSING:
+        formatted = _format_digits(padded)
+        cache.put(padded, formatted)
+
+    return formatted
 
 
 def pad(cnpj: str, validate_after: bool = False) -> str:
@@ -142,7 +300,7 @@ def pad(cnpj: str, validate_after: bool = False) -> str:
     padded = "%0.014i" % int(cnpj)
 
     if validate_after:
-        if not is_valid(padded):
+        if len(padded) > EXPECTED_DIGITS or not _is_valid_digits(padded):
             raise InvalidCnpjError(cnpj)
 
     return padded
@@ -152,22 +310,36 @@ def parse(cnpj: str) -> CNPJ:
     """Split CNPJ into firm, establishment and check digits.
 
     Additionally, the CNPJ is also padded and validated before returning.
+
+    Non-digit characters are removed only once, and the resulting digits are
+    padded, validated and formatted without being normalized again.
     """
     cnpj = NONDIGIT_REGEX.sub("", cnpj)
-    cnpj = pad(cnpj=cnpj, validate_after=True)
-    firm = int(cnpj[:8])
-    establishment = int(cnpj[8:12])
-    first = int(cnpj[-2])
-    second = int(cnpj[-1])
-
-    return CNPJ(
-        cnpj=format(cnpj),
-        firm=firm,
-        establishment=establishment,
-        first_digit=first,
-        second_digit=second,
+    padded = cnpj.zfill(EXPECTED_DIGITS)
+    cache = caches.parse
+
+    if cache is not None:
+        parsed = cache.get(padded)
+
+        if parsed is not MISSING:
+            return parsed
+
+    if len(padded) > EXPECTED_DIGITS or not _is_valid_digits(padded):
+        raise InvalidCnpjError(cnpj)
+
+    parsed = CNPJ(
+        cnpj=_format_digits(padded),
+        firm=int(padded[:8]),
+        establishment=int(padded[8:12]),
+        first_digit=int(padded[12]),
+        second_digit=int(padded[13]),
     )
 
+    if cache is not None:
+        cache.put(padded, parsed)
+
+    return parsed
+
 
 def random(formatted: bool = True) -> str:
     """Create a random, valid CNPJ identifier."""
@@ -178,3 +350,39 @@ def random(formatted: bool = True) -> str:
         return format(from_firm_id(firm, establishment))
 
     return from_firm_id(firm, establishment)
+
+
+def __complete(stems):
+    # like random, the establishment goes from 0001 to 0005
+    np = numpy()
+    firms, establishments = np.divmod(stems, 5)
+    digits = _digits((firms + 10**7) * 10**4 + establishments + 1, EXPECTED_DIGITS_WITHOUT_VERIFICATION)
+    return np.column_stack((digits, *__verification_digits_matrix(digits)))
+
+
+def generate_many(
+    n: int,
+    seed: int | None = None,
+    formatted: bool = False,
+    unique: bool = False,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+):
+    """Generate ``n`` random, valid CNPJs.
+
+    Returns a generator of strings. The CNPJs are generated in chunks of
+    ``chunksize``, and the same ``seed`` always generates the same CNPJs.
+    With ``unique``, no CNPJ is repeated. Like ``random``, the
+    establishment is always between 0001 and 0005. To save them to a file, see
+    ``brazilian_ids.functions.generation.write``.
+
+    Requires NumPy.
+    """
+    return _generate(
+        n,
+        9 * 10**7 * 5,
+        __complete,
+        template=FORMAT_TEMPLATE if formatted else None,
+        seed=seed,
+        unique=unique,
+        chunksize=chunksize,
+    )
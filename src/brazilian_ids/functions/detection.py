@@ -0,0 +1,57 @@
+"""Functions to find out which Brazilian IDs a value could be.
+
+Free-form columns of documents frequently mix several IDs. Instead of calling
+each module ``is_valid`` function in turn, ``detect`` removes the non-digit
+characters only once and runs only the validations that apply to the number of
+digits found:
+
+- 8 digits: CEP, which must be part of one of the states ranges
+- 11 digits: CPF, PIS/PASEP and SQL
+- 12 digits: CNO
+- 14 digits: CNPJ
+- 20 digits: NUPJ
+
+Values are not padded with zeros, since a short value could be any of the IDs.
+"""
+
+from collections.abc import Callable, Iterable
+
+from brazilian_ids.functions.company import cnpj
+from brazilian_ids.functions.labor_dispute import nupj
+from brazilian_ids.functions.location import cep
+from brazilian_ids.functions.person import cpf, pis_pasep
+from brazilian_ids.functions.real_state import cno, sql
+from brazilian_ids.functions.util import NONDIGIT_REGEX
+
+
+CANDIDATES: dict[int, tuple[tuple[str, Callable[[str], bool]], ...]] = {
+    8: (("cep", cep.is_in_range),),
+    11: (
+        ("cpf", cpf._is_valid_digits),
+        ("pis_pasep", pis_pasep._is_valid_digits),
+        ("sql", sql._is_valid_digits),
+    ),
+    12: (("cno", cno._is_valid_digits),),
+    14: (("cnpj", cnpj._is_valid_digits),),
+    20: (("nupj", nupj._is_valid_digits),),
+}
+"""The ID types that can be validated for a given number of digits, and the
+function that validates them."""
+
+
+def detect(value: str) -> tuple[str, ...]:
+    """Return the types of the IDs that ``value`` is valid as.
+
+    The types are the names of the modules that handle them: ``cep``, ``cpf``,
+    ``pis_pasep``, ``sql``, ``cno``, ``cnpj`` and ``nupj``. An empty tuple is
+    returned when the value isn't valid as any of them, and more than one type
+    might be returned, since some IDs share the same number of digits.
+    """
+    digits = NONDIGIT_REGEX.sub("", value)
+    candidates = CANDIDATES.get(len(digits), ())
+    return tuple(id_type for id_type, is_valid in candidates if is_valid(digits))
+
+
+def detect_many(values: Iterable[str]) -> list[tuple[str, ...]]:
+    """Batch version of ``detect``, returning a list with the result of each value."""
+    return [detect(value) for value in values]
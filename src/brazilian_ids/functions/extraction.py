@@ -0,0 +1,170 @@
+"""Find Brazilian IDs in free text, like OCR output, court gazettes and logs.
+
+``extract`` looks for the shapes produced by the ``format`` functions of the
+CPF, CNPJ, CNO, NUPJ and CEP modules, and also for the same IDs without
+formatting (a sequence with exactly the number of digits of the ID). A single
+compiled regular expression finds all the candidates in one pass, and each
+one is validated as soon as it is found, so only valid IDs are returned.
+
+Only the validation of a CEP is weak: any 8 digits that are part of one of the
+state ranges are accepted, so dates and other numbers written without
+separators may be reported as CEPs. Use the ``kinds`` parameter to restrict the
+ID types returned.
+
+The text can also be a stream (or any iterable of strings), which is read in
+chunks: memory usage is bounded by the size of the chunks, no matter the size
+of the stream.
+"""
+
+import re
+from collections.abc import Callable, Generator, Iterable
+from dataclasses import dataclass
+from itertools import chain
+
+from brazilian_ids.functions.company import cnpj
+from brazilian_ids.functions.labor_dispute import nupj
+from brazilian_ids.functions.location import cep
+from brazilian_ids.functions.person import cpf
+from brazilian_ids.functions.real_state import cno
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import IO
+
+DEFAULT_CHUNKSIZE = 1024 * 1024
+
+# longer shapes first, since the alternatives are tried in order
+SHAPES: tuple[tuple[str, str], ...] = (
+    ("nupj", r"[0-9]{7}-[0-9]{2}\.[0-9]{4}\.[0-9]\.[0-9]{2}\.[0-9]{4}|[0-9]{20}"),
+    ("cnpj", r"[0-9]{2}\.[0-9]{3}\.[0-9]{3}/[0-9]{4}-[0-9]{2}|[0-9]{14}"),
+    ("cno", r"[0-9]{2}\.[0-9]{3}\.[0-9]{5}/[0-9]{2}|[0-9]{12}"),
+    ("cpf", r"[0-9]{3}\.[0-9]{3}\.[0-9]{3}-[0-9]{2}|[0-9]{11}"),
+    ("cep", r"[0-9]{5}-[0-9]{3}|[0-9]{8}"),
+)
+"""The ID types found by ``extract``, with the regular expression of their
+formatted and unformatted shapes."""
+
+VALIDATORS: dict[str, Callable[[str], bool]] = {
+    "nupj": nupj._is_valid_digits,
+    "cnpj": cnpj._is_valid_digits,
+    "cno": cno._is_valid_digits,
+    "cpf": cpf._is_valid_digits,
+    "cep": cep.is_in_range,
+}
+
+# the length of the longest shape (the formatted NUPJ), plus the digit after it
+__OVERLAP = 26
+__SEPARATORS = str.maketrans("", "", ".-/")
+__PATTERNS: dict[frozenset[str], re.Pattern] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class Extracted:
+    """A valid ID found by ``extract``.
+
+    ``value`` is the ID as found in the text, ``digits`` is the same without
+    the formatting, and ``start`` and ``end`` are the position of the value
+    in the text (or in the whole stream), like ``re.Match.span``.
+    """
+
+    kind: str
+    value: str
+    digits: str
+    start: int
+    end: int
+
+
+def __pattern(kinds: frozenset[str]) -> re.Pattern:
+    """Compile, once per set of ID types, a single alternation with a named group per type."""
+    try:
+        return __PATTERNS[kinds]
+    except KeyError:
+        pass
+
+    alternatives = "|".join(f"(?P<{kind}>{shape})" for kind, shape in SHAPES if kind in kinds)
+    # digits right before or after would make it a different (or no) ID, and
+    # the lookahead for a digit lets the regex engine skip the other characters quickly
+    pattern = __PATTERNS[kinds] = re.compile(f"(?=[0-9])(?<![0-9])(?:{alternatives})(?![0-9])")
+    return pattern
+
+
+def __chunks(text: "str | Iterable[str] | IO[str]", chunksize: int) -> Iterable[str]:
+    if isinstance(text, str):
+        return (text,)
+
+    read = getattr(text, "read", None)
+
+    if read is not None:
+        return iter(lambda: read(chunksize), "")
+
+    return text
+
+
+def extract(
+    text: "str | Iterable[str] | IO[str]",
+    kinds: Iterable[str] | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Generator[Extracted, None, None]:
+    """Find the valid IDs in a text, returning them lazily, in the order they appear.
+
+    ``text`` is either a string, a text stream (read ``chunksize``
+    characters at a time) or an iterable of strings, like the lines of a file.
+    In the last two cases, an ID may be split between two chunks.
+
+    ``kinds`` restricts the ID types to be found, by default all of those in
+    ``SHAPES``.
+    """
+    if kinds is None:
+        kinds = frozenset(VALIDATORS)
+    else:
+        kinds = frozenset(kinds)
+        unknown = kinds - VALIDATORS.keys()
+
+        if unknown:
+            raise ValueError(f"Can't extract {', '.join(sorted(unknown))}, use one of {', '.join(VALIDATORS)}")
+
+    return __extract(__chunks(text, chunksize), __pattern(kinds))
+
+
+def __extract(chunks: Iterable[str], pattern: re.Pattern) -> Generator[Extracted, None, None]:
+    validators = VALIDATORS
+    separators = __SEPARATORS
+    buffer = ""
+    # the position of the buffer in the whole text, and where to continue scanning it
+    offset = 0
+    position = 0
+
+    for chunk in chain(chunks, (None,)):
+        if chunk is None:
+            limit = len(buffer) + 1
+        else:
+            buffer += chunk
+            # a match starting before this point can't change with the next chunks
+            limit = len(buffer) - __OVERLAP
+
+            if limit <= position:
+                continue
+
+        for match in pattern.finditer(buffer, position):
+            if match.start() >= limit:
+                break
+
+            position = match.end()
+            kind = match.lastgroup
+
+            if kind is None:
+                # every alternative built by __pattern is a named group
+                raise RuntimeError(f"The pattern {pattern.pattern!r} matched without a named group")
+
+            value = match.group()
+            digits = value.translate(separators)
+
+            if validators[kind](digits):
+                yield Extracted(kind, value, digits, offset + match.start(), offset + position)
+
+        # keeps a character before the next position for the lookbehind
+        cut = max(position, limit) - 1
+        buffer = buffer[cut:]
+        offset += cut
+        position = max(position, limit) - cut
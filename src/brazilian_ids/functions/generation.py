@@ -0,0 +1,153 @@
+"""Bulk generation of valid IDs, to be used as synthetic test data.
+
+The ``generate_many`` functions of the ID modules don't call ``random`` once
+per ID: the IDs are generated in chunks, as NumPy arrays. The stems (the
+digits before the verification ones) are drawn from a reproducible random
+generator, the verification digits are calculated for the whole chunk at once
+and the chunk is converted to strings in a single step.
+
+With ``unique=True``, the stems are not drawn at random, but from a
+permutation of all the possible stems (``(i * multiplier + offset) % size``,
+where ``multiplier`` is coprime with ``size``), which guarantees that no ID is
+repeated without keeping the IDs already generated in memory. The order is
+scrambled, but it is not statistically random: use it for synthetic data
+only.
+
+Requires NumPy.
+"""
+
+import os
+from collections.abc import Callable, Generator, Iterable
+from itertools import islice
+from math import gcd
+
+from brazilian_ids.functions.util import numpy
+
+# the ID modules import this one, and typing would slow down their import
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import IO
+
+DEFAULT_CHUNKSIZE = 100000
+
+
+class TooManyIdsError(ValueError):
+    """Error for more unique IDs requested than the possible ones."""
+
+    def __init__(self, requested: int, available: int) -> None:
+        super().__init__(f"Can't generate {requested} unique IDs, there are only {available} of them")
+        self.requested = requested
+        self.available = available
+
+
+def _digits(values, width: int):
+    """Convert an array of integers into a (N, ``width``) matrix of digits."""
+    np = numpy()
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    return (values.astype(np.int64)[:, None] // powers) % 10
+
+
+def _strings(digits, template: str | None = None) -> list[str]:
+    """Convert a matrix of digits into strings, one per row.
+
+    If given, ``template`` is the format of the strings, with a ``#`` in place
+    of each digit, like ``###.###.###-##``.
+    """
+    np = numpy()
+
+    if template is None:
+        chars = (digits + 48).astype(np.uint8)
+    else:
+        base = np.frombuffer(template.encode("ascii"), dtype=np.uint8)
+        chars = np.tile(base, (len(digits), 1))
+        chars[:, base == ord("#")] = digits + 48
+
+    width = chars.shape[1]
+    text = chars.tobytes().decode("ascii")
+    return [text[i:i + width] for i in range(0, len(text), width)]
+
+
+def _stems(n: int, size: int, seed: int | None, unique: bool, chunksize: int) -> Generator:
+    np = numpy()
+    rng = np.random.default_rng(seed)
+
+    if unique:
+        # keeps index * multiplier below 2**63
+        limit = min(size, 2**63 // max(n, 1))
+        multiplier = 1
+
+        for candidate in rng.integers(1, max(limit, 2), size=1000):
+            if gcd(int(candidate), size) == 1:
+                multiplier = int(candidate)
+                break
+
+        offset = int(rng.integers(0, size))
+
+    for start in range(0, n, chunksize):
+        count = min(chunksize, n - start)
+
+        if unique:
+            indexes = np.arange(start, start + count, dtype=np.int64)
+            yield ((indexes * multiplier) % size + offset) % size
+        else:
+            yield rng.integers(0, size, size=count, dtype=np.int64)
+
+
+def _generate(
+    n: int,
+    size: int,
+    complete: Callable,
+    template: str | None = None,
+    seed: int | None = None,
+    unique: bool = False,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Generator[str, None, None]:
+    """Generate ``n`` IDs, from stems identified by integers from zero to ``size - 1``.
+
+    ``complete`` receives an array of those integers and must return the
+    matrix with all the digits of the IDs.
+
+    The arguments are checked before returning the generator.
+    """
+    if n < 0:
+        raise ValueError("The number of IDs can't be negative")
+
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    if unique and n > size:
+        raise TooManyIdsError(n, size)
+
+    numpy()
+    return (
+        id_
+        for stems in _stems(n, size, seed=seed, unique=unique, chunksize=chunksize)
+        for id_ in _strings(complete(stems), template)
+    )
+
+
+def write(ids: Iterable[str], file: "str | os.PathLike | IO[str]", chunksize: int = DEFAULT_CHUNKSIZE) -> int:
+    """Write IDs to a file, one per line, returning how many were written.
+
+    ``file`` is either a path, which is created or overwritten, or a text
+    stream. For example, to write ten million CPFs::
+
+        write(cpf.generate_many(10_000_000, seed=42), "cpfs.txt")
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w", encoding="ascii") as stream:
+            return write(ids, stream, chunksize=chunksize)
+
+    iterator = iter(ids)
+    total = 0
+
+    while True:
+        chunk = list(islice(iterator, chunksize))
+
+        if not chunk:
+            return total
+
+        file.write("\n".join(chunk))
+        file.write("\n")
+        total += len(chunk)
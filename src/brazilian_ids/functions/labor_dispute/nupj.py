@@ -16,19 +16,21 @@ References:
 from dataclasses import dataclass
 from collections import deque
 
-from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.caching import MISSING, Caches
+from brazilian_ids.functions.util import NONDIGIT_REGEX, digits_matrix_lengths, numpy
 from brazilian_ids.functions.exceptions import InvalidIdError
+from brazilian_ids.functions.validation import Reason, _codes, _length_checks, _length_reason
 
 
 class InvalidCourtIdError(ValueError):
-    def __init__(self, court_id: int) -> None:
+    def __init__(self, court_id: int | str | LookupError) -> None:
         self.id_ = court_id
         msg = f"The court_id '{court_id}' is invalid"
         super().__init__(self, msg)
 
 
 class InvalidSegmentIdError(ValueError):
-    def __init__(self, segment_id: int) -> None:
+    def __init__(self, segment_id: int | LookupError) -> None:
         self.id_ = segment_id
         msg = f"The segment_id '{segment_id}' is invalid"
         super().__init__(self, msg)
@@ -106,152 +108,160 @@ class Courts:
         9: "Tribunal de Justiça Militar",
     }
 
-    __unknown_court = {"00": ("N/D", "Não Disponível")}
-
-    __segments_courts = {
-        1: __unknown_court,
-        2: __unknown_court,
-        3: __unknown_court,
-        4: {
-            "01": ("TRF01", "1ª Região"),
-            "02": ("TRF02", "2ª Região"),
-            "03": ("TRF03", "3ª Região"),
-            "04": ("TRF04", "4ª Região"),
-            "05": ("TRF05", "5ª Região"),
-            "06": ("TRF06", "6ª Região"),
-        },
-        5: {
-            "01": ("TRT06", "1ª Região - Rio de Janeiro"),
-            "02": ("TRT02", "2ª Região - São Paulo"),
-            "03": ("TRT03", "3ª Região - Belo Horizonte"),
-            "04": ("TRT04", "4ª Região - Porto Alegre"),
-            "05": ("TRT05", "5ª Região - Salvador"),
-            "06": ("TRT06", "6ª Região - Recife"),
-            "07": ("TRT07", "7ª Região - Fortaleza"),
-            "08": ("TRT08", "8ª Região - Belém"),
-            "09": ("TRT09", "9ª Região - Curitiba"),
-            "10": ("TRT10", "10ª Região - Brasília"),
-            "11": ("TRT11", "11ª Região - Manaus"),
-            "12": ("TRT12", "12ª Região - Florianópolis"),
-            "13": ("TRT13", "13ª Região - João Pessoa"),
-            "14": ("TRT14", "14ª Região - Porto Velho"),
-            "15": ("TRT15", "15ª Região - Campinas"),
-            "16": ("TRT16", "16ª Região - São Luiz"),
-            "17": ("TRT17", "17ª Região - Vitória"),
-            "18": ("TRT18", "18ª Região - Goiânia"),
-            "19": ("TRT19", "19ª Região - Maceió"),
-            "20": ("TRT20", "20ª Região - Aracaju"),
-            "21": ("TRT21", "21ª Região - Natal"),
-            "22": ("TRT22", "22ª Região - Teresina"),
-            "23": ("TRT23", "23ª Região - Cuiabá"),
-            "24": ("TRT24", "24ª Região - Campo Grande"),
-        },
-        6: {
-            "01": ("TRE-AC", "do Acre"),
-            "02": ("TRE-AL", "de Alagoas"),
-            "03": ("TRE-AM", "da Amazonas"),
-            "04": ("TRE-BA", "da Bahia"),
-            "05": ("TRE-CE", "do Ceará"),
-            "06": ("TRE-DF", "do Distrito Federal"),
-            "07": ("TRE-ES", "do Espírito Santo"),
-            "08": ("TRE-GO", "de Goiás"),
-            "09": ("TRE-MA", "do Maranhão"),
-            "10": ("TRE-MT", "do Mato Grosso"),
-            "11": ("TRE-MS", "do Mato Grosso do Sul"),
-            "12": ("TRE-MG", "de Minas Gerais"),
-            "13": ("TRE-PA", "do Pará"),
-            "14": ("TRE-PB", "da Paraíba"),
-            "15": ("TRE-PR", "do Paraná"),
-            "16": ("TRE-PE", "de Pernambuco"),
-            "17": ("TRE-PI", "do Piauí"),
-            "18": ("TRE-RJ", "do Rio de Janeiro"),
-            "19": ("TRE-RN", "do Rio Grande do Norte"),
-            "20": ("TRE-RS", "do Rio Grande do Sul"),
-            "21": ("TRE-RO", "de Rondônia"),
-            "22": ("TRE-RR", "de Roraima"),
-            "23": ("TRE-SC", "de Santa Catarina"),
-            "24": ("TRE-SP", "de São Paulo"),
-            "25": ("TRE-SE", "de Sergipe"),
-            "26": ("TRE-TO", "do Tocantins"),
-        },
-        7: {
-            "01": ("CJM-1", "1ª Região (Brasília)"),
-            "02": (
-                "CJM-2",
-                "2ª Região (São Paulo)",
-            ),
-            "03": (
-                "CJM-3",
-                "3ª Região (Minas Gerais)",
-            ),
-            "04": (
-                "CJM-4",
-                "4ª Região (Rio de Janeiro)",
-            ),
-            "05": ("CJM-5", "5ª Região (Belém)"),
-            "06": ("CJM-6", "6ª Região (Recife)"),
-            "07": ("CJM-7", "7ª Região (Salvador)"),
-            "08": (
-                "CJM-8",
-                "8ª Região (Porto Alegre)",
-            ),
-            "09": ("CJM-9", "9ª Região (Manaus)"),
-            "10": (
-                "CJM-10",
-                "10ª Região (Fortaleza)",
-            ),
-            "11": (
-                "CJM-11",
-                "11ª Região (Campo Grande)",
-            ),
-            "12": (
-                "CJM-12",
-                "12ª Região (Curitiba)",
-            ),
-        },
-        8: {
-            "01": ("TJAC", "do Acre"),
-            "02": ("TJAL", "de Alagoas"),
-            "03": ("TJAP", "do Amapá"),
-            "04": ("TJAM", "do Amazonas"),
-            "05": ("TJBA", "da Bahia"),
-            "06": ("TJCE", "do Ceará"),
-            "07": ("TJDF", "do Distrito Federal e Territórios"),
-            "08": ("TJES", "do Espírito Santo"),
-            "09": ("TJGO", "de Goiás"),
-            "10": ("TJMA", "do Maranhão"),
-            "11": ("TJMT", "do Mato Grosso"),
-            "12": ("TJMS", "do Mato Grosso do Sul"),
-            "13": ("TJMG", "de Minas Gerais"),
-            "14": ("TJPA", "do Pará"),
-            "15": ("TJPB", "da Paraíba"),
-            "16": ("TJPR", "do Paraná"),
-            "17": ("TJPE", "de Pernambuco"),
-            "18": ("TJPI", "do Piauí"),
-            "19": ("TJRJ", "do Rio de Janeiro"),
-            "20": ("TJRN", "do Rio Grande do Norte"),
-            "21": ("TJRS", "do Rio Grande do Sul"),
-            "22": ("TJRO", "de Rondônia"),
-            "23": ("TJRR", "de Roraima"),
-            "24": ("TJSC", "de Santa Catarina"),
-            "25": ("TJSP", "de São Paulo"),
-            "26": ("TJSE", "de Sergipe"),
-            "27": ("TJTO", "do Tocantins"),
-        },
-        9: {
-            "13": ("TJMMG", "de Minas Gerais"),
-            "21": ("TJMSP", "do Rio Grande do Sul"),
-            "26": ("TJMRS", "de São Paulo"),
-        },
-    }
+    __segments_courts: dict[int, dict[str, tuple[str, str]]] | None = None
 
     @classmethod
-    def __court(klass, segment_id: int, court_id: str) -> str:
+    def __courts_by_segment(klass) -> dict[int, dict[str, tuple[str, str]]]:
+        """Return the courts of each segment, building them on first use."""
+        if klass.__segments_courts is not None:
+            return klass.__segments_courts
+
+        unknown_court = {"00": ("N/D", "Não Disponível")}
+        klass.__segments_courts = {
+            1: unknown_court,
+            2: unknown_court,
+            3: unknown_court,
+            4: {
+                "01": ("TRF01", "1ª Região"),
+                "02": ("TRF02", "2ª Região"),
+                "03": ("TRF03", "3ª Região"),
+                "04": ("TRF04", "4ª Região"),
+                "05": ("TRF05", "5ª Região"),
+                "06": ("TRF06", "6ª Região"),
+            },
+            5: {
+                "01": ("TRT06", "1ª Região - Rio de Janeiro"),
+                "02": ("TRT02", "2ª Região - São Paulo"),
+                "03": ("TRT03", "3ª Região - Belo Horizonte"),
+                "04": ("TRT04", "4ª Região - Porto Alegre"),
+                "05": ("TRT05", "5ª Região - Salvador"),
+                "06": ("TRT06", "6ª Região - Recife"),
+                "07": ("TRT07", "7ª Região - Fortaleza"),
+                "08": ("TRT08", "8ª Região - Belém"),
+                "09": ("TRT09", "9ª Região - Curitiba"),
+                "10": ("TRT10", "10ª Região - Brasília"),
+                "11": ("TRT11", "11ª Região - Manaus"),
+                "12": ("TRT12", "12ª Região - Florianópolis"),
+                "13": ("TRT13", "13ª Região - João Pessoa"),
+                "14": ("TRT14", "14ª Região - Porto Velho"),
+                "15": ("TRT15", "15ª Região - Campinas"),
+                "16": ("TRT16", "16ª Região - São Luiz"),
+                "17": ("TRT17", "17ª Região - Vitória"),
+                "18": ("TRT18", "18ª Região - Goiânia"),
+                "19": ("TRT19", "19ª Região - Maceió"),
+                "20": ("TRT20", "20ª Região - Aracaju"),
+                "21": ("TRT21", "21ª Região - Natal"),
+                "22": ("TRT22", "22ª Região - Teresina"),
+                "23": ("TRT23", "23ª Região - Cuiabá"),
+                "24": ("TRT24", "24ª Região - Campo Grande"),
+            },
+            6: {
+                "01": ("TRE-AC", "do Acre"),
+                "02": ("TRE-AL", "de Alagoas"),
+                "03": ("TRE-AM", "da Amazonas"),
+                "04": ("TRE-BA", "da Bahia"),
+                "05": ("TRE-CE", "do Ceará"),
+                "06": ("TRE-DF", "do Distrito Federal"),
+                "07": ("TRE-ES", "do Espírito Santo"),
+                "08": ("TRE-GO", "de Goiás"),
+                "09": ("TRE-MA", "do Maranhão"),
+                "10": ("TRE-MT", "do Mato Grosso"),
+                "11": ("TRE-MS", "do Mato Grosso do Sul"),
+                "12": ("TRE-MG", "de Minas Gerais"),
+                "13": ("TRE-PA", "do Pará"),
+                "14": ("TRE-PB", "da Paraíba"),
+                "15": ("TRE-PR", "do Paraná"),
+                "16": ("TRE-PE", "de Pernambuco"),
+                "17": ("TRE-PI", "do Piauí"),
+                "18": ("TRE-RJ", "do Rio de Janeiro"),
+                "19": ("TRE-RN", "do Rio Grande do Norte"),
+                "20": ("TRE-RS", "do Rio Grande do Sul"),
+                "21": ("TRE-RO", "de Rondônia"),
+                "22": ("TRE-RR", "de Roraima"),
+                "23": ("TRE-SC", "de Santa Catarina"),
+                "24": ("TRE-SP", "de São Paulo"),
+                "25": ("TRE-SE", "de Sergipe"),
+                "26": ("TRE-TO", "do Tocantins"),
+            },
+            7: {
+                "01": ("CJM-1", "1ª Região (Brasília)"),
+                "02": (
+                    "CJM-2",
+                    "2ª Região (São Paulo)",
+                ),
+                "03": (
+                    "CJM-3",
+                    "3ª Região (Minas Gerais)",
+                ),
+                "04": (
+                    "CJM-4",
+                    "4ª Região (Rio de Janeiro)",
+                ),
+                "05": ("CJM-5", "5ª Região (Belém)"),
+                "06": ("CJM-6", "6ª Região (Recife)"),
+                "07": ("CJM-7", "7ª Região (Salvador)"),
+                "08": (
+                    "CJM-8",
+                    "8ª Região (Porto Alegre)",
+                ),
+                "09": ("CJM-9", "9ª Região (Manaus)"),
+                "10": (
+                    "CJM-10",
+                    "10ª Região (Fortaleza)",
+                ),
+                "11": (
+                    "CJM-11",
+                    "11ª Região (Campo Grande)",
+                ),
+                "12": (
+                    "CJM-12",
+                    "12ª Região (Curitiba)",
+                ),
+            },
+            8: {
+                "01": ("TJAC", "do Acre"),
+                "02": ("TJAL", "de Alagoas"),
+                "03": ("TJAP", "do Amapá"),
+                "04": ("TJAM", "do Amazonas"),
+                "05": ("TJBA", "da Bahia"),
+                "06": ("TJCE", "do Ceará"),
+                "07": ("TJDF", "do Distrito Federal e Territórios"),
+                "08": ("TJES", "do Espírito Santo"),
+                "09": ("TJGO", "de Goiás"),
+                "10": ("TJMA", "do Maranhão"),
+                "11": ("TJMT", "do Mato Grosso"),
+                "12": ("TJMS", "do Mato Grosso do Sul"),
+                "13": ("TJMG", "de Minas Gerais"),
+                "14": ("TJPA", "do Pará"),
+                "15": ("TJPB", "da Paraíba"),
+                "16": ("TJPR", "do Paraná"),
+                "17": ("TJPE", "de Pernambuco"),
+                "18": ("TJPI", "do Piauí"),
+                "19": ("TJRJ", "do Rio de Janeiro"),
+                "20": ("TJRN", "do Rio Grande do Norte"),
+                "21": ("TJRS", "do Rio Grande do Sul"),
+                "22": ("TJRO", "de Rondônia"),
+                "23": ("TJRR", "de Roraima"),
+                "24": ("TJSC", "de Santa Catarina"),
+                "25": ("TJSP", "de São Paulo"),
+                "26": ("TJSE", "de Sergipe"),
+                "27": ("TJTO", "do Tocantins"),
+            },
+            9: {
+                "13": ("TJMMG", "de Minas Gerais"),
+                "21": ("TJMSP", "do Rio Grande do Sul"),
+                "26": ("TJMRS", "de São Paulo"),
+            },
+        }
+        return klass.__segments_courts
+
+    @classmethod
+    def __court(klass, segment_id: int, court_id: str) -> tuple[str, str]:
         if klass.__segments[segment_id] is None:
             raise InvalidSegmentIdError(segment_id)
 
         try:
-            courts = klass.__segments_courts[segment_id]
+            courts = klass.__courts_by_segment()[segment_id]
         except IndexError as e:
             raise InvalidSegmentIdError(e)
 
@@ -284,7 +294,7 @@ class Courts:
 
     @classmethod
     def total_courts(klass) -> int:
-        return len(klass.__segments_courts)
+        return len(klass.__courts_by_segment())
 
     @classmethod
     def segment(klass, id: int) -> str:
@@ -301,12 +311,12 @@ class Courts:
         return description
 
 
-@dataclass
+@dataclass(frozen=True)
 class NUPJ:
     """Class representing the fields of a NUPJ as instance attributes.
 
     Usually you will use the function ``parse`` from this package to get a
-    instance.
+    instance. Instances are immutable.
     """
 
     lawsuit_id: str
@@ -326,21 +336,54 @@ class NUPJ:
 
 EXPECTED_DIGITS = 20
 
-# saving some memory
-__zero_tr = (set(("00",)),)
-__1_to_27_tr = set(["%02d" % i for i in range(1, 28)])
+__courts_trs: dict[int, set[str]] | None = None
+__allowed_courts: dict[int, frozenset[int]] | None = None
+
+
+def _courts_trs() -> dict[int, set[str]]:
+    """Return the court codes of each segment, building them on first use.
+
+    Also available as the ``COURTS_TRS`` attribute of this module."""
+    global __courts_trs
+
+    if __courts_trs is None:
+        # saving some memory
+        zero_tr = set(("00",))
+        one_to_27_tr = set(["%02d" % i for i in range(1, 28)])
+        __courts_trs = {
+            1: zero_tr,
+            2: zero_tr,
+            3: zero_tr,
+            4: set(("01", "02", "03", "04", "05", "06")),
+            5: set(["%02d" % i for i in range(1, 25)]),
+            6: one_to_27_tr,
+            7: set(["%02d" % i for i in range(1, 13)]),
+            8: one_to_27_tr,
+            9: set(("13", "21", "26")),
+        }
+
+    return __courts_trs
+
+
+def _allowed_courts() -> dict[int, frozenset[int]]:
+    """Return the court codes of each segment as integers, including the councils, building them on first use."""
+    global __allowed_courts
 
-COURTS_TRS: dict[int, set[str]] = {
-    1: __zero_tr,
-    2: __zero_tr,
-    3: __zero_tr,
-    4: set(("01", "02", "03", "04", "05", "06")),
-    5: set(["%02d" % i for i in range(1, 25)]),
-    6: __1_to_27_tr,
-    7: set(["%02d" % i for i in range(1, 13)]),
-    8: __1_to_27_tr,
-    9: set(("13", "21", "26")),
-}
+    if __allowed_courts is None:
+        # "Conselho da Justiça Federal" and "Conselho Superior da Justiça do Trabalho" uses "90"
+        __allowed_courts = {
+            segment: frozenset(int(court) for court in courts) | {0, 90}
+            for segment, courts in _courts_trs().items()
+        }
+
+    return __allowed_courts
+
+
+def __getattr__(name: str):
+    if name == "COURTS_TRS":
+        return _courts_trs()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def pad(nupj: str) -> str:
@@ -364,10 +407,22 @@ def pad(nupj: str) -> str:
     return nupj
 
 
+caches = Caches("parse")
+"""Optional cache of ``parse``, disabled by default. See
+``brazilian_ids.functions.caching``."""
+
+
 def parse(nupj: str) -> NUPJ:
     """Parse a NUPJ."""
-    nupj = NONDIGIT_REGEX.sub("", nupj)
-    nupj = pad(nupj)
+    nupj = pad(NONDIGIT_REGEX.sub("", nupj))
+    cache = caches.parse
+
+    if cache is not None:
+        parsed = cache.get(nupj)
+
+        if parsed is not MISSING:
+            return parsed
+
     # NNNNNNN-DD.AAAA.J.TR.OOOO
     lawsuit = nupj[:7]
     first = int(nupj[7])
@@ -377,7 +432,7 @@ def parse(nupj: str) -> NUPJ:
     court = nupj[14:16]
     l_city = nupj[16:20]
 
-    return NUPJ(
+    parsed = NUPJ(
         lawsuit_id=lawsuit,
         first_digit=first,
         second_digit=second,
@@ -387,6 +442,14 @@ def parse(nupj: str) -> NUPJ:
         lawsuit_city=l_city,
     )
 
+    if cache is not None:
+        cache.put(nupj, parsed)
+
+    return parsed
+
+
+__MIN_YEAR = 2008
+
 
 def is_valid(nupj: str) -> bool:
     """Determine is a given NUPJ is valid or not.
@@ -399,39 +462,124 @@ def is_valid(nupj: str) -> bool:
     justice segment in the NUPJ, and in those cases where every check fails but
     the court ID is "90", this function will continue checking other aspects
     instead of returning ``False``.
+
+    The NUPJ is handled as a single integer: the fields are extracted with
+    ``divmod`` and the ISO 7064 mod 97 check is calculated arithmetically,
+    without creating a ``NUPJ`` instance.
     """
-    parsed = parse(nupj)
+    return _is_valid_digits(NONDIGIT_REGEX.sub("", nupj))
+
+
+def _is_valid_digits(nupj: str) -> bool:
+    """Check whether an already clean NUPJ is valid.
+
+    Expects a string with up to ``EXPECTED_DIGITS`` digits."""
+    return __reason(nupj) is Reason.VALID
+
+
+def __reason(nupj: str) -> Reason:
+    """Check an already clean NUPJ, returning why it is invalid."""
+    reason = _length_reason(len(nupj), EXPECTED_DIGITS, autopad=True)
+
+    if reason is not Reason.VALID:
+        return reason
+
+    # NNNNNNN-DD.AAAA.J.TR.OOOO
+    lawsuit, rest = divmod(int(nupj), 10**13)
+    digits, rest = divmod(rest, 10**11)
+    year, court_city = divmod(rest, 10**7)
 
     # the year of the creation of the law
-    if parsed.year < 2008:
-        return False
-
-    try:
-        result = Courts.segment(parsed.segment)
-    except IndexError:
-        return False
-    else:
-        if result is None:
-            return False
-
-    # "Conselho da Justiça Federal" and "Conselho Superior da Justiça do Trabalho" uses "90"
-    if parsed.court_id != "90" and parsed.court_id not in COURTS_TRS[parsed.segment]:
-        if parsed.court_id != "00":
-            return False
-
-    divisor = 97
-    partial_1 = str(int(parsed.lawsuit_id) % divisor)
-    partial_2 = str(
-        int(
-            "{0}{1}{2}{3}".format(
-                partial_1, parsed.year, parsed.segment, parsed.court_id
-            )
-        )
-        % divisor
-    )
-    result = (
-        int("{0}{1}{2}".format(partial_2, parsed.lawsuit_city, parsed.digits()))
-        % divisor
-    )
+    if year < __MIN_YEAR:
+        return Reason.INVALID_YEAR
+
+    segment, court_city = divmod(court_city, 10**6)
+
+    allowed_courts = _allowed_courts()
+
+    if segment not in allowed_courts:
+        return Reason.INVALID_SEGMENT
+
+    if court_city // 10**4 not in allowed_courts[segment]:
+        return Reason.INVALID_COURT
+
+    # the verification digits are moved to the end before the check
+    stem = (lawsuit * 10**11 + rest) * 100
+
+    if (stem + digits) % 97 == 1:
+        return Reason.VALID
+
+    if digits // 10 != (98 - stem % 97) // 10:
+        return Reason.FIRST_DIGIT
 
-    return result == 1
+    return Reason.SECOND_DIGIT
+
+
+def validate(nupj: str) -> Reason:
+    """Check whether a NUPJ is valid, returning why it isn't.
+
+    Returns ``Reason.VALID`` (zero) for the same NUPJs accepted by
+    ``is_valid``, or the reason of the first check that failed.
+    """
+    return __reason(NONDIGIT_REGEX.sub("", nupj))
+
+
+def is_valid_many(nupjs):
+    """Check whether each NUPJ in a batch is valid.
+
+    ``nupjs`` can be any iterable of strings or a NumPy array of strings.
+    Shorter NUPJs are padded with zeros. The same checks of ``is_valid`` are
+    executed for the whole batch at once, calculating the mod 97 check over
+    chunks of digits that fit in 64 bits integers.
+
+    Returns a NumPy boolean array, with one element per NUPJ.
+
+    Requires NumPy.
+    """
+    return validate_many(nupjs) == Reason.VALID
+
+
+def validate_many(nupjs):
+    """Batch version of ``validate``.
+
+    Accepts the same ``nupjs`` of ``is_valid_many``, but returns a NumPy array
+    with the ``Reason`` code of each NUPJ.
+
+    Requires NumPy.
+    """
+    np = numpy()
+    digits, _, lengths = digits_matrix_lengths(nupjs, width=EXPECTED_DIGITS, autopad=True)
+
+    # lawsuit, year, segment, court and city first, verification digits last
+    ordered = digits[:, list(range(7)) + list(range(9, 20)) + [7, 8]]
+    remainder = np.zeros(len(ordered), dtype=np.int64)
+
+    for start, stop in ((0, 10), (10, 20)):
+        chunk = ordered[:, start:stop] @ (10 ** np.arange(stop - start - 1, -1, -1, dtype=np.int64))
+        remainder = (remainder * 10 ** (stop - start) + chunk) % 97
+
+    verification = digits[:, 7] * 10 + digits[:, 8]
+    # the remainder without the verification digits gives the expected ones
+    expected = 98 - (remainder - verification) % 97
+    year = digits[:, 9:13] @ np.array([1000, 100, 10, 1], dtype=np.int64)
+    segment = digits[:, 13]
+    court = digits[:, 14] * 10 + digits[:, 15]
+
+    allowed_segments = np.zeros(10, dtype=bool)
+    allowed = np.zeros((10, 100), dtype=bool)
+
+    for seg, courts in _allowed_courts().items():
+        allowed_segments[seg] = True
+        allowed[seg, list(courts)] = True
+
+    wrong = remainder != 1
+    return _codes(
+        _length_checks(lengths, EXPECTED_DIGITS, autopad=True)
+        + [
+            (year < __MIN_YEAR, Reason.INVALID_YEAR),
+            (~allowed_segments[segment], Reason.INVALID_SEGMENT),
+            (~allowed[segment, court], Reason.INVALID_COURT),
+            (wrong & (digits[:, 7] != expected // 10), Reason.FIRST_DIGIT),
+            (wrong, Reason.SECOND_DIGIT),
+        ]
+    )
@@ -7,23 +7,32 @@ of a private company in Brazil called Correios. The company has the monopoly in
 Brazil and doesn't provide data besides simply queries with limited results and
 restricted by captchas to making data scraping more difficult.
 
+If you have a copy of their base (or of any other data by CEP), see the
+``cep_index`` module to look up its records.
+
 See also:
 
 - `Correios <https://pt.wikipedia.org/wiki/Empresa_Brasileira_de_Correios_e_Tel%C3%A9grafos>`_
 - `CEP <https://pt.wikipedia.org/wiki/C%C3%B3digo_de_Endere%C3%A7amento_Postal>`_
 """
 
+from bisect import bisect_right
+from collections.abc import Generator
 from dataclasses import dataclass
-from typing import Generator
 
+from brazilian_ids.functions.caching import MISSING, Caches
 from brazilian_ids.functions.exceptions import InvalidIdError
+from brazilian_ids.functions.util import Singleton, numpy
+from brazilian_ids.functions.validation import Reason
 
 
-@dataclass(frozen=True, slots=True, repr=False)
+@dataclass(frozen=True, slots=True, repr=False, eq=False)
 class CEP:
     """Representation of a CEP.
 
-    Should be obtained from the ``parse`` function.
+    Should be obtained from the ``parse`` function. Instances are compared and
+    hashed by ``sort_key``, so a ``CEP`` is equal to the ``CompactCEP`` of the
+    same CEP.
     """
 
     formatted_cep: str
@@ -37,47 +46,142 @@ class CEP:
     def __repr__(self):
         return self.formatted_cep
 
-    def __ge__(self, other):
-        test_sequence = ("region", "sub_region", "sub_sector", "division")
+    @property
+    def sort_key(self) -> int:
+        """Return the CEP as an 8 digits integer, suitable for sorting and comparisons."""
+        return self.division * 1000 + int(self.suffix)
 
-        for digit in test_sequence:
-            if getattr(self, digit) > getattr(other, digit):
-                return True
-            elif getattr(self, digit) == getattr(other, digit):
-                continue
-            else:
-                return False
+    def compact(self) -> "CompactCEP":
+        """Return the ``CompactCEP`` equivalent to this instance."""
+        return CompactCEP(self.sort_key)
 
-        a = int(self.suffix)
-        b = int(other.suffix)
+    def __hash__(self) -> int:
+        return hash(self.sort_key)
 
-        return a >= b
+    def __eq__(self, other):
+        if not isinstance(other, (CEP, CompactCEP)):
+            return NotImplemented
+        return self.sort_key == other.sort_key
+
+    def __lt__(self, other):
+        if not isinstance(other, (CEP, CompactCEP)):
+            return NotImplemented
+        return self.sort_key < other.sort_key
 
     def __le__(self, other):
-        test_sequence = ("region", "sub_region", "sub_sector", "division")
+        if not isinstance(other, (CEP, CompactCEP)):
+            return NotImplemented
+        return self.sort_key <= other.sort_key
+
+    def __gt__(self, other):
+        if not isinstance(other, (CEP, CompactCEP)):
+            return NotImplemented
+        return self.sort_key > other.sort_key
+
+    def __ge__(self, other):
+        if not isinstance(other, (CEP, CompactCEP)):
+            return NotImplemented
+        return self.sort_key >= other.sort_key
+
+
+class CompactCEP:
+    """Compact representation of a CEP, backed by a single 8 digits integer.
+
+    The same attributes of ``CEP`` are available, but they are calculated only
+    when requested. Comparisons and hashing work directly on the integer,
+    which makes instances cheap to sort, to use as ``dict`` keys and to join
+    with ranges of CEPs. An instance is equal to the ``CEP`` of the same CEP.
+
+    Should be obtained from the ``parse_compact`` function, or from an integer
+    that is already known to be a CEP.
+    """
+
+    __slots__ = ("__value",)
+
+    def __init__(self, value: int) -> None:
+        if not 0 <= value <= 99999999:
+            raise InvalidCepError(str(value))
+
+        self.__value = value
+
+    @property
+    def sort_key(self) -> int:
+        """Return the CEP as an 8 digits integer."""
+        return self.__value
 
-        for digit in test_sequence:
-            if getattr(self, digit) < getattr(other, digit):
-                return True
-            elif getattr(self, digit) == getattr(other, digit):
-                continue
-            else:
-                return False
+    @property
+    def formatted_cep(self) -> str:
+        return "{0:05d}-{1:03d}".format(*divmod(self.__value, 1000))
 
-        a = int(self.suffix)
-        b = int(other.suffix)
+    @property
+    def region(self) -> int:
+        return self.__value // 10000000
 
-        return a <= b
+    @property
+    def sub_region(self) -> int:
+        return self.__value // 1000000
 
+    @property
+    def sector(self) -> int:
+        return self.__value // 100000
 
-class Singleton(type):
-    """Implement the singleton pattern."""
-    _instances = {}
+    @property
+    def sub_sector(self) -> int:
+        return self.__value // 10000
+
+    @property
+    def division(self) -> int:
+        return self.__value // 1000
+
+    @property
+    def suffix(self) -> str:
+        return "{0:03d}".format(self.__value % 1000)
+
+    @property
+    def state(self) -> str | None:
+        """Return the state code this CEP belongs to, or ``None``. See ``state_of``."""
+        return CepRange().state_of(self.__value)
+
+    def expand(self) -> CEP:
+        """Return the ``CEP`` equivalent to this instance."""
+        return parse(self.formatted_cep)
+
+    def __int__(self) -> int:
+        return self.__value
+
+    def __hash__(self) -> int:
+        return hash(self.__value)
+
+    def __eq__(self, other):
+        if not isinstance(other, (CEP, CompactCEP)):
+            return NotImplemented
+        return self.__value == other.sort_key
+
+    def __lt__(self, other):
+        if not isinstance(other, (CEP, CompactCEP)):
+            return NotImplemented
+        return self.__value < other.sort_key
+
+    def __le__(self, other):
+        if not isinstance(other, (CEP, CompactCEP)):
+            return NotImplemented
+        return self.__value <= other.sort_key
+
+    def __gt__(self, other):
+        if not isinstance(other, (CEP, CompactCEP)):
+            return NotImplemented
+        return self.__value > other.sort_key
+
+    def __ge__(self, other):
+        if not isinstance(other, (CEP, CompactCEP)):
+            return NotImplemented
+        return self.__value >= other.sort_key
+
+    def __str__(self):
+        return self.formatted_cep
 
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+    def __repr__(self):
+        return "CompactCEP({0})".format(self.formatted_cep)
 
 
 class CepInvalidStateError(ValueError):
@@ -88,8 +192,13 @@ class CepInvalidStateError(ValueError):
 
 
 class CepRange(metaclass=Singleton):
-    """Representation of all the CEPs range by state, as documented by Correios."""
-    __slots__ = "__ranges"
+    """Representation of all the CEPs range by state, as documented by Correios.
+
+    Besides the ranges themselves, an interval table sorted by the first CEP of
+    each range (as an 8 digits integer) is built once, so the state of a CEP
+    can be found with a binary search.
+    """
+    __slots__ = ("__ranges", "__by_state", "__starts", "__ends", "__states")
 
     def __init__(self):
         self.__ranges = {
@@ -118,6 +227,15 @@ class CepRange(metaclass=Singleton):
             "ES": ("29000-000", "29999-999"),
         }
 
+        self.__by_state = {
+            state: (int(start.replace("-", "")), int(end.replace("-", "")))
+            for state, (start, end) in self.__ranges.items()
+        }
+        table = sorted((start, end, state) for state, (start, end) in self.__by_state.items())
+        self.__starts = [row[0] for row in table]
+        self.__ends = [row[1] for row in table]
+        self.__states = [row[2] for row in table]
+
     def ranges_by_state(self, state: str) -> tuple[CEP, CEP]:
         """Return the a pair of CEPs related to a given state code.
 
@@ -136,6 +254,38 @@ class CepRange(metaclass=Singleton):
         for start, end in self.__ranges.values():
             yield (parse(start), parse(end))
 
+    def int_range_by_state(self, state: str) -> tuple[int, int]:
+        """Return the first and last CEPs of a given state, as 8 digits integers."""
+        try:
+            return self.__by_state[state]
+        except KeyError:
+            raise CepInvalidStateError(state)
+
+    def state_of(self, cep: int) -> str | None:
+        """Return the state code of a CEP given as an 8 digits integer, or ``None`` if it isn't part of any range."""
+        i = bisect_right(self.__starts, cep) - 1
+
+        if i >= 0 and cep <= self.__ends[i]:
+            return self.__states[i]
+
+        return None
+
+    def states_of(self, ceps):
+        """Batch version of ``state_of``, for a NumPy array of 8 digits integers.
+
+        Returns a NumPy array of state codes, with empty strings for CEPs that aren't part of any range.
+
+        Requires NumPy.
+        """
+        np = numpy()
+        ceps = np.asarray(ceps, dtype=np.int64)
+        starts = np.array(self.__starts, dtype=np.int64)
+        ends = np.array(self.__ends, dtype=np.int64)
+        states = np.array(self.__states + [""])
+        i = np.searchsorted(starts, ceps, side="right") - 1
+        found = (i >= 0) & (ceps <= ends[i])
+        return states[np.where(found, i, -1)]
+
     def __repr__(self):
         return "{0}, total of ranges: {1}".format(self.__class__.__name__, len(self.__ranges))
 
@@ -160,7 +310,7 @@ def is_valid(cep: str, raw: bool = False, digits: int = 0) -> bool:
     return digits in expected
 
 
-def is_valid_extended(cep: str, raw: bool = False, digits: int = 0, state: str | None=None) -> bool:
+def is_valid_extended(cep: str, raw: bool = False, digits: int = 0, state: str | None = None) -> bool:
     """Check if a CEP is valid or not.
 
     This function does everything that ``is_valid`` function does, plus some additional verifications that will take a
@@ -175,48 +325,205 @@ def is_valid_extended(cep: str, raw: bool = False, digits: int = 0, state: str |
     if not is_valid(cep=cep, raw=raw, digits=digits):
         return False
 
+    try:
+        candidate = int(__digits(cep))
+    except InvalidCepError:
+        return False
+
     ranges = CepRange()
-    candidate = parse(cep)
 
     if state is not None:
-        start, end = ranges.ranges_by_state(state)
-        return candidate >= start and candidate <= end
+        start, end = ranges.int_range_by_state(state)
+        return start <= candidate <= end
+
+    return ranges.state_of(candidate) is not None
+
+
+def __reason(cep: str) -> Reason:
+    """Check the length and the characters of a CEP, returning why it is invalid."""
+    cep = cep.replace("-", "")
+    total_digits = len(cep)
+
+    if total_digits == 0:
+        return Reason.EMPTY
+
+    if not is_valid(cep=cep, raw=True, digits=total_digits):
+        return Reason.INVALID_LENGTH
 
-    for start, end in ranges.all_ranges():
-        if candidate >= start and candidate <= end:
-            return True
+    if not (cep.isascii() and cep.isdigit()):
+        return Reason.INVALID_CHARACTERS
+
+    return Reason.VALID
+
+
+def validate(cep: str, state: str | None = None) -> Reason:
+    """Check whether a CEP is valid, returning why it isn't.
+
+    Executes the same checks of ``is_valid_extended``: a CEP that is not part
+    of any of the ranges of ``CepRange`` (or of the range of ``state``, if
+    given) gets ``Reason.UNKNOWN_FEDERAL_UNIT``. A CEP with non-digit
+    characters gets ``Reason.INVALID_CHARACTERS`` instead of raising
+    ``ValueError``.
+    """
+    reason = __reason(cep)
+
+    if reason is not Reason.VALID:
+        return reason
+
+    ranges = CepRange()
+    candidate = int(__digits(cep))
+
+    if state is not None:
+        start, end = ranges.int_range_by_state(state)
+
+        if not start <= candidate <= end:
+            return Reason.UNKNOWN_FEDERAL_UNIT
+
+    elif ranges.state_of(candidate) is None:
+        return Reason.UNKNOWN_FEDERAL_UNIT
+
+    return Reason.VALID
+
+
+def validate_many(ceps):
+    """Batch version of ``validate``, without the ``state`` parameter.
+
+    ``ceps`` can be any iterable of strings or a NumPy array of 8 digits integers. Returns a NumPy array with the
+    ``Reason`` code of each CEP.
+
+    Requires NumPy.
+    """
+    np = numpy()
+
+    if isinstance(ceps, np.ndarray) and ceps.dtype.kind in "ui":
+        values = ceps.reshape(-1).astype(np.int64)
+        codes = np.where((values < 0) | (values > 99999999), Reason.INVALID_LENGTH, Reason.VALID).astype(np.uint8)
+    else:
+        reasons = []
+        values = []
+
+        for cep in ceps:
+            reason = __reason(cep)
+            reasons.append(reason)
+            values.append(int(__digits(cep)) if reason is Reason.VALID else -1)
+
+        codes = np.array(reasons, dtype=np.uint8)
+        values = np.array(values, dtype=np.int64)
+
+    codes[(codes == Reason.VALID) & (CepRange().states_of(values) == "")] = Reason.UNKNOWN_FEDERAL_UNIT
+    return codes
+
+
+def state_of(cep: str) -> str | None:
+    """Return the code of the state a CEP belongs to, based on the ranges published by Correios.
+
+    Returns ``None`` if the CEP is not part of any of the ranges. If the CEP is not valid, the ``InvalidCepError``
+    exception is raised.
+    """
+    return CepRange().state_of(int(__digits(cep)))
+
+
+def is_in_range(cep: str) -> bool:
+    """Check whether a CEP is part of the ranges published by Correios.
+
+    Unlike ``state_of``, ``False`` is returned for invalid CEPs instead of
+    raising an exception.
+    """
+    try:
+        return CepRange().state_of(int(__digits(cep))) is not None
+    except InvalidCepError:
+        return False
+
+
+def state_of_many(ceps):
+    """Batch version of ``state_of``.
+
+    ``ceps`` can be any iterable of strings or a NumPy array of 8 digits integers. Returns a NumPy array of state
+    codes, where CEPs that are invalid or not part of any range have an empty string instead.
+
+    Requires NumPy.
+    """
+    np = numpy()
+
+    if not (isinstance(ceps, np.ndarray) and ceps.dtype.kind in "ui"):
+        values = []
+
+        for cep in ceps:
+            try:
+                values.append(int(__digits(cep)))
+            except (InvalidCepError, ValueError):
+                values.append(-1)
+
+        ceps = np.array(values, dtype=np.int64)
+
+    return CepRange().states_of(ceps)
 
-    return False
 
 class InvalidCepError(InvalidIdError):
     """Exception for an invalid CEP."""
-    def id_type(self, cep: str):
-        return f"Invalid CEP code '{cep}'"
+    def __init__(self, cep: str) -> None:
+        super().__init__(id=cep)
 
+    def id_type(self):
+        return "CEP"
 
-def format(cep: str) -> str:
-    """Applies typical 00000-000 formatting to CEP."""
+
+caches = Caches("parse", "format")
+"""Optional caches of ``parse`` and ``format``, disabled by default. See
+``brazilian_ids.functions.caching``."""
+
+
+def __digits(cep: str) -> str:
+    """Remove the separator from a CEP and pad it to 8 digits.
+
+    Raises ``InvalidCepError`` if the CEP has a wrong length or other characters than digits."""
     cep = cep.replace("-", "")
     total_digits = len(cep)
 
-    if not is_valid(cep=cep, raw=False, digits=total_digits):
+    if not is_valid(cep=cep, raw=True, digits=total_digits) or not (cep.isascii() and cep.isdigit()):
         raise InvalidCepError(cep)
 
     if total_digits == 4 or total_digits == 5:
-        cep = "0" * (5 - total_digits) + cep + "000"
-    else:
-        cep = "0" * (8 - total_digits) + cep
+        return "0" * (5 - total_digits) + cep + "000"
+
+    return "0" * (8 - total_digits) + cep
 
-    return "{0}-{1}".format(cep[:-3], cep[-3:])
+
+def format(cep: str) -> str:
+    """Applies typical 00000-000 formatting to CEP."""
+    cep = __digits(cep)
+    cache = caches.format
+
+    if cache is not None:
+        formatted = cache.get(cep)
+
+        if formatted is not MISSING:
+            return formatted
+
+    formatted = "{0}-{1}".format(cep[:-3], cep[-3:])
+
+    if cache is not None:
+        cache.put(cep, formatted)
+
+    return formatted
 
 
 def parse(cep: str) -> CEP:
     """Split a CEP into region, sub-region, sector, subsector, division."""
-    fmtcep = format(cep)
+    digits = __digits(cep)
+    cache = caches.parse
+
+    if cache is not None:
+        parsed = cache.get(digits)
+
+        if parsed is not MISSING:
+            return parsed
+
+    fmtcep = "{0}-{1}".format(digits[:-3], digits[-3:])
     geo = [fmtcep[:i] for i in range(1, 6)]
     suffix = fmtcep[-3:]
 
-    return CEP(
+    parsed = CEP(
         formatted_cep=fmtcep,
         region=int(geo[0]),
         sub_region=int(geo[1]),
@@ -225,3 +532,16 @@ def parse(cep: str) -> CEP:
         division=int(geo[4]),
         suffix=suffix,
     )
+
+    if cache is not None:
+        cache.put(digits, parsed)
+
+    return parsed
+
+
+def parse_compact(cep: str) -> CompactCEP:
+    """Convert a CEP into a ``CompactCEP``.
+
+    Unlike ``parse``, no string is kept: only the 8 digits integer.
+    """
+    return CompactCEP(int(__digits(cep)))
@@ -0,0 +1,293 @@
+"""On-disk index of records (like addresses and localities) by CEP.
+
+Correios doesn't publish its CEP base, but a licensed copy of it (or any other
+CSV file with a CEP column) can be compiled by ``build_index`` into a binary
+file, which ``CepIndex`` reads with ``mmap``. Opening the index doesn't load or
+parse the records: each lookup is a binary search over the sorted CEPs,
+followed by the decoding of the single record found.
+
+The CEPs are normalized with ``parse_compact``, so they can be given with or
+without the separator, and abbreviated. Only CEPs that are part of one of the
+state ranges of ``CepRange`` are accepted.
+
+The file has the following layout, with all integers in little endian:
+
+- a header with a signature, the number of fields, the size of each record
+  and the number of records;
+- the name and the width in bytes of each field;
+- the CEPs, as sorted unsigned 32 bits integers;
+- the records, in the same order of the CEPs, with each field encoded as
+  UTF-8 and padded with null bytes to the width of the field.
+
+Each section starts at a multiple of 8 bytes.
+"""
+
+import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
+
+from brazilian_ids.functions.location.cep import CepRange, InvalidCepError, parse_compact
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import IO
+
+MAGIC = b"BRCEPIX1"
+_HEADER = struct.Struct("<8sIIQ")
+_FIELD = struct.Struct("<HI")
+
+
+class InvalidCepIndexError(ValueError):
+    """Error for a file that wasn't created by ``build_index``, or that is truncated."""
+
+    def __init__(self, path: "str | os.PathLike") -> None:
+        super().__init__(f"'{os.fspath(path)}' is not a valid CEP index")
+        self.path = path
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _key(cep: "str | int") -> int:
+    """Convert a CEP into its 8 digits integer, accepting also ``CEP`` and ``CompactCEP`` instances.
+
+    Raises ``InvalidCepError`` for a string that isn't a valid CEP."""
+    if isinstance(cep, int):
+        return cep
+
+    if isinstance(cep, str):
+        try:
+            return parse_compact(cep.strip()).sort_key
+        except InvalidCepError:
+            raise
+        except ValueError:
+            raise InvalidCepError(cep) from None
+
+    return cep.sort_key
+
+
+def build_index(
+    source: "str | os.PathLike | IO[str]",
+    path: "str | os.PathLike",
+    cep_column: str = "cep",
+    fields: Iterable[str] | None = None,
+    skip_invalid: bool = False,
+    **csv_options,
+) -> int:
+    """Compile a CSV file into an index that can be opened with ``CepIndex``.
+
+    ``source`` is either the path of the CSV file, or a text stream with its
+    contents. The first row must have the names of the columns. ``fields``
+    are the columns to be stored in the index, by default all of them but the
+    ``cep_column``. Other keyword arguments are passed to ``csv.reader``.
+
+    A CEP that is invalid, or not part of any of the ranges of ``CepRange``,
+    raises ``InvalidCepError``, unless ``skip_invalid`` is ``True``. If a CEP
+    is repeated, the last row wins.
+
+    Returns the number of records in the index.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline="", encoding="utf-8") as stream:
+            return build_index(stream, path, cep_column, fields, skip_invalid, **csv_options)
+
+    reader = csv.reader(source, **csv_options)
+    header = next(reader, [])
+
+    if cep_column not in header:
+        raise ValueError(f"The column '{cep_column}' is not available in the CSV header")
+
+    if fields is None:
+        fields = [name for name in header if name != cep_column]
+    else:
+        fields = list(fields)
+        missing = set(fields) - set(header)
+
+        if missing:
+            raise ValueError(f"The columns {', '.join(sorted(missing))} are not available in the CSV header")
+
+    ranges = CepRange()
+    cep_position = header.index(cep_column)
+    padding = [""] * len(header)
+    positions = [header.index(name) for name in fields]
+    records: dict[int, tuple[bytes, ...]] = {}
+
+    for row in reader:
+        if len(row) < len(header):
+            row += padding[len(row):]
+
+        try:
+            key = _key(row[cep_position])
+        except (InvalidCepError, ValueError):
+            key = None
+
+        if key is None or ranges.state_of(key) is None:
+            if skip_invalid:
+                continue
+
+            raise InvalidCepError(row[cep_position])
+
+        records[key] = tuple([row[position].encode() for position in positions])
+
+    keys = array("I", sorted(records))
+    widths = [max(map(len, map(itemgetter(i), records.values())), default=0) for i in range(len(fields))]
+    # the "s" format pads the fields with null bytes
+    record = struct.Struct("<" + "".join(f"{width}s" for width in widths))
+    names = [name.encode("utf-8") for name in fields]
+
+    if sys.byteorder != "little":
+        keys.byteswap()
+
+    with open(path, "wb") as stream:
+        stream.write(_HEADER.pack(MAGIC, len(fields), record.size, len(keys)))
+
+        for name, width in zip(names, widths):
+            stream.write(_FIELD.pack(len(name), width))
+            stream.write(name)
+
+        stream.write(bytes(_aligned(stream.tell()) - stream.tell()))
+        stream.write(keys)
+        stream.write(bytes(_aligned(stream.tell()) - stream.tell()))
+        stream.writelines(record.pack(*records[key]) for key in sorted(records))
+
+    return len(keys)
+
+
+class CepIndex:
+    """Read only mapping of CEPs to the records of an index created by ``build_index``.
+
+    The CEPs can be given as strings (with or without the separator), 8
+    digits integers, ``CEP`` or ``CompactCEP`` instances. The records are
+    returned as dictionaries with the fields of the index.
+
+    Call ``close``, or use the index as a context manager, to release the file.
+    """
+
+    __slots__ = ("__mmap", "__keys", "__fields", "__record_size", "__records_offset")
+
+    def __init__(self, path: "str | os.PathLike") -> None:
+        with open(path, "rb") as stream:
+            size = os.fstat(stream.fileno()).st_size
+
+            if size < _HEADER.size:
+                raise InvalidCepIndexError(path)
+
+            self.__mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self.__read_header(path, size)
+        except (InvalidCepIndexError, struct.error, UnicodeDecodeError):
+            self.__mmap.close()
+            raise InvalidCepIndexError(path)
+
+    def __read_header(self, path: "str | os.PathLike", size: int) -> None:
+        magic, total_fields, self.__record_size, total = _HEADER.unpack_from(self.__mmap, 0)
+
+        if magic != MAGIC:
+            raise InvalidCepIndexError(path)
+
+        offset = _HEADER.size
+        fields = []
+
+        for _ in range(total_fields):
+            length, width = _FIELD.unpack_from(self.__mmap, offset)
+            offset += _FIELD.size
+            fields.append((self.__mmap[offset:offset + length].decode("utf-8"), width))
+            offset += length
+
+        keys_offset = _aligned(offset)
+        self.__records_offset = _aligned(keys_offset + total * 4)
+
+        if size != self.__records_offset + total * self.__record_size:
+            raise InvalidCepIndexError(path)
+
+        self.__fields = tuple(fields)
+
+        self.__keys: array | memoryview
+
+        if sys.byteorder == "little":
+            self.__keys = memoryview(self.__mmap)[keys_offset:keys_offset + total * 4].cast("I")
+        else:
+            keys = array("I")
+            keys.frombytes(self.__mmap[keys_offset:keys_offset + total * 4])
+            keys.byteswap()
+            self.__keys = keys
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Return the names of the fields of the records."""
+        return tuple(name for name, _ in self.__fields)
+
+    def __position(self, cep: "str | int") -> int:
+        """Return the position of a CEP in the index, or -1 if it isn't there."""
+        key = _key(cep)
+        position = bisect_left(self.__keys, key)
+
+        if position < len(self.__keys) and self.__keys[position] == key:
+            return position
+
+        return -1
+
+    def __record(self, position: int) -> dict[str, str]:
+        record = {}
+        offset = self.__records_offset + position * self.__record_size
+
+        for name, width in self.__fields:
+            record[name] = self.__mmap[offset:offset + width].rstrip(b"\0").decode("utf-8")
+            offset += width
+
+        return record
+
+    def get(self, cep: "str | int", default: dict[str, str] | None = None) -> dict[str, str] | None:
+        """Return the record of a CEP, or ``default`` if it isn't in the index.
+
+        An invalid CEP raises ``InvalidCepError``.
+        """
+        position = self.__position(cep)
+        return default if position < 0 else self.__record(position)
+
+    def __getitem__(self, cep: "str | int") -> dict[str, str]:
+        position = self.__position(cep)
+
+        if position < 0:
+            raise KeyError(cep)
+
+        return self.__record(position)
+
+    def __contains__(self, cep: object) -> bool:
+        try:
+            return self.__position(cep) >= 0  # type: ignore[arg-type]
+        except (InvalidCepError, AttributeError, TypeError):
+            return False
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __iter__(self) -> Iterator[str]:
+        """Go through the CEPs of the index in ascending order, formatted."""
+        return ("{0:05d}-{1:03d}".format(*divmod(key, 1000)) for key in self.__keys)
+
+    def close(self) -> None:
+        """Release the file of the index, which can't be used afterwards."""
+        if isinstance(self.__keys, memoryview):
+            self.__keys.release()
+
+        self.__keys = array("I")
+        self.__mmap.close()
+
+    def __enter__(self) -> "CepIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self):
+        return "{0}(fields={1}, size={2})".format(self.__class__.__name__, list(self.fields), len(self))
@@ -5,12 +5,22 @@ where those digits are invalid.
 
 This module contains those municipio codes in the ``INVALID`` ``dict``.
 
+The complete list of municípios codes and names published by IBGE is shipped
+with this package as a compressed resource, which is only loaded on the first
+use of the ``MunicipioTable`` class. The list was taken from the IBGE tables
+used by NF-e.
+
 See also:
 - `'Nota ténica 2008' <http://www.sefaz.al.gov.br/nfe/notas_tecnicas/NT2008.004.pdf>`_
 - `IBGE <https://www.ibge.gov.br/explica/codigos-dos-municipios.php>`_
 """
 
+import unicodedata
+from bisect import bisect_left
+
 from brazilian_ids.functions.exceptions import InvalidIdLengthError
+from brazilian_ids.functions.util import Singleton, digits_matrix_lengths, numpy
+from brazilian_ids.functions.validation import Reason, _codes, _length_checks, _length_reason
 
 
 class InvalidMunicipioFederalUnitError(ValueError):
@@ -19,40 +29,121 @@ class InvalidMunicipioFederalUnitError(ValueError):
         super().__init__(f"The federal unit code '{federal_unit}' is invalid")
 
 
+FEDERAL_UNITS = {
+    "11": "Rondônia",
+    "12": "Acre",
+    "13": "Amazonas",
+    "14": "Roraima",
+    "15": "Pará",
+    "16": "Amapá",
+    "17": "Tocantins",
+    "21": "Maranhão",
+    "22": "Piauí",
+    "23": "Ceará",
+    "24": "Rio Grande do Norte",
+    "25": "Paraíba",
+    "26": "Pernambuco",
+    "27": "Alagoas",
+    "28": "Sergipe",
+    "29": "Bahia",
+    "31": "Minas Gerais",
+    "32": "Espírito Santo",
+    "33": "Rio de Janeiro",
+    "35": "São Paulo",
+    "41": "Paraná",
+    "42": "Santa Catarina",
+    "43": "Rio Grande do Sul",
+    "50": "Mato Grosso do Sul",
+    "51": "Mato Grosso",
+    "52": "Goiás",
+    "53": "Distrito Federal",
+}
+"""The federal units (UF) codes used by IBGE and their names."""
+
+
+def _normalize_name(name: str) -> str:
+    """Remove accents and case from a name, to make it searchable."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+class MunicipioTable(metaclass=Singleton):
+    """Registry of all the municípios codes and names published by IBGE.
+
+    The data is loaded from the compressed resource shipped with the package
+    when the class is instantiated for the first time. Since this is a
+    singleton, that happens only once.
+    """
+
+    __slots__ = ("__names", "__index", "__by_federal_unit")
+
+    def __init__(self):
+        # only required to load the data, and slow to import
+        import gzip
+        from importlib import resources
+
+        raw = resources.files(__package__).joinpath("municipios.tsv.gz").read_bytes()
+        self.__names: dict[str, str] = {}
+        self.__by_federal_unit: dict[str, list[tuple[str, str]]] = {}
+
+        for line in gzip.decompress(raw).decode("utf-8").splitlines():
+            code, name = line.split("\t")
+            self.__names[code] = name
+            self.__by_federal_unit.setdefault(code[:2], []).append((code, name))
+
+        self.__index = sorted((_normalize_name(name), code) for code, name in self.__names.items())
+
+    def name(self, code: str) -> str | None:
+        """Return the name of a município given its complete code, or ``None`` if the code is unknown."""
+        return self.__names.get(code)
+
+    def search(self, prefix: str) -> list[tuple[str, str]]:
+        """Return the pairs of code and name of the municípios which name starts with ``prefix``.
+
+        The search ignores case and accents, and the results are sorted by name.
+        """
+        prefix = _normalize_name(prefix)
+        i = bisect_left(self.__index, (prefix, ""))
+        found = []
+
+        while i < len(self.__index) and self.__index[i][0].startswith(prefix):
+            code = self.__index[i][1]
+            found.append((code, self.__names[code]))
+            i += 1
+
+        return found
+
+    def by_federal_unit(self, federal_unit: str) -> list[tuple[str, str]]:
+        """Return the pairs of code and name of all municípios of a federal unit, sorted by code.
+
+        The ``federal_unit`` is the two digits code of the UF, see ``FEDERAL_UNITS``.
+        """
+        if federal_unit not in FEDERAL_UNITS:
+            raise InvalidMunicipioFederalUnitError(federal_unit)
+
+        return list(self.__by_federal_unit.get(federal_unit, ()))
+
+    def __contains__(self, code: object) -> bool:
+        return code in self.__names
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def __iter__(self):
+        return iter(self.__names.items())
+
+    def __repr__(self):
+        return "{0}, total of municípios: {1}".format(self.__class__.__name__, len(self.__names))
+
+
 class Municipio:
     """Representation of a município based on it's complete code."""
 
+    __slots__ = ("__fed_unit_code", "__muni", "__digits")
+
     @staticmethod
     def federal_units() -> dict[str, str]:
-        return {
-            "11": "Rondônia",
-            "12": "Acre",
-            "13": "Amazonas",
-            "14": "Roraima",
-            "15": "Pará",
-            "16": "Amapá",
-            "17": "Tocantins",
-            "21": "Maranhão",
-            "22": "Piauí",
-            "23": "Ceará",
-            "24": "Rio",
-            "25": "Paraíba",
-            "26": "Pernambuco",
-            "27": "Alagoas",
-            "28": "Sergipe",
-            "29": "Bahia",
-            "31": "Minas",
-            "32": "Espírito",
-            "33": "Rio",
-            "35": "São",
-            "41": "Paraná",
-            "42": "Santa",
-            "43": "Rio",
-            "50": "Mato",
-            "51": "Mato",
-            "52": "Goiás",
-            "53": "Distrito",
-        }
+        return FEDERAL_UNITS
 
     def __init__(
         self, unidade_federativa: str, municipio: str, control_digits: str
@@ -66,10 +157,8 @@ class Municipio:
         if len(control_digits) != 2:
             raise ValueError("The control digits must be 2")
 
-        try:
-            self.__federal_unit = self.federal_units()[unidade_federativa]
-        except KeyError as e:
-            raise InvalidMunicipioFederalUnitError(str(e))
+        if unidade_federativa not in FEDERAL_UNITS:
+            raise InvalidMunicipioFederalUnitError(unidade_federativa)
 
         self.__fed_unit_code = unidade_federativa
         self.__muni = municipio
@@ -78,7 +167,7 @@ class Municipio:
     @property
     def federal_unit(self) -> str:
         """Return the name of the Brazilian UF."""
-        return self.__federal_unit
+        return FEDERAL_UNITS[self.__fed_unit_code]
 
     @property
     def federal_unit_code(self) -> str:
@@ -96,6 +185,16 @@ class Municipio:
         """Return the 'control digits' created by IBGE."""
         return self.__digits
 
+    @property
+    def code(self) -> str:
+        """Return the complete município code."""
+        return self.__fed_unit_code + self.__muni + self.__digits
+
+    @property
+    def name(self) -> str | None:
+        """Return the name of the município, or ``None`` if the code is not registered by IBGE."""
+        return MunicipioTable().name(self.code)
+
     def __eq__(self, other: object) -> bool:
         if (
             not hasattr(other, "federal_unit_code")
@@ -111,9 +210,7 @@ class Municipio:
         )
 
     def __str__(self):
-        return "{0} in {1}".format(
-            self.__muni, self.federal_units()[self._fed_unit_code]
-        )
+        return "{0} in {1}".format(self.__muni, self.federal_unit)
 
     def __repr__(self):
         return 'Municipio(unidade_federativa="{0}", municipio="{1}", control_digits="{2}")'.format(
@@ -169,30 +266,147 @@ INVALID = {
 }
 
 
+__INVALID_STEMS = {code[:6]: digit for code, digit in INVALID.items()}
+VERIFICATION_DIGIT_WEIGHTS = (1, 2, 1, 2, 1, 2)
+
+
+def verification_digit(municipio: str) -> int:
+    """Calculate the verification (last) digit of a município code.
+
+    Only the first 6 digits are used. Each digit is multiplied by its weight,
+    the digits of the products are summed up and the verification digit is
+    what is missing to reach the next multiple of 10.
+
+    The codes in ``INVALID`` don't follow the algorithm, so their digit is
+    returned instead.
+    """
+    if len(municipio) < EXPECTED_DIGITS - 1:
+        raise InvalidMunicipioLengthError(municipio, expected_digits=EXPECTED_DIGITS - 1)
+
+    stem = municipio[:6]
+
+    if stem in __INVALID_STEMS:
+        return __INVALID_STEMS[stem]
+
+    total = 0
+
+    for w, k in zip(VERIFICATION_DIGIT_WEIGHTS, stem):
+        product = w * int(k)
+        total += product // 10 + product % 10
+
+    return (10 - total % 10) % 10
+
+
 def is_valid(municipio: str) -> bool:
     """Check whether município code is valid.
 
-    It's hard to check if a code is valid completely since the control digits
-    are defined internally by IBGE and, to this date, there are 5,570
-    municípios in Brazil.
+    Besides the length, the first digit and the federal unit code, the
+    verification digit is checked, taking into account the codes in
+    ``INVALID``.
+
+    It's hard to check if a code is valid completely since the codes are
+    always changing. If you want to check if a code is currently registered
+    by IBGE, use ``is_registered``.
+    """
+    return validate(municipio) is Reason.VALID
+
+
+def validate(municipio: str) -> Reason:
+    """Check whether município code is valid, returning why it isn't.
+
+    Executes the same checks of ``is_valid``, returning ``Reason.VALID``
+    (zero) or the reason of the first check that failed.
+    """
+    reason = _length_reason(len(municipio), EXPECTED_DIGITS)
+
+    if reason is not Reason.VALID:
+        return reason
+
+    if not (municipio.isascii() and municipio.isdigit()):
+        return Reason.INVALID_CHARACTERS
+
+    if municipio[0] == "0" or municipio[:2] not in FEDERAL_UNITS:
+        return Reason.UNKNOWN_FEDERAL_UNIT
+
+    if verification_digit(municipio) != int(municipio[6]):
+        return Reason.FIRST_DIGIT
+
+    return Reason.VALID
+
+
+def is_valid_many(municipios):
+    """Check whether each município code in a batch is valid.
+
+    ``municipios`` can be any iterable of strings or a NumPy array of strings
+    or unsigned integers. The same checks of ``is_valid`` are executed for the
+    whole batch at once, without creating any ``Municipio`` instance. Like
+    ``is_valid``, strings with non-digit characters are invalid.
 
-    This function tries to check more basic aspects that are possible without
-    copying a large amount of text to the Python code.
+    Returns a NumPy boolean array, with one element per município code.
 
-    Also, those codes are always changing.
+    Requires NumPy.
     """
-    if len(municipio) != EXPECTED_DIGITS:
-        return False
+    return validate_many(municipios) == Reason.VALID
 
-    if municipio[0] == "0":
-        return False
 
-    if municipio in INVALID.keys():  # need to check exceptions list
-        return True
+def validate_many(municipios):
+    """Batch version of ``validate``.
 
-    try:
-        parse(municipio)
-    except InvalidMunicipioFederalUnitError:
-        return False
+    Accepts the same ``municipios`` of ``is_valid_many``, but returns a NumPy
+    array with the ``Reason`` code of each município code, the same one
+    ``validate`` returns for it.
 
-    return True
+    Requires NumPy.
+    """
+    np = numpy()
+
+    if isinstance(municipios, np.ndarray) and municipios.dtype.kind in "ui":
+        digits, _, lengths = digits_matrix_lengths(municipios, width=EXPECTED_DIGITS, autopad=False)
+        invalid_characters = np.zeros(len(lengths), dtype=bool)
+    else:
+        if isinstance(municipios, np.ndarray):
+            municipios = municipios.reshape(-1).tolist()
+
+        # the strings are checked as they are, separators aren't removed
+        municipios = list(municipios)
+        lengths = np.array([len(municipio) for municipio in municipios], dtype=np.int64)
+        clean = [municipio.isascii() and municipio.isdigit() for municipio in municipios]
+        invalid_characters = ~np.array(clean, dtype=bool)
+        digits, _, _ = digits_matrix_lengths(
+            [municipio if ok else "" for municipio, ok in zip(municipios, clean)],
+            width=EXPECTED_DIGITS,
+            autopad=False,
+        )
+
+    weights = np.array(VERIFICATION_DIGIT_WEIGHTS, dtype=np.int64)
+    products = digits[:, :6] * weights
+    total = (products // 10 + products % 10).sum(axis=1)
+    computed = (10 - total % 10) % 10
+
+    # the codes with the same stem of the ones in INVALID get their digit, like in verification_digit
+    stems = digits[:, :6] @ (10 ** np.arange(5, -1, -1, dtype=np.int64))
+    invalid_stems, invalid_digits = np.array(
+        sorted((int(stem), digit) for stem, digit in __INVALID_STEMS.items()), dtype=np.int64
+    ).T
+    found = np.searchsorted(invalid_stems, stems).clip(max=len(invalid_stems) - 1)
+    computed = np.where(invalid_stems[found] == stems, invalid_digits[found], computed)
+
+    federal_units = np.array([int(code) for code in FEDERAL_UNITS], dtype=np.int64)
+
+    return _codes(
+        _length_checks(lengths, EXPECTED_DIGITS)
+        + [
+            (invalid_characters, Reason.INVALID_CHARACTERS),
+            ((digits[:, 0] == 0) | ~np.isin(stems // 10000, federal_units), Reason.UNKNOWN_FEDERAL_UNIT),
+            (computed != digits[:, 6], Reason.FIRST_DIGIT),
+        ]
+    )
+
+
+def is_registered(municipio: str) -> bool:
+    """Check whether a município code is part of the list published by IBGE.
+
+    This is stricter than ``is_valid``, since it requires the complete list of
+    municípios to be loaded (once). See ``MunicipioTable``.
+    """
+    return municipio in MunicipioTable()
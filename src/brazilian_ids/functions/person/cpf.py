@@ -2,11 +2,17 @@
 
 from random import randint
 
-from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.checksum import DIGIT_VALUES, WeightedSum, all_zeros
+from brazilian_ids.functions.util import NONDIGIT_REGEX, bytes_digits, digits_matrix_lengths, numpy
 from brazilian_ids.functions.exceptions import InvalidIdError, InvalidIdLengthError
+from brazilian_ids.functions.generation import DEFAULT_CHUNKSIZE, _digits, _generate
+from brazilian_ids.functions.validation import Reason, _codes, _length_checks, _length_reason
 
 
 CPF_WEIGHTS = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+EXPECTED_DIGITS = 11
+FORMAT_TEMPLATE = "###.###.###-##"
+__WEIGHTED_SUM = WeightedSum(CPF_WEIGHTS)
 
 
 class InvalidCpfTypeMixin:
@@ -44,24 +50,122 @@ def is_valid(cpf: str, autopad: bool = True):
     elif len(cpf) > 11:
         return False
 
-    if cpf == "00000000000":
-        return False
+    return _is_valid_digits(cpf)
+
+
+def _is_valid_digits(cpf: str) -> bool:
+    """Check whether an already clean and padded CPF is valid.
+
+    Expects a string with exactly 11 digits."""
+    return __reason(cpf) is Reason.VALID
+
+
+def __is_valid_sequence(digits: str | list[int]) -> bool:
+    """Check whether the 11 digits of a CPF, as a string or integers, are valid."""
+    return __reason(digits) is Reason.VALID
 
-    digits = [int(k) for k in cpf]  # identifier digits
+
+def __reason(digits: str | list[int]) -> Reason:
+    """Check the 11 digits of a CPF, as a string or integers, returning why they are invalid."""
     # validate the first check digit
-    cs = (sum(w * k for w, k in zip(CPF_WEIGHTS, digits[:-2])) % 11) % 10
+    cs = __WEIGHTED_SUM(digits)
 
-    if cs != digits[-2]:
-        return False  # first check digit is not correct
+    # only a CPF starting with 9 zeros can be all zeros
+    if cs == 0 and all_zeros(digits):
+        return Reason.ALL_ZEROS
 
-    # validate the second check digit
-    cs = (sum(w * k for w, k in zip(CPF_WEIGHTS, digits[1:-1])) % 11) % 10
+    if cs % 11 % 10 != DIGIT_VALUES[digits[9]]:
+        return Reason.FIRST_DIGIT
 
-    if cs != digits[-1]:
-        return False  # second check digit is not correct
+    # validate the second check digit
+    if __WEIGHTED_SUM(digits[1:]) % 11 % 10 != DIGIT_VALUES[digits[10]]:
+        return Reason.SECOND_DIGIT
 
     # both check digits are correct
-    return True
+    return Reason.VALID
+
+
+def validate(cpf: str, autopad: bool = True) -> Reason:
+    """Check whether CPF is valid, returning why it isn't.
+
+    Returns ``Reason.VALID`` (zero) for the same CPFs accepted by ``is_valid``,
+    or the reason of the first check that failed. Unlike ``is_valid``, no
+    exception is raised when padding an invalid CPF.
+    """
+    cpf = NONDIGIT_REGEX.sub("", cpf)
+    reason = _length_reason(len(cpf), EXPECTED_DIGITS, autopad)
+
+    if reason is not Reason.VALID:
+        return reason
+
+    return __reason(cpf.zfill(EXPECTED_DIGITS))
+
+
+def is_valid_bytes(cpf: bytes | bytearray | memoryview, autopad: bool = True) -> bool:
+    """Check whether a CPF given as bytes is valid.
+
+    Works directly on ``bytes``, ``bytearray`` or ``memoryview`` slices (for
+    example, from a memory mapped file) without decoding them to ``str``.
+    Unlike ``is_valid``, an invalid CPF that needs padding just returns
+    ``False``.
+    """
+    digits = bytes_digits(cpf)
+
+    if len(digits) < 11:
+        if not autopad or not digits:
+            return False
+        digits = [0] * (11 - len(digits)) + digits
+
+    elif len(digits) > 11:
+        return False
+
+    return __is_valid_sequence(digits)
+
+
+def is_valid_many(cpfs, autopad: bool = True):
+    """Check whether each CPF in a batch is valid.
+
+    ``cpfs`` can be any iterable of strings, or a NumPy array of strings or
+    unsigned integers. Returns a NumPy boolean array, with one element per CPF.
+
+    Both check digits are computed for the whole batch at once, using matrix
+    products against ``CPF_WEIGHTS``. Unlike ``is_valid``, no exception is
+    raised: CPFs that can't be padded are just marked as invalid.
+
+    Requires NumPy.
+    """
+    return validate_many(cpfs, autopad=autopad) == Reason.VALID
+
+
+def validate_many(cpfs, autopad: bool = True):
+    """Batch version of ``validate``.
+
+    Accepts the same ``cpfs`` of ``is_valid_many``, but returns a NumPy array
+    with the ``Reason`` code of each CPF.
+
+    Requires NumPy.
+    """
+    digits, _, lengths = digits_matrix_lengths(cpfs, width=EXPECTED_DIGITS, autopad=autopad)
+    first, second = __verification_digits_matrix(digits)
+    return _codes(
+        _length_checks(lengths, EXPECTED_DIGITS, autopad)
+        + [
+            (~digits.any(axis=1), Reason.ALL_ZEROS),
+            (first != digits[:, 9], Reason.FIRST_DIGIT),
+            (second != digits[:, 10], Reason.SECOND_DIGIT),
+        ]
+    )
+
+
+def __verification_digits_matrix(digits):
+    """Compute both check digits for every row of a matrix of CPF digits.
+
+    Only the first 9 columns are used."""
+    np = numpy()
+    weights = np.array(CPF_WEIGHTS, dtype=np.int64)
+    first = (digits[:, :9] @ weights) % 11 % 10
+    second = (digits[:, 1:9] @ weights[:-1] + first * weights[-1]) % 11 % 10
+    return (first, second)
 
 
 def verification_digits(cpf: str) -> tuple[int, int]:
@@ -75,12 +179,11 @@ def verification_digits(cpf: str) -> tuple[int, int]:
     if len(cpf) < 9:
         raise InvalidCpfLengthError(cpf)
 
-    digits = [int(k) for k in cpf[:10]]
     # find the first check digit
-    cs = (sum(w * k for w, k in zip(CPF_WEIGHTS, digits)) % 11) % 10
+    cs = __WEIGHTED_SUM(cpf) % 11 % 10
     # find the second check digit
-    digits.append(cs)
-    return (cs, ((sum(w * k for w, k in zip(CPF_WEIGHTS, digits[1:])) % 11) % 10))
+    digits = cpf[:10] + str(cs)
+    return (cs, __WEIGHTED_SUM(digits[1:]) % 11 % 10)
 
 
 def format(cpf: str) -> str:
@@ -112,3 +215,36 @@ def random(formatted: bool = True) -> str:
     if formatted:
         return format(cpf)
     return cpf
+
+
+def __complete(stems):
+    np = numpy()
+    digits = _digits(stems + 1, 9)
+    return np.column_stack((digits, *__verification_digits_matrix(digits)))
+
+
+def generate_many(
+    n: int,
+    seed: int | None = None,
+    formatted: bool = False,
+    unique: bool = False,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+):
+    """Generate ``n`` random, valid CPFs.
+
+    Returns a generator of strings. The CPFs are generated in chunks of
+    ``chunksize``, and the same ``seed`` always generates the same CPFs. With
+    ``unique``, no CPF is repeated. To save them to a file, see
+    ``brazilian_ids.functions.generation.write``.
+
+    Requires NumPy.
+    """
+    return _generate(
+        n,
+        10**9 - 1,
+        __complete,
+        template=FORMAT_TEMPLATE if formatted else None,
+        seed=seed,
+        unique=unique,
+        chunksize=chunksize,
+    )
@@ -2,8 +2,17 @@
 
 from random import randint
 
-from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.checksum import DIGIT_VALUES, WeightedSum, all_zeros
+from brazilian_ids.functions.util import NONDIGIT_REGEX, bytes_digits, digits_matrix_lengths, numpy
 from brazilian_ids.functions.exceptions import InvalidIdError, InvalidIdLengthError
+from brazilian_ids.functions.generation import DEFAULT_CHUNKSIZE, _digits, _generate
+from brazilian_ids.functions.validation import Reason, _codes, _length_checks, _length_reason
+
+
+PIS_PASEP_WEIGHTS = [3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+EXPECTED_DIGITS = 11
+FORMAT_TEMPLATE = "###.####.###-#"
+__WEIGHTED_SUM = WeightedSum(PIS_PASEP_WEIGHTS)
 
 
 class InvalidPisPasedTypeMixin:
@@ -40,30 +49,121 @@ def is_valid(pis_pasep: str, autopad: bool = True) -> bool:
     elif len(pis_pasep) > 11:
         return False
 
-    if pis_pasep == "00000000000":
+    return _is_valid_digits(pis_pasep)
+
+
+def _is_valid_digits(pis_pasep: str) -> bool:
+    """Check whether an already clean and padded PIS/PASEP is valid.
+
+    Expects a string with exactly 11 digits."""
+    return __reason(pis_pasep) is Reason.VALID
+
+
+def __is_valid_sequence(digits: str | list[int]) -> bool:
+    """Check whether the 11 digits of a PIS/PASEP, as a string or integers, are valid."""
+    return __reason(digits) is Reason.VALID
+
+
+def __reason(digits: str | list[int]) -> Reason:
+    """Check the 11 digits of a PIS/PASEP, as a string or integers, returning why they are invalid."""
+    total = __WEIGHTED_SUM(digits)
+
+    # only a PIS/PASEP starting with 10 zeros can be all zeros
+    if total == 0 and all_zeros(digits):
+        return Reason.ALL_ZEROS
+
+    if DIGIT_VALUES[digits[-1]] != __check_digit(total):
+        return Reason.FIRST_DIGIT
+
+    return Reason.VALID
+
+
+def __checksum(digits: str | list[int]) -> int:
+    """Calculate the validation digit from the first 10 digits of a PIS/PASEP."""
+    return __check_digit(__WEIGHTED_SUM(digits))
+
+
+def __check_digit(total: int) -> int:
+    """Calculate the validation digit from the weighted sum of the first 10 digits."""
+    result = total % 11
+
+    if result < 2:
+        return 0
+
+    return 11 - result
+
+
+def validate(pis_pasep: str, autopad: bool = True) -> Reason:
+    """Check whether PIS/PASEP is valid, returning why it isn't.
+
+    Returns ``Reason.VALID`` (zero) for the same PIS/PASEP accepted by
+    ``is_valid``, or the reason of the first check that failed.
+    """
+    pis_pasep = NONDIGIT_REGEX.sub("", pis_pasep)
+    reason = _length_reason(len(pis_pasep), EXPECTED_DIGITS, autopad)
+
+    if reason is not Reason.VALID:
+        return reason
+
+    return __reason(pis_pasep.zfill(EXPECTED_DIGITS))
+
+
+def __checksum_matrix(digits):
+    """Calculate the validation digit for every row of a matrix of PIS/PASEP digits."""
+    np = numpy()
+    result = (digits[:, :10] @ np.array(PIS_PASEP_WEIGHTS, dtype=np.int64)) % 11
+    return np.where(result < 2, 0, 11 - result)
+
+
+def validate_many(pis_pasep, autopad: bool = True):
+    """Batch version of ``validate``.
+
+    ``pis_pasep`` can be any iterable of strings, or a NumPy array of strings
+    or unsigned integers. Returns a NumPy array with the ``Reason`` code of
+    each PIS/PASEP.
+
+    Requires NumPy.
+    """
+    digits, _, lengths = digits_matrix_lengths(pis_pasep, width=EXPECTED_DIGITS, autopad=autopad)
+    checksum = __checksum_matrix(digits)
+    return _codes(
+        _length_checks(lengths, EXPECTED_DIGITS, autopad)
+        + [
+            (~digits.any(axis=1), Reason.ALL_ZEROS),
+            (checksum != digits[:, 10], Reason.FIRST_DIGIT),
+        ]
+    )
+
+
+def is_valid_bytes(pis_pasep: bytes | bytearray | memoryview, autopad: bool = True) -> bool:
+    """Check whether a PIS/PASEP given as bytes is valid. Optionally pad if too
+    short.
+
+    Works directly on ``bytes``, ``bytearray`` or ``memoryview`` slices (for
+    example, from a memory mapped file) without decoding them to ``str``.
+    """
+    digits = bytes_digits(pis_pasep)
+
+    if len(digits) < 11:
+        if not autopad or not digits:
+            return False
+        digits = [0] * (11 - len(digits)) + digits
+
+    elif len(digits) > 11:
         return False
 
-    return int(pis_pasep[-1]) == validation_digit(pis_pasep)
+    return __is_valid_sequence(digits)
 
 
 def validation_digit(pis_pasep: str) -> int:
     """Calculate the validation (last) digit required to make a PIS/PASEP
     valid."""
     pis_pasep = NONDIGIT_REGEX.sub("", pis_pasep)
-    pis_weights = [3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
 
     if len(pis_pasep) < 10:
         raise InvalidPISPASEPLengthError(pis_pasep)
 
-    digits = [int(k) for k in pis_pasep[:11]]
-
-    # find check digit
-    result = sum(w * k for w, k in zip(pis_weights, digits)) % 11
-
-    if result < 2:
-        return 0
-
-    return 11 - result
+    return __checksum(pis_pasep)
 
 
 def format(pis_pasep: str) -> str:
@@ -94,3 +194,36 @@ def random(formatted=True):
     if formatted:
         return format(pis_pasep)
     return pis_pasep
+
+
+def __complete(stems):
+    np = numpy()
+    digits = _digits(stems + 1, 10)
+    return np.column_stack((digits, __checksum_matrix(digits)))
+
+
+def generate_many(
+    n: int,
+    seed: int | None = None,
+    formatted: bool = False,
+    unique: bool = False,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+):
+    """Generate ``n`` random, valid PIS/PASEPs.
+
+    Returns a generator of strings. The PIS/PASEPs are generated in chunks of
+    ``chunksize``, and the same ``seed`` always generates the same PIS/PASEPs.
+    With ``unique``, no PIS/PASEP is repeated. To save them to a file, see
+    ``brazilian_ids.functions.generation.write``.
+
+    Requires NumPy.
+    """
+    return _generate(
+        n,
+        10**10 - 1,
+        __complete,
+        template=FORMAT_TEMPLATE if formatted else None,
+        seed=seed,
+        unique=unique,
+        chunksize=chunksize,
+    )
@@ -15,8 +15,17 @@ See also:
 
 from random import randint
 
-from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.checksum import DIGIT_VALUES, WeightedSum, all_zeros
+from brazilian_ids.functions.util import NONDIGIT_REGEX, bytes_digits, digits_matrix_lengths, numpy
 from brazilian_ids.functions.exceptions import InvalidIdError, InvalidIdLengthError
+from brazilian_ids.functions.generation import DEFAULT_CHUNKSIZE, _digits, _generate
+from brazilian_ids.functions.validation import Reason, _codes, _length_checks, _length_reason
+
+
+CNO_WEIGHTS = [7, 4, 1, 8, 5, 2, 1, 6, 3, 7, 4]
+EXPECTED_DIGITS = 12
+FORMAT_TEMPLATE = "##.###.#####/##"
+__WEIGHTED_SUM = WeightedSum(CNO_WEIGHTS)
 
 
 class InvalidCnoTypeMixin:
@@ -53,23 +62,42 @@ def is_valid(cno: str, autopad: bool = True) -> bool:
     elif len(cno) > 12:
         return False
 
-    if cno == "000000000000":
-        return False
+    return _is_valid_digits(cno)
 
-    digits = [int(k) for k in cno]  # identifier digits
-    return verification_digit(str(digits[:-1])) == digits[-1]
 
+def _is_valid_digits(cno: str) -> bool:
+    """Check whether an already clean and padded CNO is valid.
 
-def verification_digit(cno: str, validate_length: bool = False) -> int:
-    """Calculate check digit from iterable of integers."""
-    cno = NONDIGIT_REGEX.sub("", cno)
+    Expects a string with exactly 12 digits."""
+    return __reason(cno) is Reason.VALID
 
-    if validate_length and len(cno) < 11:
-        raise InvalidCnoLengthError(cno=cno)
 
-    digits = [int(k) for k in cno[:12]]
-    cei_weights = [7, 4, 1, 8, 5, 2, 1, 6, 3, 7, 4]
-    digsum = sum(w * k for w, k in zip(cei_weights, digits))
+def __is_valid_sequence(digits: str | list[int]) -> bool:
+    """Check whether the 12 digits of a CNO, as a string or integers, are valid."""
+    return __reason(digits) is Reason.VALID
+
+
+def __reason(digits: str | list[int]) -> Reason:
+    """Check the 12 digits of a CNO, as a string or integers, returning why they are invalid."""
+    total = __WEIGHTED_SUM(digits)
+
+    # only a CNO starting with 11 zeros can be all zeros
+    if total == 0 and all_zeros(digits):
+        return Reason.ALL_ZEROS
+
+    if __check_digit(total) != DIGIT_VALUES[digits[-1]]:
+        return Reason.FIRST_DIGIT
+
+    return Reason.VALID
+
+
+def __checksum(digits: str | list[int]) -> int:
+    """Calculate the check digit from the first 11 digits of a CNO."""
+    return __check_digit(__WEIGHTED_SUM(digits))
+
+
+def __check_digit(digsum: int) -> int:
+    """Calculate the check digit from the weighted sum of the first 11 digits."""
     mod = sum(divmod(digsum % 100, 10)) % 10
 
     if mod == 0:
@@ -78,6 +106,78 @@ def verification_digit(cno: str, validate_length: bool = False) -> int:
     return 10 - mod
 
 
+def validate(cno: str, autopad: bool = True) -> Reason:
+    """Check whether CNO is valid, returning why it isn't.
+
+    Returns ``Reason.VALID`` (zero) for the same CNOs accepted by ``is_valid``,
+    or the reason of the first check that failed.
+    """
+    cno = NONDIGIT_REGEX.sub("", cno)
+    reason = _length_reason(len(cno), EXPECTED_DIGITS, autopad)
+
+    if reason is not Reason.VALID:
+        return reason
+
+    return __reason(cno.zfill(EXPECTED_DIGITS))
+
+
+def __checksum_matrix(digits):
+    """Calculate the check digit for every row of a matrix of CNO digits."""
+    np = numpy()
+    digsum = digits[:, :11] @ np.array(CNO_WEIGHTS, dtype=np.int64)
+    mod = (digsum % 100 // 10 + digsum % 10) % 10
+    return np.where(mod == 0, 0, 10 - mod)
+
+
+def validate_many(cnos, autopad: bool = True):
+    """Batch version of ``validate``.
+
+    ``cnos`` can be any iterable of strings, or a NumPy array of strings or
+    unsigned integers. Returns a NumPy array with the ``Reason`` code of each
+    CNO.
+
+    Requires NumPy.
+    """
+    digits, _, lengths = digits_matrix_lengths(cnos, width=EXPECTED_DIGITS, autopad=autopad)
+    checksum = __checksum_matrix(digits)
+    return _codes(
+        _length_checks(lengths, EXPECTED_DIGITS, autopad)
+        + [
+            (~digits.any(axis=1), Reason.ALL_ZEROS),
+            (checksum != digits[:, 11], Reason.FIRST_DIGIT),
+        ]
+    )
+
+
+def is_valid_bytes(cno: bytes | bytearray | memoryview, autopad: bool = True) -> bool:
+    """Check whether CNO given as bytes is valid. Optionally pad if too short.
+
+    Works directly on ``bytes``, ``bytearray`` or ``memoryview`` slices (for
+    example, from a memory mapped file) without decoding them to ``str``.
+    """
+    digits = bytes_digits(cno)
+
+    if len(digits) < 12:
+        if not autopad or not digits:
+            return False
+        digits = [0] * (12 - len(digits)) + digits
+
+    elif len(digits) > 12:
+        return False
+
+    return __is_valid_sequence(digits)
+
+
+def verification_digit(cno: str, validate_length: bool = False) -> int:
+    """Calculate check digit from iterable of integers."""
+    cno = NONDIGIT_REGEX.sub("", cno)
+
+    if validate_length and len(cno) < 11:
+        raise InvalidCnoLengthError(cno=cno)
+
+    return __checksum(cno)
+
+
 def format(cno: str) -> str:
     """Applies typical 00.000.00000/00 formatting to CEI."""
     cno = pad(cno)
@@ -106,3 +206,38 @@ def random(formatted: bool = True) -> str:
     if formatted:
         return format(cno)
     return cno
+
+
+def __complete(stems):
+    # like random, the first two digits go from 11 to 53
+    np = numpy()
+    digits = _digits(stems + 11 * 10**9, 11)
+    return np.column_stack((digits, __checksum_matrix(digits)))
+
+
+def generate_many(
+    n: int,
+    seed: int | None = None,
+    formatted: bool = False,
+    unique: bool = False,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+):
+    """Generate ``n`` random, valid CNOs.
+
+    Returns a generator of strings. The CNOs are generated in chunks of
+    ``chunksize``, and the same ``seed`` always generates the same CNOs.
+    With ``unique``, no CNO is repeated. Like ``random``, the
+    first two digits are always between 11 and 53. To save them to a file, see
+    ``brazilian_ids.functions.generation.write``.
+
+    Requires NumPy.
+    """
+    return _generate(
+        n,
+        43 * 10**9,
+        __complete,
+        template=FORMAT_TEMPLATE if formatted else None,
+        seed=seed,
+        unique=unique,
+        chunksize=chunksize,
+    )
@@ -12,12 +12,16 @@ SQL is also known as "número do contribuinte" or "cadastro do imóvel".
 
 from collections import deque
 
-from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.checksum import WeightedSum
+from brazilian_ids.functions.util import NONDIGIT_REGEX, bytes_digits, digits_matrix_lengths, numpy
 from brazilian_ids.functions.exceptions import InvalidIdError, InvalidIdLengthError
+from brazilian_ids.functions.validation import Reason, _codes, _length_checks, _length_reason
 
 EXPECTED_DIGITS = 11
 EXPECTED_DIGITS_WITHOUT_VERIFICATION = 10
+FORMAT_TEMPLATE = "###.###.####-#"
 VERIFICATION_DIGITS_WEIGHT = (10, 1, 2, 3, 4, 5, 6, 7, 8, 9)
+__WEIGHTED_SUM = WeightedSum(VERIFICATION_DIGITS_WEIGHT)
 
 
 class InvalidSqlTypeMixin:
@@ -53,7 +57,74 @@ def is_valid(sql: str) -> bool:
     if len(sql) != EXPECTED_DIGITS:
         return False
 
-    return sql[-1] == verification_digit(sql)
+    return _is_valid_digits(sql)
+
+
+def _is_valid_digits(sql: str) -> bool:
+    """Check whether an already clean SQL is valid.
+
+    Expects a string with exactly ``EXPECTED_DIGITS`` digits."""
+    return __checksum(sql) == int(sql[-1])
+
+
+def __checksum(digits: str | list[int]) -> int:
+    """Calculate the verification digit from the first 10 digits of a SQL."""
+    result = __WEIGHTED_SUM(digits) % 11
+
+    if result == 10:
+        return 1
+
+    return result
+
+
+def validate(sql: str) -> Reason:
+    """Check whether a SQL is valid, returning why it isn't.
+
+    Returns ``Reason.VALID`` (zero) for the same SQLs accepted by ``is_valid``,
+    or the reason of the first check that failed.
+    """
+    sql = NONDIGIT_REGEX.sub("", sql)
+    reason = _length_reason(len(sql), EXPECTED_DIGITS)
+
+    if reason is not Reason.VALID:
+        return reason
+
+    if not _is_valid_digits(sql):
+        return Reason.FIRST_DIGIT
+
+    return Reason.VALID
+
+
+def validate_many(sqls):
+    """Batch version of ``validate``.
+
+    ``sqls`` can be any iterable of strings, or a NumPy array of strings or
+    unsigned integers. Returns a NumPy array with the ``Reason`` code of each
+    SQL.
+
+    Requires NumPy.
+    """
+    np = numpy()
+    digits, _, lengths = digits_matrix_lengths(sqls, width=EXPECTED_DIGITS, autopad=False)
+    result = (digits[:, :10] @ np.array(VERIFICATION_DIGITS_WEIGHT, dtype=np.int64)) % 11
+    checksum = np.where(result == 10, 1, result)
+    return _codes(
+        _length_checks(lengths, EXPECTED_DIGITS) + [(checksum != digits[:, 10], Reason.FIRST_DIGIT)]
+    )
+
+
+def is_valid_bytes(sql: bytes | bytearray | memoryview) -> bool:
+    """Check if a given SQL, as bytes, is valid or not.
+
+    Works directly on ``bytes``, ``bytearray`` or ``memoryview`` slices (for
+    example, from a memory mapped file) without decoding them to ``str``.
+    """
+    digits = bytes_digits(sql)
+
+    if len(digits) != EXPECTED_DIGITS:
+        return False
+
+    return __checksum(digits) == digits[-1]
 
 
 def verification_digit(sql: str, validate_length: bool = False) -> str:
@@ -70,14 +141,7 @@ def verification_digit(sql: str, validate_length: bool = False) -> str:
         if len(sql) != EXPECTED_DIGITS_WITHOUT_VERIFICATION:
             raise InvalidSqlLengthError(sql)
 
-    digits = (int(i) for i in sql)
-    digits_times_weights = (w * d for w, d in zip(VERIFICATION_DIGITS_WEIGHT, digits))
-    result = (sum(digits_times_weights)) % 11
-
-    if result == 10:
-        return "1"
-
-    return str(result)
+    return str(__checksum(sql))
 
 
 def format(sql: str) -> str:
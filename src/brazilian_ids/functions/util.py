@@ -6,3 +6,125 @@ For internal use only.
 import re
 
 NONDIGIT_REGEX = re.compile(r"[^0-9]")
+NONDIGIT_BYTES = bytes(i for i in range(256) if not 0x30 <= i <= 0x39)
+
+
+def bytes_digits(value: bytes | bytearray | memoryview) -> list[int]:
+    """Convert the ASCII digits of a bytes-like object into a list of integers.
+
+    The digits are calculated directly from the bytes (``b - 0x30``), without
+    decoding them to ``str``. Only if non-digit bytes are found, a copy is
+    made with those removed through ``bytes.translate``.
+    """
+    digits = [b - 0x30 for b in value]
+
+    if digits and (min(digits) < 0 or max(digits) > 9):
+        digits = [b - 0x30 for b in bytes(value).translate(None, NONDIGIT_BYTES)]
+
+    return digits
+
+
+class Singleton(type):
+    """Implement the singleton pattern."""
+    _instances: dict[type, object] = {}
+
+    def __call__(cls, *args, **kwargs):
+        if cls not in cls._instances:
+            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+        return cls._instances[cls]
+
+
+def numpy():
+    """Import and return the NumPy module.
+
+    NumPy is an optional dependency, only required by the batch functions
+    (those ending with ``_many``). Install it with the ``numpy`` extra.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for batch validation, install it with 'pip install brazilian_ids[numpy]'"
+        ) from e
+
+    return numpy
+
+
+def digits_matrix(ids, width: int, autopad: bool = True, truncate: bool = False):
+    """Convert a batch of IDs into a (N, ``width``) matrix of integer digits.
+
+    ``ids`` can be any iterable of strings or a NumPy array of strings or
+    unsigned integers. Non-digit characters are removed from strings, and
+    shorter ones are padded with zeros at the left when ``autopad`` is
+    ``True``. Longer IDs are cut down to their first ``width`` digits when
+    ``truncate`` is ``True``, both strings and integers. Integers with up to
+    ``width`` digits are always considered as padded.
+
+    Returns a tuple with the matrix and a boolean mask telling which rows have
+    the expected length. Rows that don't are filled with zeros.
+    """
+    matrix, ok, _ = digits_matrix_lengths(ids, width, autopad=autopad, truncate=truncate)
+    return (matrix, ok)
+
+
+def digits_matrix_lengths(ids, width: int, autopad: bool = True, truncate: bool = False):
+    """Same as ``digits_matrix``, but also returns the number of digits of each ID.
+
+    The lengths are counted after removing the non-digit characters. Integers
+    out of the range of ``width`` digits are counted as having one digit more
+    than ``width``.
+    """
+    np = numpy()
+
+    if isinstance(ids, np.ndarray) and ids.dtype.kind in "ui":
+        if width > 19:
+            raise TypeError(f"Integers can't hold IDs with {width} digits, use strings instead")
+
+        values = ids.reshape(-1)
+
+        if truncate:
+            # drop the last digits of the longer integers, like the longer strings
+            limit = values.dtype.type(10**width)
+
+            while (longer := values >= limit).any():
+                values = np.where(longer, values // 10, values)
+
+        ok = values < 10**width
+
+        if ids.dtype.kind == "i":
+            ok &= values >= 0
+
+        values = np.where(ok, values, 0).astype(np.uint64)
+        powers = np.uint64(10) ** np.arange(width - 1, -1, -1, dtype=np.uint64)
+        matrix = ((values[:, None] // powers) % np.uint64(10)).astype(np.int64)
+        return (matrix, ok, np.where(ok, width, width + 1))
+
+    if isinstance(ids, np.ndarray):
+        ids = ids.reshape(-1).tolist()
+
+    blank = "0" * width
+    cleaned = []
+    valid = []
+    lengths = []
+
+    for id_ in ids:
+        id_ = NONDIGIT_REGEX.sub("", id_)
+        total = len(id_)
+        lengths.append(total)
+
+        if total == width:
+            cleaned.append(id_)
+            valid.append(True)
+        elif truncate and total > width:
+            cleaned.append(id_[:width])
+            valid.append(True)
+        elif autopad and 0 < total < width:
+            cleaned.append(id_.zfill(width))
+            valid.append(True)
+        else:
+            cleaned.append(blank)
+            valid.append(False)
+
+    buffer = "".join(cleaned).encode("ascii")
+    matrix = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, width).astype(np.int64) - 48
+    return (matrix, np.array(valid, dtype=bool), np.array(lengths, dtype=np.int64))
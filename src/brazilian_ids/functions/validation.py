@@ -0,0 +1,73 @@
+"""Reason codes for the ``validate`` functions of the ID modules.
+
+While ``is_valid`` only tells whether an ID is valid, ``validate`` also tells
+why it isn't, by returning one of the ``Reason`` codes. No exception is raised
+(or created) in the process, so it is cheap to use it with datasets that have
+lots of invalid IDs.
+
+The batch version, ``validate_many``, returns a NumPy array with the codes.
+"""
+
+from enum import IntEnum
+
+from brazilian_ids.functions.util import numpy
+
+
+class Reason(IntEnum):
+    """Why an ID is invalid.
+
+    ``VALID`` is zero, so any other code means that the ID is invalid, and a
+    batch of codes can be checked with ``codes == Reason.VALID``.
+
+    ``FIRST_DIGIT`` is also used by the IDs that have a single verification
+    digit.
+    """
+
+    VALID = 0
+    EMPTY = 1
+    INVALID_LENGTH = 2
+    INVALID_CHARACTERS = 3
+    ALL_ZEROS = 4
+    FIRST_DIGIT = 5
+    SECOND_DIGIT = 6
+    UNKNOWN_FEDERAL_UNIT = 7
+    INVALID_YEAR = 8
+    INVALID_SEGMENT = 9
+    INVALID_COURT = 10
+
+
+def _length_reason(total: int, expected: int, autopad: bool = False) -> Reason:
+    """Check the number of digits of an ID, returning ``Reason.VALID`` if it's acceptable."""
+    if total == 0:
+        return Reason.EMPTY
+
+    if total > expected or (total < expected and not autopad):
+        return Reason.INVALID_LENGTH
+
+    return Reason.VALID
+
+
+def _codes(checks):
+    """Build an array of reason codes from a list of ``(failed, reason)`` tuples.
+
+    ``failed`` is a boolean array telling which IDs failed the check. The
+    checks must be in the same order they are executed by ``validate``: an ID
+    gets the reason of the first check it failed.
+    """
+    np = numpy()
+    codes = np.zeros(len(checks[0][0]), dtype=np.uint8)
+
+    for failed, reason in reversed(checks):
+        codes[failed] = reason
+
+    return codes
+
+
+def _length_checks(lengths, expected: int, autopad: bool = False) -> list:
+    """Return the checks of ``_length_reason`` for a batch of ID lengths, to be used with ``_codes``."""
+    invalid = lengths > expected
+
+    if not autopad:
+        invalid |= lengths < expected
+
+    return [(lengths == 0, Reason.EMPTY), (invalid, Reason.INVALID_LENGTH)]
@@ -0,0 +1,406 @@
+"""Compact sets of CPFs or CNPJs, for blocklists and customer bases.
+
+A ``set`` of ``str`` costs about 70 bytes per ID. ``IdSet`` stores the IDs as
+integers, sorted and without repetitions, in an ``array('Q')``: 8 bytes per
+ID, so tens of millions of them fit in a few hundred megabytes.
+
+Membership is checked with a binary search, and the union, intersection and
+difference of two sets are calculated by merging both sorted arrays (with
+NumPy, if it's available, or in pure Python otherwise).
+
+A set can be saved to a binary file and loaded again with ``mmap``, in which
+case the IDs are read directly from the file, without being loaded in memory:
+
+>>> from brazilian_ids.idset import IdSet
+>>> blocklist = IdSet("cpf", ["529.982.247-25", "111.444.777-35"])
+>>> blocklist.save("blocklist.bin")
+>>> with IdSet.load("blocklist.bin") as loaded:
+...     "52998224725" in loaded
+True
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from brazilian_ids.functions.company import cnpj
+from brazilian_ids.functions.person import cpf
+from brazilian_ids.functions.util import NONDIGIT_REGEX, digits_matrix, numpy
+from brazilian_ids.functions.validation import Reason
+
+KINDS = {
+    "cpf": (cpf, cpf.EXPECTED_DIGITS),
+    "cnpj": (cnpj, cnpj.EXPECTED_DIGITS),
+}
+"""The ID types supported by ``IdSet``, with their module and number of digits."""
+
+MAGIC = b"BRIDSET1"
+BUILD_CHUNKSIZE = 100000
+_HEADER = struct.Struct("<8s8sQ")
+
+
+class InvalidIdSetFileError(ValueError):
+    """Error for a file that wasn't created by ``IdSet.save``, or that is truncated."""
+
+    def __init__(self, path: "str | os.PathLike") -> None:
+        super().__init__(f"'{os.fspath(path)}' is not a valid IdSet file")
+        self.path = path
+
+
+def _optional_numpy():
+    try:
+        return numpy()
+    except ImportError:
+        return None
+
+
+def _sorted_unique(values: array) -> array:
+    np = _optional_numpy()
+
+    if np is None:
+        return array("Q", sorted(set(values)))
+
+    result = array("Q")
+    result.frombytes(np.unique(np.frombuffer(values, dtype=np.uint64)).tobytes())
+    return result
+
+
+def _merge(a, b, only_a: bool, both: bool, only_b: bool) -> array:
+    """Merge two sorted arrays of unique integers.
+
+    The flags tell which integers are kept: those only in ``a``, those in both
+    arrays and those only in ``b``.
+    """
+    np = _optional_numpy()
+    result = array("Q")
+
+    if np is not None:
+        a = np.frombuffer(a, dtype=np.uint64)
+        b = np.frombuffer(b, dtype=np.uint64)
+        in_b = _members(np, b, a)
+
+        if only_a and both:
+            merged = a
+        elif only_a or both:
+            merged = a[in_b if both else ~in_b]
+        else:
+            merged = a[:0]
+
+        if only_b:
+            extra = b[~_members(np, a, b)]
+            merged = np.insert(merged, np.searchsorted(merged, extra), extra)
+
+        result.frombytes(merged.tobytes())
+        return result
+
+    i, j = 0, 0
+    total_a, total_b = len(a), len(b)
+
+    while i < total_a and j < total_b:
+        x, y = a[i], b[j]
+
+        if x < y:
+            if only_a:
+                result.append(x)
+            i += 1
+        elif x > y:
+            if only_b:
+                result.append(y)
+            j += 1
+        else:
+            if both:
+                result.append(x)
+            i += 1
+            j += 1
+
+    if only_a:
+        result.extend(a[i:])
+
+    if only_b:
+        result.extend(b[j:])
+
+    return result
+
+
+def _members(np, haystack, needles):
+    """Return a boolean mask telling which ``needles`` are in the sorted ``haystack``."""
+    if len(haystack) == 0:
+        return np.zeros(len(needles), dtype=bool)
+
+    positions = np.minimum(np.searchsorted(haystack, needles), len(haystack) - 1)
+    return haystack[positions] == needles
+
+
+class IdSet:
+    """A sorted set of CPFs or CNPJs, stored as 64 bits integers.
+
+    The IDs can be given formatted or not, and shorter ones are padded with
+    zeros when ``autopad`` is ``True``, like ``is_valid`` does. Each one is
+    validated when inserted: invalid IDs raise ``InvalidCpfError`` (or
+    ``InvalidCnpjError``), unless ``skip_invalid`` is ``True``, in which case
+    they are just ignored.
+
+    Adding IDs one at a time with ``add`` must shift the IDs after it, so
+    prefer giving all of them at once to the constructor, or to ``update``.
+
+    Iterating over the set returns the IDs in ascending order, as strings with
+    only digits.
+    """
+
+    __slots__ = ("__kind", "__width", "__module", "__values", "__mmap", "autopad", "skip_invalid")
+
+    def __init__(
+        self, kind: str, ids: Iterable[str | int] = (), autopad: bool = True, skip_invalid: bool = False
+    ) -> None:
+        if kind not in KINDS:
+            raise ValueError(f"IdSet supports only {', '.join(KINDS)}, not '{kind}'")
+
+        self.__kind = kind
+        self.__module, self.__width = KINDS[kind]
+        self.__mmap: mmap.mmap | None = None
+        self.autopad = autopad
+        self.skip_invalid = skip_invalid
+        self.__values: array | memoryview = self.__build(ids)
+
+    @classmethod
+    def _from_sorted(cls, kind: str, values, autopad: bool = True, skip_invalid: bool = False) -> "IdSet":
+        """Create a set from an array of integers already sorted and unique, without validating them."""
+        id_set = cls(kind, autopad=autopad, skip_invalid=skip_invalid)
+        id_set.__values = values
+        return id_set
+
+    @property
+    def kind(self) -> str:
+        return self.__kind
+
+    def __key(self, id_: str | int) -> int | None:
+        """Convert an ID into its integer, or ``None`` if it doesn't have the expected length."""
+        if isinstance(id_, int):
+            return id_ if 0 <= id_ < 10**self.__width else None
+
+        digits = NONDIGIT_REGEX.sub("", id_)
+
+        if digits and len(digits) < self.__width and self.autopad:
+            digits = digits.zfill(self.__width)
+
+        return int(digits) if len(digits) == self.__width else None
+
+    def __invalid(self, id_: str | int) -> None:
+        if self.__kind == "cpf":
+            raise cpf.InvalidCpfError(str(id_))
+
+        raise cnpj.InvalidCnpjError(str(id_))
+
+    def __valid_key(self, id_: str | int) -> int | None:
+        """Same as ``__key``, but also validates the ID, returning ``None`` for skipped ones."""
+        key = self.__key(id_)
+
+        if key is not None and self.__module._is_valid_digits(f"{key:0{self.__width}}"):
+            return key
+
+        if not self.skip_invalid:
+            self.__invalid(id_)
+
+        return None
+
+    def __build(self, ids: Iterable[str | int]) -> array:
+        values = array("Q")
+        np = _optional_numpy()
+
+        if np is None:
+            append = values.append
+
+            for id_ in ids:
+                key = self.__valid_key(id_)
+
+                if key is not None:
+                    append(key)
+
+            return _sorted_unique(values)
+
+        # same checks of __valid_key, but with validate_many on chunks of IDs
+        width = self.__width
+        powers = np.uint64(10) ** np.arange(width - 1, -1, -1, dtype=np.uint64)
+        iterator = iter(ids)
+
+        while chunk := list(islice(iterator, BUILD_CHUNKSIZE)):
+            texts = [id_ if isinstance(id_, str) else f"{id_:0{width}}" if id_ >= 0 else "" for id_ in chunk]
+            matrix, ok = digits_matrix(texts, width, autopad=self.autopad)
+            keys = matrix.astype(np.uint64) @ powers
+            valid = ok & (self.__module.validate_many(keys) == Reason.VALID)
+
+            if not self.skip_invalid and not valid.all():
+                self.__invalid(chunk[int(np.argmin(valid))])
+
+            values.frombytes(keys[valid].tobytes())
+
+        return _sorted_unique(values)
+
+    def __writable(self) -> array:
+        """Return the IDs as an array that can be changed, copying them from the file if it was loaded with mmap."""
+        if not isinstance(self.__values, array):
+            values = array("Q")
+            values.frombytes(self.__values.cast("B"))
+            self.close()
+            self.__values = values
+
+        return self.__values
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __iter__(self) -> Iterator[str]:
+        width = self.__width
+        return (f"{value:0{width}}" for value in self.__values)
+
+    def __contains__(self, id_: object) -> bool:
+        if not isinstance(id_, (str, int)):
+            return False
+
+        key = self.__key(id_)
+
+        if key is None:
+            return False
+
+        position = bisect_left(self.__values, key)
+        return position < len(self.__values) and self.__values[position] == key
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IdSet):
+            return NotImplemented
+
+        return self.__kind == other.__kind and self.__values == other.__values
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self):
+        return "{0}(kind={1!r}, size={2})".format(self.__class__.__name__, self.__kind, len(self))
+
+    def add(self, id_: str | int) -> None:
+        """Validate and add a single ID to the set."""
+        key = self.__valid_key(id_)
+
+        if key is None:
+            return
+
+        values = self.__writable()
+        position = bisect_left(values, key)
+
+        if position == len(values) or values[position] != key:
+            values.insert(position, key)
+
+    def update(self, ids: Iterable[str | int]) -> None:
+        """Validate and add several IDs to the set."""
+        other = self.__build(ids)
+        self.__values = _merge(self.__writable(), other, True, True, True)
+
+    def discard(self, id_: str | int) -> None:
+        """Remove an ID from the set, if it is there."""
+        key = self.__key(id_)
+
+        if key is None or key not in self:
+            return
+
+        values = self.__writable()
+        del values[bisect_left(values, key)]
+
+    def __combine(self, other: "IdSet", only_a: bool, both: bool, only_b: bool) -> "IdSet":
+        if not isinstance(other, IdSet) or other.__kind != self.__kind:
+            raise TypeError(f"Can only combine an IdSet of {self.__kind} with another one")
+
+        values = _merge(self.__values, other.__values, only_a, both, only_b)
+        return IdSet._from_sorted(self.__kind, values, autopad=self.autopad, skip_invalid=self.skip_invalid)
+
+    def union(self, other: "IdSet") -> "IdSet":
+        return self.__combine(other, True, True, True)
+
+    def intersection(self, other: "IdSet") -> "IdSet":
+        return self.__combine(other, False, True, False)
+
+    def difference(self, other: "IdSet") -> "IdSet":
+        return self.__combine(other, True, False, False)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def save(self, path: "str | os.PathLike") -> None:
+        """Save the set to a binary file, which can be loaded with ``load``.
+
+        The file has a 24 bytes header, with a signature, the ID type and the
+        number of IDs, followed by the IDs as little endian 64 bits integers.
+        """
+        values = self.__values
+
+        if sys.byteorder != "little":
+            values = array("Q", values)
+            values.byteswap()
+
+        with open(path, "wb") as stream:
+            stream.write(_HEADER.pack(MAGIC, self.__kind.encode("ascii"), len(values)))
+            stream.write(values)
+
+    @classmethod
+    def load(
+        cls, path: "str | os.PathLike", use_mmap: bool = True, autopad: bool = True, skip_invalid: bool = False
+    ) -> "IdSet":
+        """Load a set saved by ``save``.
+
+        With ``use_mmap``, the IDs are read from the file as they are needed,
+        instead of being copied to memory. Changing the set (with ``add``, for
+        example) copies them anyway. Call ``close``, or use the set as a
+        context manager, to release the file.
+        """
+        with open(path, "rb") as stream:
+            header = stream.read(_HEADER.size)
+
+            if len(header) != _HEADER.size:
+                raise InvalidIdSetFileError(path)
+
+            magic, kind, total = _HEADER.unpack(header)
+            kind = kind.rstrip(b"\0").decode("ascii", errors="replace")
+
+            if magic != MAGIC or kind not in KINDS or os.fstat(stream.fileno()).st_size != _HEADER.size + total * 8:
+                raise InvalidIdSetFileError(path)
+
+            values: array | memoryview
+
+            if use_mmap and sys.byteorder == "little":
+                mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+                values = memoryview(mapped)[_HEADER.size:].cast("Q")
+            else:
+                mapped = None
+                loaded = array("Q")
+                loaded.fromfile(stream, total)
+
+                if sys.byteorder != "little":
+                    loaded.byteswap()
+
+                values = loaded
+
+        id_set = cls._from_sorted(kind, values, autopad=autopad, skip_invalid=skip_invalid)
+        id_set.__mmap = mapped
+        return id_set
+
+    def close(self) -> None:
+        """Release the file of a set loaded with mmap, which can't be used afterwards."""
+        if self.__mmap is None:
+            return
+
+        if isinstance(self.__values, memoryview):
+            self.__values.release()
+
+        self.__values = array("Q")
+        self.__mmap.close()
+        self.__mmap = None
+
+    def __enter__(self) -> "IdSet":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,98 @@
+"""The ID types handled by the pipeline, the SQLite functions, the server and
+``parallel.validate``, and how a value of any of them is checked.
+
+All of them validate values the same way, through ``check`` (or its batch
+version, ``check_many``) and ``format_value``: values of any type are
+converted to strings, ``None`` is invalid and no exception is raised for
+invalid values. CEPs are checked with ``cep.validate``, since ``cep.is_valid``
+only checks the length.
+"""
+
+from collections.abc import Iterable
+from types import ModuleType
+
+from brazilian_ids.functions.company import cnpj
+from brazilian_ids.functions.labor_dispute import nupj
+from brazilian_ids.functions.location import cep, municipio
+from brazilian_ids.functions.person import cpf, pis_pasep
+from brazilian_ids.functions.real_state import cno, sql
+from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.validation import Reason
+
+KINDS: dict[str, ModuleType] = {
+    "cep": cep,
+    "cnpj": cnpj,
+    "cno": cno,
+    "cpf": cpf,
+    "municipio": municipio,
+    "nupj": nupj,
+    "pis_pasep": pis_pasep,
+    "sql": sql,
+}
+"""The supported ID types and the module that handles each of them."""
+
+
+class UnknownKindError(ValueError):
+    """Error for an ID type not available in ``KINDS``."""
+
+    def __init__(self, kind: str) -> None:
+        super().__init__(f"The ID type '{kind}' is not supported, use one of {', '.join(KINDS)}")
+        self.kind = kind
+
+
+def modules(columns: dict[str, str]) -> dict[str, ModuleType]:
+    """Map each column to the module of its ID type, raising ``UnknownKindError`` for unknown types."""
+    try:
+        return {column: KINDS[kind] for column, kind in columns.items()}
+    except KeyError as e:
+        raise UnknownKindError(e.args[0])
+
+
+def check(module: ModuleType, value) -> bool:
+    """Check whether a value is a valid ID of the type handled by ``module``, one of ``KINDS``.
+
+    ``None`` is invalid, any other value is converted to a string first.
+    """
+    if value is None:
+        return False
+
+    if module is cep:
+        # cep.is_valid checks only the length
+        return cep.validate(str(value)) is Reason.VALID
+
+    try:
+        return bool(module.is_valid(str(value)))
+    except ValueError:
+        # some is_valid functions raise when padding an invalid ID
+        return False
+
+
+# cpf.is_valid never accepts the CPFs it has to pad, see cpf.pad
+__BATCH_OPTIONS: dict[ModuleType, dict] = {cpf: {"autopad": False}}
+
+
+def check_many(module: ModuleType, values: Iterable) -> list[bool]:
+    """Batch version of ``check``, with the same result for each value.
+
+    Uses the ``validate_many`` function of ``module`` when NumPy is available,
+    falling back to ``check`` for each value otherwise.
+    """
+    strings = ["" if value is None else str(value) for value in values]
+
+    try:
+        codes = module.validate_many(strings, **__BATCH_OPTIONS.get(module, {}))
+    except ImportError:
+        return [check(module, value) for value in strings]
+
+    return (codes == Reason.VALID).tolist()
+
+
+def format_value(module: ModuleType, value) -> str:
+    """Format a valid ID with the ``format`` function of ``module``, after removing non-digits.
+
+    Returns an empty string if the value can't be formatted.
+    """
+    try:
+        return module.format(NONDIGIT_REGEX.sub("", str(value)))
+    except ValueError:
+        return ""
@@ -0,0 +1,271 @@
+"""Validation of large amounts of IDs using multiple processes.
+
+The validation functions are pure Python code, so a single process can use only
+one CPU core. The ``validate`` function splits the IDs in chunks and sends them
+to a pool of worker processes, which call the same ``is_valid`` functions of
+each ID module.
+
+The IDs are read from the given iterable only when there is room for more
+chunks, so even a huge file can be validated without being loaded in memory.
+
+For IDs with a fixed number of digits, ``validate_shared`` avoids sending the
+IDs to the workers at all: they are packed in a shared memory block, which the
+workers read in place, writing the results to a shared bitmap.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Generator, Iterable
+
+from brazilian_ids.functions.company import cnpj
+from brazilian_ids.functions.labor_dispute import nupj
+from brazilian_ids.functions.person import cpf, pis_pasep
+from brazilian_ids.functions.real_state import cno, sql
+from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.kinds import UnknownKindError, check, modules
+
+DEFAULT_CHUNKSIZE = 10000
+
+SHARED_KINDS: dict[str, tuple[int, bool]] = {
+    "cpf": (cpf.EXPECTED_DIGITS, True),
+    "cnpj": (cnpj.EXPECTED_DIGITS, True),
+    "pis_pasep": (pis_pasep.EXPECTED_DIGITS, True),
+    "cno": (cno.EXPECTED_DIGITS, True),
+    "sql": (sql.EXPECTED_DIGITS, False),
+    "nupj": (nupj.EXPECTED_DIGITS, True),
+}
+"""The ID types supported by ``validate_shared``, with their number of digits
+and whether shorter IDs are padded with zeros."""
+
+
+def _validate_chunk(kind: str, chunk: list[str]) -> list[bool]:
+    module = modules({kind: kind})[kind]
+    return [check(module, value) for value in chunk]
+
+
+def _chunks(values: Iterable[str], chunksize: int) -> Generator[list[str], None, None]:
+    iterator = iter(values)
+
+    while True:
+        chunk = list(islice(iterator, chunksize))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def validate(
+    values: Iterable[str],
+    kind: str = "cpf",
+    workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_pending: int | None = None,
+    executor: Executor | None = None,
+) -> Generator[bool, None, None]:
+    """Validate IDs of the same type in parallel, returning the results in the same order of ``values``.
+
+    ``kind`` is one of the types in ``brazilian_ids.kinds.KINDS``. The IDs
+    are sent to the worker processes in chunks of ``chunksize`` IDs, and at
+    most ``max_pending`` chunks (by default, twice the number of workers) are
+    waiting to be validated at any time.
+
+    ``workers`` defaults to the number of CPUs. With a single worker, the IDs
+    are validated in the current process. An existing ``executor`` can be
+    given instead, and it won't be shut down at the end.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    # fail before starting any process
+    modules({kind: kind})
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 and executor is None:
+        for chunk in _chunks(values, chunksize):
+            yield from _validate_chunk(kind, chunk)
+        return
+
+    max_pending = max_pending or workers * 2
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    pending: deque[Future] = deque()
+
+    try:
+        for chunk in _chunks(values, chunksize):
+            pending.append(pool.submit(_validate_chunk, kind, chunk))
+
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+        if executor is None:
+            pool.shutdown(wait=True)
+
+
+def _nupj_is_valid_bytes(field: memoryview) -> bool:
+    return nupj._is_valid_digits(NONDIGIT_REGEX.sub("", str(field, "ascii")))
+
+
+def _bytes_validator(kind: str) -> Callable[[memoryview], bool]:
+    if kind == "nupj":
+        return _nupj_is_valid_bytes
+
+    validators: dict[str, Callable[[memoryview], bool]] = {
+        "cpf": cpf.is_valid_bytes,
+        "cnpj": cnpj.is_valid_bytes,
+        "pis_pasep": pis_pasep.is_valid_bytes,
+        "cno": cno.is_valid_bytes,
+        "sql": sql.is_valid_bytes,
+    }
+    return validators[kind]
+
+
+def _validate_slice(kind: str, data_name: str, result_name: str, start: int, stop: int) -> None:
+    """Validate the IDs from ``start`` to ``stop`` of a shared block, setting their bits in the shared result bitmap.
+
+    ``start`` must be a multiple of 8, so no other worker writes to the same bytes of the bitmap."""
+    width = SHARED_KINDS[kind][0]
+    is_valid = _bytes_validator(kind)
+    data = SharedMemory(name=data_name)
+    result = SharedMemory(name=result_name)
+
+    try:
+        ids = data.buf
+        bitmap = result.buf
+
+        for base in range(start, stop, 8):
+            byte = 0
+
+            for bit in range(min(8, stop - base)):
+                offset = (base + bit) * width
+
+                if is_valid(ids[offset:offset + width]):
+                    byte |= 1 << bit
+
+            bitmap[base // 8] = byte
+
+        del ids, bitmap
+    finally:
+        data.close()
+        result.close()
+
+
+def pack(values: Iterable[str], kind: str) -> tuple[bytearray, list[bool]]:
+    """Pack IDs as fixed width ASCII digits, in the format expected by ``validate_shared``.
+
+    Returns the packed IDs and a list telling which IDs had a valid number of
+    digits. The ones that didn't are packed as zeros.
+    """
+    try:
+        width, autopad = SHARED_KINDS[kind]
+    except KeyError:
+        raise UnknownKindError(kind)
+
+    blank = "0" * width
+    packed = []
+    packable = []
+
+    for value in values:
+        digits = NONDIGIT_REGEX.sub("", value)
+        total = len(digits)
+
+        if total == width or (autopad and 0 < total < width):
+            packed.append(digits.zfill(width))
+            packable.append(True)
+        else:
+            packed.append(blank)
+            packable.append(False)
+
+    return (bytearray("".join(packed), "ascii"), packable)
+
+
+def validate_shared(
+    values: Iterable[str] | bytes | bytearray | memoryview,
+    kind: str = "cpf",
+    workers: int | None = None,
+    executor: Executor | None = None,
+) -> list[bool]:
+    """Validate IDs of the same type in parallel, without sending the IDs to the worker processes.
+
+    The IDs are copied to a ``multiprocessing.shared_memory`` block, with
+    exactly the number of digits of the ID type (see ``SHARED_KINDS``). Each
+    worker validates a disjoint slice of the block in place, with the
+    ``is_valid_bytes`` function of the ID module, and sets the bits of the
+    valid IDs in a shared bitmap.
+
+    ``values`` are either strings, which are packed with ``pack``, or IDs
+    already packed as ASCII digits (for example, a memory mapped file), which
+    are copied as they are.
+
+    Returns a list with the result of each ID, in the same order.
+    """
+    try:
+        width = SHARED_KINDS[kind][0]
+    except KeyError:
+        raise UnknownKindError(kind)
+
+    packed: bytearray | memoryview
+
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        packed = memoryview(values).cast("B")
+        packable = None
+
+        if len(packed) % width != 0:
+            raise ValueError(f"The packed IDs size must be a multiple of {width}")
+    else:
+        packed, packable = pack(values, kind)
+
+    total = len(packed) // width
+
+    if total == 0:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    # slices start at multiples of 8, so each byte of the bitmap has a single writer
+    step = -(-total // (workers * 8)) * 8
+    slices = [(start, min(start + step, total)) for start in range(0, total, step)]
+    bitmap_size = -(-total // 8)
+    data = SharedMemory(create=True, size=len(packed))
+    result = SharedMemory(create=True, size=bitmap_size)
+
+    try:
+        data.buf[:len(packed)] = packed
+
+        if workers == 1 and executor is None:
+            for start, stop in slices:
+                _validate_slice(kind, data.name, result.name, start, stop)
+        else:
+            pool = executor or ProcessPoolExecutor(max_workers=workers)
+
+            try:
+                futures = [
+                    pool.submit(_validate_slice, kind, data.name, result.name, start, stop) for start, stop in slices
+                ]
+
+                for future in futures:
+                    future.result()
+            finally:
+                if executor is None:
+                    pool.shutdown(wait=True)
+
+        bitmap = bytes(result.buf[:bitmap_size])
+    finally:
+        data.close()
+        data.unlink()
+        result.close()
+        result.unlink()
+
+    valid = [bool(bitmap[i >> 3] >> (i & 7) & 1) for i in range(total)]
+
+    if packable is not None:
+        valid = [a and b for a, b in zip(valid, packable)]
+
+    return valid
@@ -0,0 +1,181 @@
+"""Streaming validation of IDs stored in CSV or JSONL files.
+
+Rows are read, validated and written one at a time with generators, so memory
+usage doesn't depend on the size of the input.
+
+Each column to be validated is associated with an ID type (see ``KINDS``). For
+each of those columns, a new ``<column>_valid`` column is added to the rows,
+and also a ``<column>_formatted`` one if formatting was requested.
+
+This module is also used by the ``brazilian-ids`` command line program.
+"""
+
+import csv
+import json
+import time
+from typing import IO, Generator, Iterable
+
+# KINDS and UnknownKindError are part of the API of the pipeline too
+from brazilian_ids.kinds import KINDS, UnknownKindError, check, format_value, modules  # noqa: F401
+
+FORMATS = ("csv", "jsonl")
+
+
+class Stats:
+    """Counters of a validation run."""
+
+    __slots__ = ("rows", "valid", "invalid", "started", "finished")
+
+    def __init__(self, columns: Iterable[str]) -> None:
+        self.rows = 0
+        self.valid = {column: 0 for column in columns}
+        self.invalid = {column: 0 for column in columns}
+        self.started = time.perf_counter()
+        self.finished: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Return the seconds spent, up to now or until the run finished."""
+        end = time.perf_counter() if self.finished is None else self.finished
+        return end - self.started
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def report(self) -> str:
+        """Return a human readable summary of the counters."""
+        lines = [f"{self.rows} rows in {self.elapsed:.3f} seconds ({self.rows_per_second:,.0f} rows/sec)"]
+
+        for column in self.valid:
+            lines.append(f"{column}: {self.valid[column]} valid, {self.invalid[column]} invalid")
+
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return "{0}(rows={1}, elapsed={2:.3f})".format(self.__class__.__name__, self.rows, self.elapsed)
+
+
+def read_rows(stream: IO[str], input_format: str) -> Generator[dict, None, None]:
+    """Read rows, as ``dict`` instances, from a CSV (with header) or JSONL stream."""
+    if input_format == "csv":
+        yield from csv.DictReader(stream)
+    elif input_format == "jsonl":
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        raise ValueError(f"The format '{input_format}' is not supported, use one of {', '.join(FORMATS)}")
+
+
+def validate_rows(
+    rows: Iterable[dict],
+    columns: dict[str, str],
+    apply_format: bool = False,
+    stats: Stats | None = None,
+) -> Generator[dict, None, None]:
+    """Validate the given columns of each row.
+
+    ``columns`` maps each column name to the ID type it contains. The rows are
+    returned with the ``<column>_valid`` columns, and the ``<column>_formatted``
+    ones if ``apply_format`` is ``True`` (only for valid values of ID types
+    that have a ``format`` function).
+
+    If ``stats`` is given, its counters are updated as the rows go through.
+    """
+    column_modules = modules(columns)
+
+    for row in rows:
+        for column, module in column_modules.items():
+            value = row.get(column)
+            valid = check(module, value)
+            row[f"{column}_valid"] = valid
+
+            if apply_format and hasattr(module, "format"):
+                row[f"{column}_formatted"] = format_value(module, value) if valid else ""
+
+            if stats is not None:
+                if valid:
+                    stats.valid[column] += 1
+                else:
+                    stats.invalid[column] += 1
+
+        if stats is not None:
+            stats.rows += 1
+
+        yield row
+
+
+def added_columns(columns: dict[str, str], apply_format: bool = False) -> list[str]:
+    """Return the names of the columns added by ``validate_rows``."""
+    added = []
+
+    for column, module in modules(columns).items():
+        added.append(f"{column}_valid")
+
+        if apply_format and hasattr(module, "format"):
+            added.append(f"{column}_formatted")
+
+    return added
+
+
+def write_rows(rows: Iterable[dict], stream: IO[str], output_format: str, fieldnames: list[str] | None = None) -> None:
+    """Write rows to a CSV or JSONL stream.
+
+    For CSV, ``fieldnames`` defines the header. If not given, the keys of the
+    first row are used."""
+    if output_format == "jsonl":
+        for row in rows:
+            stream.write(json.dumps(row, ensure_ascii=False))
+            stream.write("\n")
+    elif output_format == "csv":
+        writer = None
+
+        if fieldnames is not None:
+            writer = csv.DictWriter(stream, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+
+        for row in rows:
+            if writer is None:
+                writer = csv.DictWriter(stream, fieldnames=list(row), extrasaction="ignore")
+                writer.writeheader()
+
+            writer.writerow(row)
+    else:
+        raise ValueError(f"The format '{output_format}' is not supported, use one of {', '.join(FORMATS)}")
+
+
+def run(
+    input_stream: IO[str],
+    output_stream: IO[str],
+    columns: dict[str, str],
+    input_format: str = "csv",
+    output_format: str | None = None,
+    apply_format: bool = False,
+) -> Stats:
+    """Read, validate and write all the rows from ``input_stream`` to ``output_stream``.
+
+    The output uses the same format of the input, unless ``output_format`` is
+    given. Returns the ``Stats`` of the run.
+    """
+    output_format = output_format or input_format
+    stats = Stats(columns)
+    fieldnames = None
+
+    if input_format == "csv" and output_format == "csv":
+        # the header must be known before the first row is validated
+        reader = csv.DictReader(input_stream)
+        rows: Iterable[dict] = reader
+        fieldnames = list(reader.fieldnames or []) + added_columns(columns, apply_format)
+    else:
+        rows = read_rows(input_stream, input_format)
+
+    write_rows(
+        validate_rows(rows, columns, apply_format=apply_format, stats=stats),
+        output_stream,
+        output_format,
+        fieldnames=fieldnames,
+    )
+    stats.finished = time.perf_counter()
+    return stats
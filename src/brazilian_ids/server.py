@@ -0,0 +1,451 @@
+"""HTTP/JSON server for validating, formatting and parsing IDs.
+
+Start it with ``python -m brazilian_ids.server`` (see ``--help`` for the
+options). It uses only the standard library: ``asyncio`` streams and a minimal
+HTTP/1.1 implementation, with keep-alive connections.
+
+Each ID type of ``kinds.KINDS`` has the following endpoints, all of them
+accepting a ``POST`` with a JSON object with either a single ``value`` or a
+list of ``values``:
+
+- ``/validate/<kind>``: ``{"valid": true, "reason": "VALID"}``, with the name
+  of the ``Reason`` returned by ``validate``;
+- ``/format/<kind>``: ``{"formatted": "529.982.247-25"}``, or ``null`` for an
+  invalid ID (only for the types that have a ``format`` function);
+- ``/parse/<kind>``: ``{"parsed": {...}}`` with the attributes of the object
+  returned by ``parse``, or ``null`` for an invalid ID (only for the types
+  that have a ``parse`` function).
+
+For a list of ``values`` the response is ``{"results": [...]}``, with the same
+objects in the same order. ``GET /stats`` returns the counters of the server.
+
+Validating a single ID takes a few microseconds, much less than handling the
+request that carries it. So, instead of being handled one by one, the values
+of concurrent requests for the same endpoint are coalesced in micro batches:
+a batch is dispatched when ``window`` seconds have passed since its first
+value arrived, or when it has ``max_batch`` values. Validation uses the
+``validate_many`` function of the ID module when NumPy is available.
+
+With ``workers`` greater than zero, the batches are processed by a pool of
+that many processes, leaving the event loop free to handle the connections.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, is_dataclass
+from http import HTTPStatus
+from types import ModuleType
+
+from brazilian_ids.functions.validation import Reason
+from brazilian_ids.kinds import KINDS, check, format_value
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_WINDOW = 0.002
+DEFAULT_MAX_BATCH = 1024
+MAX_BODY_SIZE = 1024 * 1024
+MAX_HEADERS = 100
+
+OPERATIONS = ("validate", "format", "parse")
+
+
+def __validate(module: ModuleType, values: list[str]) -> list[dict]:
+    try:
+        codes = module.validate_many(values)
+    except ImportError:
+        codes = [module.validate(value) for value in values]
+
+    return [{"valid": bool(code == Reason.VALID), "reason": Reason(int(code)).name} for code in codes]
+
+
+def __format(module: ModuleType, values: list[str]) -> list[dict]:
+    return [{"formatted": (format_value(module, value) or None) if check(module, value) else None} for value in values]
+
+
+def _as_dict(parsed) -> dict:
+    """Convert the result of a ``parse`` function, a dataclass or a class with properties, to a dictionary."""
+    if is_dataclass(parsed) and not isinstance(parsed, type):
+        return asdict(parsed)
+
+    cls = type(parsed)
+    return {name: getattr(parsed, name) for name in dir(cls) if isinstance(getattr(cls, name), property)}
+
+
+def __parse(module: ModuleType, values: list[str]) -> list[dict]:
+    results = []
+
+    for value in values:
+        parsed = None
+
+        if check(module, value):
+            try:
+                parsed = _as_dict(module.parse(value))
+            except ValueError:
+                pass
+
+        results.append({"parsed": parsed})
+
+    return results
+
+
+def _run(operation: str, kind: str, values: list[str]) -> list[dict]:
+    """Process a batch of values of an endpoint, returning the result of each one.
+
+    A module level function, so it can be sent to the worker processes."""
+    module = KINDS[kind]
+    return {"validate": __validate, "format": __format, "parse": __parse}[operation](module, values)
+
+
+def endpoints() -> dict[str, tuple[str, str]]:
+    """Return the paths of the endpoints, mapped to their operation and ID type."""
+    result = {}
+
+    for kind, module in KINDS.items():
+        for operation in OPERATIONS:
+            if operation == "validate" or hasattr(module, operation):
+                result[f"/{operation}/{kind}"] = (operation, kind)
+
+    return result
+
+
+class HTTPError(Exception):
+    """Error to be returned as an HTTP response with an error message."""
+
+    def __init__(self, status: HTTPStatus, message: str | None = None) -> None:
+        super().__init__(message or status.phrase)
+        self.status = status
+        self.message = message or status.phrase
+
+
+class _Batcher:
+    """Coalesce the values submitted to an endpoint in batches."""
+
+    def __init__(self, server: "Server", operation: str, kind: str) -> None:
+        self.__server = server
+        self.__operation = operation
+        self.__kind = kind
+        self.__pending: list[tuple[list[str], asyncio.Future]] = []
+        self.__size = 0
+        self.__timer: asyncio.TimerHandle | None = None
+        # the event loop keeps only weak references to the tasks
+        self.__tasks: set[asyncio.Task] = set()
+
+    async def submit(self, values: list[str]) -> list[dict]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.__pending.append((values, future))
+        self.__size += len(values)
+
+        if self.__size >= self.__server.max_batch:
+            self.__flush()
+        elif self.__timer is None:
+            self.__timer = loop.call_later(self.__server.window, self.__flush)
+
+        return await future
+
+    def __flush(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+        batch = self.__pending
+        self.__pending = []
+        self.__size = 0
+        task = asyncio.get_running_loop().create_task(self.__dispatch(batch))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def __dispatch(self, batch: list[tuple[list[str], asyncio.Future]]) -> None:
+        values = [value for request_values, _ in batch for value in request_values]
+
+        try:
+            results = await self.__server._process(self.__operation, self.__kind, values)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        start = 0
+
+        for request_values, future in batch:
+            if not future.done():
+                future.set_result(results[start:start + len(request_values)])
+
+            start += len(request_values)
+
+
+class Server:
+    """The HTTP server, see the module documentation.
+
+    ``window`` is in seconds. With ``workers`` equal to zero, the batches are
+    processed by the event loop itself. Otherwise, by a pool of processes,
+    unless an ``executor`` is given, which won't be shut down by ``close``.
+    """
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        workers: int = 0,
+        executor: Executor | None = None,
+    ) -> None:
+        if window < 0:
+            raise ValueError("window can't be negative")
+
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+
+        if workers < 0:
+            raise ValueError("workers can't be negative")
+
+        self.window = window
+        self.max_batch = max_batch
+        self.requests = 0
+        self.batches = 0
+        self.values = 0
+        self.__endpoints = endpoints()
+        self.__batchers = {path: _Batcher(self, *endpoint) for path, endpoint in self.__endpoints.items()}
+        self.__own_executor = executor is None and workers > 0
+        self.__executor = ProcessPoolExecutor(max_workers=workers) if self.__own_executor else executor
+        self.__server: asyncio.Server | None = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.Server:
+        """Start listening for connections, returning the ``asyncio.Server``.
+
+        Use port zero to get any free port, available in the ``sockets`` attribute of the result."""
+        self.__server = await asyncio.start_server(self.__handle, host, port)
+        return self.__server
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        server = await self.start(host, port)
+
+        async with server:
+            await server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening for connections and shut down the worker processes."""
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+
+        if self.__own_executor and self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+
+    async def _process(self, operation: str, kind: str, values: list[str]) -> list[dict]:
+        self.batches += 1
+        self.values += len(values)
+
+        if self.__executor is None:
+            return _run(operation, kind, values)
+
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, _run, operation, kind, values)
+
+    def stats(self) -> dict[str, int]:
+        return {"requests": self.requests, "batches": self.batches, "values": self.values}
+
+    async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            keep_alive = True
+
+            while keep_alive:
+                try:
+                    request = await _read_request(reader)
+                except HTTPError as e:
+                    writer.write(_response(e.status, {"error": e.message}, keep_alive=False))
+                    break
+
+                if request is None:
+                    break
+
+                method, path, keep_alive, body = request
+                self.requests += 1
+
+                try:
+                    status, result = HTTPStatus.OK, await self.__route(method, path, body)
+                except HTTPError as e:
+                    status, result = e.status, {"error": e.message}
+                except Exception:
+                    status, result = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"}
+
+                writer.write(_response(status, result, keep_alive))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def __route(self, method: str, path: str, body: bytes) -> dict:
+        path = path.partition("?")[0]
+
+        if path == "/stats":
+            if method != "GET":
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+            return self.stats()
+
+        batcher = self.__batchers.get(path)
+
+        if batcher is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+
+        if method != "POST":
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+        single, values = _values(body)
+        results = await batcher.submit(values)
+        return results[0] if single else {"results": results}
+
+
+def _values(body: bytes) -> tuple[bool, list[str]]:
+    """Return the values of a request body, and whether it had a single ``value`` instead of a list of ``values``."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "The body must be a JSON object") from None
+
+    if not isinstance(data, dict) or ("value" in data) == ("values" in data):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "The body must have either 'value' or 'values'")
+
+    single = "value" in data
+    values = [data["value"]] if single else data["values"]
+
+    if not isinstance(values, list):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "'values' must be a list")
+
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "The IDs must be strings or integers")
+
+    return (single, [str(value) for value in values])
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, bool, bytes] | None:
+    """Read a request, returning its method, path, whether to keep the connection alive and the body.
+
+    Returns ``None`` if the connection was closed before a new request."""
+    try:
+        line = await reader.readline()
+    except ValueError:
+        raise HTTPError(HTTPStatus.REQUEST_URI_TOO_LONG) from None
+
+    if not line:
+        return None
+
+    try:
+        method, path, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line") from None
+
+    headers: dict[str, str] = {}
+
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError:
+            raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE) from None
+
+        if line in (b"\r\n", b"\n", b""):
+            break
+
+        if len(headers) >= MAX_HEADERS:
+            raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+
+        name, sep, value = line.decode("latin-1").partition(":")
+
+        if not sep:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed header")
+
+        headers[name.strip().lower()] = value.strip()
+
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        raise HTTPError(HTTPStatus.LENGTH_REQUIRED)
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from None
+
+    if length < 0:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+
+    if length > MAX_BODY_SIZE:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+
+    body = await reader.readexactly(length) if length else b""
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+    return (method.upper(), path, keep_alive, body)
+
+
+def _response(status: HTTPStatus, data: dict, keep_alive: bool) -> bytes:
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m brazilian_ids.server", description="HTTP/JSON server to validate, format and parse Brazilian IDs"
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to listen on (default {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to listen on (default {DEFAULT_PORT})")
+    parser.add_argument(
+        "--window",
+        type=float,
+        default=DEFAULT_WINDOW * 1000,
+        help=f"milliseconds to wait for more values before processing a batch (default {DEFAULT_WINDOW * 1000:g})",
+    )
+    parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=DEFAULT_MAX_BATCH,
+        help=f"number of values that triggers a batch before the window ends (default {DEFAULT_MAX_BATCH})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="number of worker processes for the batches, 0 (default) processes them in the server process",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        server = Server(window=args.window / 1000, max_batch=args.max_batch, workers=args.workers)
+    except ValueError as e:
+        parser.error(str(e))
+
+    async def serve() -> None:
+        try:
+            await server.serve_forever(args.host, args.port)
+        finally:
+            await server.close()
+
+    print(f"Listening on http://{args.host}:{args.port}", file=sys.stderr)
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
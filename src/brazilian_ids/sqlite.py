@@ -0,0 +1,198 @@
+"""Validation of IDs stored in SQLite databases.
+
+``register`` makes the ID functions available to SQL as user-defined
+functions, named after the ID type: ``cpf_is_valid``, ``cpf_format``,
+``cpf_reason``, ``cnpj_is_valid``, ``nupj_is_valid``, ``cep_state`` and so
+on (see ``functions``). They are registered as deterministic, so SQLite can
+use them in indexes on expressions and in partial indexes:
+
+>>> import sqlite3
+>>> from brazilian_ids import sqlite
+>>> conn = sqlite3.connect("branch.db")
+>>> sqlite.register(conn)
+>>> conn.execute("CREATE INDEX customer_cpf ON customer(cpf_format(cpf))")
+
+As usual for SQL functions, all of them return ``NULL`` for ``NULL``.
+
+``validate_table`` validates a whole column of a table, writing the results
+to a new column. The rows are read in batches with ``fetchmany``, each batch
+is validated at once with ``kinds.check_many`` (through the ``validate_many``
+function of the ID type, when NumPy is available) and the results are written
+back with ``executemany``, one transaction per batch.
+"""
+
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from types import ModuleType
+
+from brazilian_ids.functions.location import cep
+from brazilian_ids.kinds import KINDS, UnknownKindError, check, check_many, format_value, modules
+from brazilian_ids.pipeline import Stats
+
+DEFAULT_BATCH_SIZE = 10000
+
+
+def __is_valid(module: ModuleType) -> Callable:
+    def is_valid(value):
+        return None if value is None else int(check(module, value))
+
+    return is_valid
+
+
+def __format(module: ModuleType) -> Callable:
+    def format(value):
+        if value is None or not check(module, value):
+            return None
+
+        return format_value(module, value) or None
+
+    return format
+
+
+def __reason(module: ModuleType) -> Callable:
+    def reason(value):
+        return None if value is None else int(module.validate(str(value)))
+
+    return reason
+
+
+def __cep_state(value):
+    if value is None:
+        return None
+
+    try:
+        return cep.state_of(str(value))
+    except ValueError:
+        return None
+
+
+def functions(kinds: Iterable[str] | None = None) -> dict[str, Callable]:
+    """Return the functions registered by ``register``, by name.
+
+    For each ID type in ``kinds`` (by default all of ``brazilian_ids.kinds.KINDS``):
+
+    - ``<kind>_is_valid``: 1 if the value is a valid ID, 0 otherwise;
+    - ``<kind>_format``: the formatted ID, or ``NULL`` if it isn't valid;
+    - ``<kind>_reason``: the ``Reason`` code returned by ``validate``.
+
+    Also ``cep_state``, with the state code of a CEP (or ``NULL``), if
+    ``cep`` is one of the ``kinds``.
+    """
+    kind_modules = modules({kind: kind for kind in (KINDS if kinds is None else kinds)})
+    result = {}
+
+    for kind, module in kind_modules.items():
+        result[f"{kind}_is_valid"] = __is_valid(module)
+
+        if hasattr(module, "format"):
+            result[f"{kind}_format"] = __format(module)
+
+        result[f"{kind}_reason"] = __reason(module)
+
+    if "cep" in kind_modules:
+        result["cep_state"] = __cep_state
+
+    return result
+
+
+def register(conn: sqlite3.Connection, kinds: Iterable[str] | None = None) -> list[str]:
+    """Register the functions of the ID types in a connection, returning their names.
+
+    See ``functions`` for the list of functions.
+    """
+    registered = functions(kinds)
+
+    for name, function in registered.items():
+        conn.create_function(name, 1, function, deterministic=True)
+
+    return list(registered)
+
+
+def _quote(identifier: str) -> str:
+    """Quote the name of a table or column."""
+    return '"{0}"'.format(identifier.replace('"', '""'))
+
+
+def validate_table(
+    conn: sqlite3.Connection,
+    table: str,
+    column: str,
+    kind: str,
+    apply_format: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Stats:
+    """Validate a column of a table, writing the results to the ``<column>_valid`` column.
+
+    The ``<column>_valid`` column is created if needed, and so is the
+    ``<column>_formatted`` one, if ``apply_format`` is ``True``. The results
+    are the same of ``pipeline.validate_rows``, with ``NULL`` in place of
+    empty formatted IDs.
+
+    The table must have a ``rowid``, which is used to update the rows. Each
+    batch of ``batch_size`` rows is committed in its own transaction, so
+    don't call it inside another transaction.
+
+    Returns the ``Stats`` of the validation.
+    """
+    if kind not in KINDS:
+        raise UnknownKindError(kind)
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    module = KINDS[kind]
+    apply_format = apply_format and hasattr(module, "format")
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({_quote(table)})")}
+
+    if not existing:
+        raise ValueError(f"The table '{table}' doesn't exist")
+
+    if column not in existing:
+        raise ValueError(f"The column '{column}' doesn't exist in the table '{table}'")
+
+    valid_column = _quote(f"{column}_valid")
+    formatted_column = _quote(f"{column}_formatted")
+
+    with conn:
+        if f"{column}_valid" not in existing:
+            conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {valid_column} INTEGER")
+
+        if apply_format and f"{column}_formatted" not in existing:
+            conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {formatted_column} TEXT")
+
+    if apply_format:
+        update = f"UPDATE {_quote(table)} SET {valid_column} = ?, {formatted_column} = ? WHERE rowid = ?"
+    else:
+        update = f"UPDATE {_quote(table)} SET {valid_column} = ? WHERE rowid = ?"
+
+    stats = Stats((column,))
+    reader = conn.execute(f"SELECT rowid, {_quote(column)} FROM {_quote(table)}")
+    writer = conn.cursor()
+
+    try:
+        while rows := reader.fetchmany(batch_size):
+            results: list[tuple] = []
+            checked = check_many(module, [value for _, value in rows])
+
+            for (rowid, value), valid in zip(rows, checked):
+                if apply_format:
+                    results.append((int(valid), (format_value(module, value) or None) if valid else None, rowid))
+                else:
+                    results.append((int(valid), rowid))
+
+                if valid:
+                    stats.valid[column] += 1
+                else:
+                    stats.invalid[column] += 1
+
+            with conn:
+                writer.executemany(update, results)
+
+            stats.rows += len(rows)
+    finally:
+        reader.close()
+        writer.close()
+
+    stats.finished = time.perf_counter()
+    return stats
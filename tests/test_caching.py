@@ -0,0 +1,134 @@
+import dataclasses
+
+import pytest
+
+from brazilian_ids.functions.caching import MISSING, CacheStats, Caches, LRUCache
+from brazilian_ids.functions.company import cnpj
+from brazilian_ids.functions.labor_dispute import nupj
+from brazilian_ids.functions.location import cep
+
+
+@pytest.fixture
+def enabled():
+    modules = (cnpj, cep, nupj)
+
+    for module in modules:
+        module.caches.enable(maxsize=2)
+
+    yield
+    for module in modules:
+        module.caches.disable()
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b") is MISSING
+    assert cache.get("c") == 3
+    assert cache.stats() == CacheStats(hits=2, misses=1, evictions=1, size=2, maxsize=2)
+    assert cache.stats().hit_rate == pytest.approx(2 / 3)
+
+
+def test_lru_cache_clear():
+    cache = LRUCache(maxsize=1)
+    cache.put("a", None)
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.stats() == CacheStats(0, 0, 0, 0, 1)
+    assert CacheStats(0, 0, 0, 0, 1).hit_rate == 0.0
+
+
+def test_lru_cache_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_caches_enable_disable():
+    caches = Caches("parse", "format")
+    assert caches.parse is None
+    assert caches.stats() == {}
+
+    caches.enable(maxsize=10, functions=["format"])
+    assert caches.parse is None
+    assert caches.format.maxsize == 10
+    assert list(caches.stats()) == ["format"]
+
+    caches.disable()
+    assert caches.format is None
+
+    with pytest.raises(ValueError):
+        caches.enable(functions=["validate"])
+
+
+def test_caches_functions():
+    with pytest.raises(ValueError):
+        Caches("parse", "validate")
+
+    assert nupj.caches.functions == ("parse",)
+    assert nupj.caches.format is None
+
+    with pytest.raises(ValueError):
+        nupj.caches.enable(functions=["format"])
+
+    with pytest.raises(AttributeError):
+        nupj.caches.validate = LRUCache()
+
+
+def test_disabled_by_default():
+    assert cnpj.caches.stats() == {}
+    assert cnpj.parse("11222333000181") is not cnpj.parse("11222333000181")
+
+
+def test_cnpj_parse(enabled):
+    parsed = cnpj.parse("11.222.333/0001-81")
+    assert cnpj.parse("11222333000181") is parsed
+    assert cnpj.caches.stats()["parse"] == CacheStats(hits=1, misses=1, evictions=0, size=1, maxsize=2)
+
+    # shorter CNPJs share the entry of the padded ones
+    assert cnpj.parse("191") is cnpj.parse("00000000000191") is cnpj.parse("00.000.000/0001-91")
+    assert cnpj.caches.stats()["parse"] == CacheStats(hits=3, misses=2, evictions=0, size=2, maxsize=2)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        parsed.firm = 1
+
+    # invalid IDs are never cached
+    for _ in range(2):
+        with pytest.raises(cnpj.InvalidCnpjError):
+            cnpj.parse("11222333000182")
+
+    assert cnpj.caches.stats()["parse"].size == 2
+
+
+def test_cnpj_format(enabled):
+    assert cnpj.format("11222333000181") == "11.222.333/0001-81"
+    assert cnpj.format("0011222333000181") == "11.222.333/0001-81"
+    assert cnpj.caches.stats()["format"].hits == 1
+
+    for value in ("191", "272", "353"):
+        cnpj.format(value)
+
+    assert cnpj.caches.stats()["format"].evictions == 2
+
+
+def test_cep(enabled):
+    parsed = cep.parse("01001-000")
+    assert cep.parse("01001000") is parsed
+    assert cep.parse("01001") is parsed
+    assert cep.format("01001000") == cep.format("01001-000") == cep.format("01001") == "01001-000"
+    stats = cep.caches.stats()
+    assert (stats["parse"].hits, stats["parse"].size, stats["format"].hits, stats["format"].size) == (2, 1, 2, 1)
+
+
+def test_nupj(enabled):
+    parsed = nupj.parse("6236737-83.2024.4.02.5398")
+    assert nupj.parse("62367378320244025398") is parsed
+    assert nupj.parse("36737-83.2024.4.02.5398") is nupj.parse("0036737-83.2024.4.02.5398")
+    assert nupj.caches.stats()["parse"].size == 2
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        parsed.year = 2000
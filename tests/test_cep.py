@@ -1,7 +1,24 @@
 import pytest
 import inspect
 
-from brazilian_ids.functions.location.cep import format, parse, CEP, is_valid, is_valid_extended, CepRange, CepInvalidStateError
+from brazilian_ids.functions.location.cep import (
+    format,
+    parse,
+    CEP,
+    CompactCEP,
+    parse_compact,
+    is_valid,
+    is_valid_extended,
+    is_in_range,
+    state_of,
+    state_of_many,
+    CepRange,
+    CepInvalidStateError,
+    InvalidCepError,
+    validate,
+    validate_many,
+)
+from brazilian_ids.functions.validation import Reason
 
 
 @pytest.fixture
@@ -150,3 +167,173 @@ def test_is_valid_extended_with_invalid_state():
 
 def test_is_valid_extended_with_valid_state():
     assert is_valid_extended(cep="88100-000", state="SC")
+
+
+def test_format_invalid():
+    with pytest.raises(InvalidCepError) as e:
+        format("123456")
+
+    assert "123456" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "cep,state",
+    (
+        ("01310-200", "SP"),
+        ("01000-000", "SP"),
+        ("05999-999", "SP"),
+        ("88100-000", "SC"),
+        ("68900-000", "AP"),
+        ("68899999", "PA"),
+        ("99999-999", "RS"),
+        ("70000", "DF"),
+        ("72000-000", None),
+        ("00999-999", None),
+    ),
+)
+def test_state_of(cep, state):
+    assert state_of(cep) == state
+
+
+def test_state_of_invalid():
+    with pytest.raises(InvalidCepError):
+        state_of("123")
+
+
+def test_is_in_range():
+    assert is_in_range("01310200")
+    assert is_in_range("68899-999")
+    assert not is_in_range("72000000")
+    assert not is_in_range("123")
+    assert not is_in_range("0131a100")
+
+
+@pytest.mark.parametrize("cep", ("7635445a", "abcde-fgh", "0131a100", "1234 "))
+def test_non_digits(cep):
+    assert not is_valid_extended(cep)
+    assert not is_valid_extended(cep, state="SP")
+    assert validate(cep) is Reason.INVALID_CHARACTERS
+
+    for function in (state_of, format, parse, parse_compact):
+        with pytest.raises(InvalidCepError):
+            function(cep)
+
+
+def test_state_of_matches_ranges():
+    instance = CepRange()
+
+    for state in ("SP", "RJ", "PA", "AP", "AM", "RR"):
+        start, end = instance.ranges_by_state(state)
+        assert state_of(start.formatted_cep) == state
+        assert state_of(end.formatted_cep) == state
+
+
+def test_state_of_many():
+    pytest.importorskip("numpy")
+    ceps = ["01310-200", "88100-000", "72000-000", "123", "68900-000"]
+    assert state_of_many(ceps).tolist() == ["SP", "SC", "", "", "AP"]
+
+
+def test_state_of_many_integers():
+    np = pytest.importorskip("numpy")
+    ceps = np.array([1310200, 88100000, 72000000, 0, 99999999], dtype=np.uint32)
+    assert state_of_many(ceps).tolist() == ["SP", "SC", "", "", "RS"]
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    (
+        ("39884-999", "39880-000"),
+        ("39880-001", "39880-000"),
+        ("39881-000", "39880-999"),
+        ("40000-000", "39999-999"),
+    ),
+)
+def test_cep_instances_strict_comparison(a, b):
+    assert parse(a) > parse(b)
+    assert parse(b) < parse(a)
+    assert not parse(a) < parse(a)
+
+
+def test_cep_sort_key(masp_cep):
+    assert parse(masp_cep).sort_key == 1310200
+
+
+def test_compact_cep(masp_cep):
+    instance = parse_compact(masp_cep)
+    assert isinstance(instance, CompactCEP)
+    assert int(instance) == instance.sort_key == 1310200
+    assert str(instance) == instance.formatted_cep == masp_cep
+    assert instance.state == "SP"
+    assert not hasattr(instance, "__dict__")
+
+    expanded = parse(masp_cep)
+
+    for attribute in ("region", "sub_region", "sector", "sub_sector", "division", "suffix"):
+        assert getattr(instance, attribute) == getattr(expanded, attribute)
+
+    assert instance.expand() == expanded
+    assert expanded.compact() == instance
+
+
+def test_compact_cep_invalid():
+    with pytest.raises(InvalidCepError):
+        CompactCEP(100000000)
+
+    with pytest.raises(InvalidCepError):
+        CompactCEP(-1)
+
+
+def test_compact_cep_ordering_and_hashing():
+    ceps = ["39884-999", "01310-200", "39880-000", "99999-999", "01310-200"]
+    compact = [parse_compact(cep) for cep in ceps]
+    assert [str(cep) for cep in sorted(compact)] == sorted(ceps)
+    assert len(set(compact)) == 4
+    assert parse_compact("39880-000") == CompactCEP(39880000)
+    assert parse_compact("39880-000") != CompactCEP(39880001)
+    assert parse_compact("39880-000") <= parse_compact("39880-000")
+    assert parse_compact("39880-001") >= parse("39880-000")
+    assert parse("39880-000") < parse_compact("39880-001")
+
+
+def test_cep_and_compact_cep_total_order():
+    expanded = parse("39880-000")
+    compact = parse_compact("39880-000")
+    assert expanded == compact and compact == expanded
+    assert expanded <= compact and compact <= expanded
+    assert hash(expanded) == hash(compact)
+    assert len({expanded, compact, parse("39880-000")}) == 1
+    assert expanded != parse_compact("39880-001")
+    assert expanded != "39880-000"
+
+    with pytest.raises(TypeError):
+        expanded < 39880001
+
+
+@pytest.mark.parametrize(
+    "cep,expected",
+    (
+        ("70000-000", Reason.VALID),
+        ("01001", Reason.VALID),
+        ("", Reason.EMPTY),
+        ("700000", Reason.INVALID_LENGTH),
+        ("7000a-000", Reason.INVALID_CHARACTERS),
+        ("00000-000", Reason.UNKNOWN_FEDERAL_UNIT),
+    ),
+)
+def test_validate(cep, expected):
+    assert validate(cep) is expected
+
+
+def test_validate_with_state():
+    assert validate("70000-000", state="DF") is Reason.VALID
+    assert validate("70000-000", state="SP") is Reason.UNKNOWN_FEDERAL_UNIT
+
+
+def test_validate_many():
+    np = pytest.importorskip("numpy")
+    samples = ["70000-000", "01001", "", "700000", "7000a-000", "00000-000"]
+    expected = [validate(cep) for cep in samples]
+    assert validate_many(samples).tolist() == expected
+    integers = np.array([70000000, 0, 10**8], dtype=np.uint64)
+    assert validate_many(integers).tolist() == [Reason.VALID, Reason.UNKNOWN_FEDERAL_UNIT, Reason.INVALID_LENGTH]
@@ -0,0 +1,125 @@
+import io
+
+import pytest
+
+from brazilian_ids.functions.location.cep import InvalidCepError, parse, parse_compact
+from brazilian_ids.functions.location.cep_index import CepIndex, InvalidCepIndexError, build_index
+
+CSV = """cep,street,city,state
+01310-100,Avenida Paulista,São Paulo,SP
+20040-020,Avenida Rio Branco,Rio de Janeiro,RJ
+70040010,Esplanada dos Ministérios,Brasília,DF
+20040-020,Avenida Rio Branco (updated),Rio de Janeiro,RJ
+"""
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    path = tmp_path / "ceps.idx"
+    assert build_index(io.StringIO(CSV), path) == 3
+    return path
+
+
+def test_lookup(index_path):
+    with CepIndex(index_path) as index:
+        assert index.fields == ("street", "city", "state")
+        assert len(index) == 3
+        assert list(index) == ["01310-100", "20040-020", "70040-010"]
+        assert index["01310-100"] == {"street": "Avenida Paulista", "city": "São Paulo", "state": "SP"}
+        assert index["20040020"]["street"] == "Avenida Rio Branco (updated)"
+        assert index[70040010]["city"] == "Brasília"
+        assert index[parse("01310100")]["state"] == "SP"
+        assert index[parse_compact("01310-100")]["state"] == "SP"
+
+
+def test_missing(index_path):
+    with CepIndex(index_path) as index:
+        assert index.get("01310-101") is None
+        assert index.get("99999-999", {}) == {}
+        assert "01310-100" in index
+        assert "01310-101" not in index
+        assert "foobar" not in index
+
+        with pytest.raises(KeyError):
+            index["01310-101"]
+
+        with pytest.raises(InvalidCepError):
+            index.get("123")
+
+
+def test_build_from_path(tmp_path):
+    source = tmp_path / "ceps.csv"
+    source.write_text("state;CEP\nSP;01310-100\n", encoding="utf-8")
+    path = tmp_path / "ceps.idx"
+    assert build_index(source, path, cep_column="CEP", delimiter=";") == 1
+
+    with CepIndex(path) as index:
+        assert index["01310-100"] == {"state": "SP"}
+
+
+def test_build_selected_fields(tmp_path):
+    path = tmp_path / "ceps.idx"
+    build_index(io.StringIO(CSV), path, fields=["city"])
+
+    with CepIndex(path) as index:
+        assert index["70040-010"] == {"city": "Brasília"}
+
+
+@pytest.mark.parametrize("cep", ("0131a100", "abcde-fgh", "0131-0100x"))
+def test_malformed_cep(index_path, cep):
+    with CepIndex(index_path) as index:
+        assert cep not in index
+
+        with pytest.raises(InvalidCepError):
+            index.get(cep)
+
+        with pytest.raises(InvalidCepError):
+            index[cep]
+
+
+@pytest.mark.parametrize("fields", (None, []))
+def test_build_only_ceps(tmp_path, fields):
+    path = tmp_path / "ceps.idx"
+    assert build_index(io.StringIO("cep\n01310-100\n70040010\n"), path, fields=fields) == 2
+
+    with CepIndex(path) as index:
+        assert index.fields == ()
+        assert list(index) == ["01310-100", "70040-010"]
+        assert index["70040-010"] == {}
+        assert "01310-100" in index
+
+
+@pytest.mark.parametrize("cep", ("123", "00100-000", "abcde-fgh"))
+def test_build_invalid(tmp_path, cep):
+    source = CSV + f"{cep},Unknown,Unknown,XX\n"
+
+    with pytest.raises(InvalidCepError):
+        build_index(io.StringIO(source), tmp_path / "ceps.idx")
+
+    assert build_index(io.StringIO(source), tmp_path / "ceps.idx", skip_invalid=True) == 3
+
+
+def test_build_missing_columns(tmp_path):
+    with pytest.raises(ValueError):
+        build_index(io.StringIO(CSV), tmp_path / "ceps.idx", cep_column="zipcode")
+
+    with pytest.raises(ValueError):
+        build_index(io.StringIO(CSV), tmp_path / "ceps.idx", fields=["street", "country"])
+
+
+def test_empty(tmp_path):
+    path = tmp_path / "ceps.idx"
+    assert build_index(io.StringIO("cep,city\n"), path) == 0
+
+    with CepIndex(path) as index:
+        assert len(index) == 0
+        assert index.get("01310-100") is None
+
+
+@pytest.mark.parametrize("truncate", (0, 10, 30, -1))
+def test_invalid_file(index_path, truncate):
+    content = index_path.read_bytes()
+    index_path.write_bytes(content[:truncate] if truncate else b"x" * len(content))
+
+    with pytest.raises(InvalidCepIndexError):
+        CepIndex(index_path)
@@ -0,0 +1,28 @@
+import pytest
+
+from brazilian_ids.functions.checksum import WeightedSum, all_zeros
+
+
+@pytest.mark.parametrize("digits", ("529982247", [5, 2, 9, 9, 8, 2, 2, 4, 7], "52998224725"))
+def test_weighted_sum(digits):
+    weights = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    expected = sum(w * int(k) for w, k in zip(weights, digits))
+    assert WeightedSum(weights)(digits) == expected
+
+
+def test_weighted_sum_shorter_digits():
+    assert WeightedSum([3, 2, 1])("11") == 5
+
+
+def test_weighted_sum_weights():
+    assert WeightedSum([2, 1]).weights == (2, 1)
+
+
+def test_weighted_sum_invalid_digit():
+    with pytest.raises(KeyError):
+        WeightedSum([2, 1])("1a")
+
+
+@pytest.mark.parametrize("digits,expected", (("000", True), ([0, 0], True), ("010", False), ([0, 1], False)))
+def test_all_zeros(digits, expected):
+    assert all_zeros(digits) is expected
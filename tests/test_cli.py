@@ -0,0 +1,34 @@
+import io
+import json
+
+import pytest
+
+from brazilian_ids.cli import main
+
+
+def test_validate_files(tmp_path, capsys):
+    source = tmp_path / "input.csv"
+    source.write_text("cpf,cep\n968.811.342-58,01310200\n123,1\n", encoding="utf-8")
+    target = tmp_path / "output.jsonl"
+
+    assert main(["validate", str(source), "-o", str(target), "-c", "cpf:cpf", "-c", "cep:cep", "-f"]) == 0
+
+    rows = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert rows[0]["cpf_valid"] is True
+    assert rows[0]["cep_formatted"] == "01310-200"
+    assert rows[1]["cpf_valid"] is False
+    assert "2 rows" in capsys.readouterr().err
+
+
+def test_validate_stdin(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"doc": "58160789000128"}\n'))
+    assert main(["validate", "--input-format", "jsonl", "-c", "doc:cnpj", "-q"]) == 0
+    captured = capsys.readouterr()
+    assert json.loads(captured.out) == {"doc": "58160789000128", "doc_valid": True}
+    assert captured.err == ""
+
+
+@pytest.mark.parametrize("column", ("cpf", "cpf:rg", ":cpf"))
+def test_validate_invalid_column(column):
+    with pytest.raises(SystemExit):
+        main(["validate", "-c", column])
@@ -3,11 +3,17 @@ from brazilian_ids.functions.real_state.cno import (
     InvalidCnoLengthError,
     random,
     is_valid,
+    is_valid_bytes,
     format,
     verification_digit,
     pad,
     InvalidCnoError,
+    validate,
+    validate_many,
+    generate_many,
 )
+from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.validation import Reason
 
 
 @pytest.fixture
@@ -66,3 +72,55 @@ def test_pad_with_validation():
 def test_pad_raises_exception():
     with pytest.raises(InvalidCnoError):
         assert pad("1233456789", validate_after=True)
+
+
+def test_validate_bytes(cno_sample, cno_formatted_sample):
+    assert is_valid_bytes(cno_sample.encode("ascii"))
+    assert is_valid_bytes(memoryview(cno_formatted_sample.encode("ascii")))
+
+
+@pytest.mark.parametrize("cno", (b"352386646121", b"000000000000", b"3523866461203", b""))
+def test_validate_bytes_invalid(cno):
+    assert not is_valid_bytes(cno)
+
+
+def test_validate_bytes_padded():
+    assert is_valid_bytes(b"1233456782")
+    assert not is_valid_bytes(b"1233456782", autopad=False)
+
+
+@pytest.mark.parametrize(
+    "cno,expected",
+    (
+        ("352386646120", Reason.VALID),
+        ("", Reason.EMPTY),
+        ("3523866461203", Reason.INVALID_LENGTH),
+        ("000000000000", Reason.ALL_ZEROS),
+        ("352386646121", Reason.FIRST_DIGIT),
+    ),
+)
+def test_validate_reasons(cno, expected):
+    assert validate(cno) is expected
+
+
+def test_validate_many():
+    pytest.importorskip("numpy")
+    samples = ["352386646120", "", "3523866461203", "000000000000", "352386646121", random(), random(formatted=False)]
+    expected = [validate(cno) for cno in samples]
+    assert validate_many(samples).tolist() == expected
+    assert validate_many(["52386646120"], autopad=False).tolist() == [Reason.INVALID_LENGTH]
+
+
+def test_generate_many():
+    pytest.importorskip("numpy")
+    generated = list(generate_many(1000, seed=42))
+    assert len(generated) == 1000
+    assert all(is_valid(cno=value) for value in generated)
+    assert list(generate_many(1000, seed=42)) == generated
+
+
+def test_generate_many_formatted_unique():
+    pytest.importorskip("numpy")
+    generated = list(generate_many(1000, seed=42, formatted=True, unique=True, chunksize=300))
+    assert len(set(generated)) == 1000
+    assert all(format(NONDIGIT_REGEX.sub("", value)) == value for value in generated)
@@ -2,13 +2,23 @@ import pytest
 
 from brazilian_ids.functions.company.cnpj import (
     is_valid,
+    is_valid_many,
+    is_valid_bytes,
     verification_digits,
+    verification_digits_many,
+    InvalidCnpjError,
+    InvalidCnpjLengthError,
     pad,
     format,
     parse,
     random,
     from_firm_id,
+    validate,
+    validate_many,
+    generate_many,
 )
+from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.validation import Reason
 
 
 @pytest.mark.parametrize(
@@ -72,6 +82,28 @@ def test_parse_formatted():
     assert cnpj.second_digit == 8
 
 
+def test_parse_padded():
+    cnpj = parse("360305000104")
+    assert cnpj.cnpj == "00.360.305/0001-04"
+    assert cnpj.firm == 360305
+    assert cnpj.establishment == 1
+    assert cnpj.first_digit == 0
+    assert cnpj.second_digit == 4
+
+
+@pytest.mark.parametrize(
+    "cnpj", ("58.160.789/0001-29", "00000000000000", "", "581607890001280")
+)
+def test_parse_invalid(cnpj):
+    with pytest.raises(InvalidCnpjError):
+        parse(cnpj)
+
+
+def test_parse_slots():
+    cnpj = parse("58160789000128")
+    assert not hasattr(cnpj, "__dict__")
+
+
 def test_random():
     sample = random(formatted=False)
     assert is_valid(sample)
@@ -110,3 +142,138 @@ def test_from_firm_id_formatted(firm_id, establishment, expected):
 
 def test_from_firm_id_default_establishment():
     assert from_firm_id("58160789") == "58160789000128"
+
+
+def test_is_valid_many():
+    pytest.importorskip("numpy")
+    samples = (
+        "60746948000112",
+        "60.701.190/0001-04",
+        "360305000104",
+        "61472676000173",
+        "00000000000000",
+        "",
+        "607469480001120",
+    )
+    assert is_valid_many(samples).tolist() == [True, True, True, False, False, False, False]
+
+
+def test_is_valid_many_without_autopad():
+    pytest.importorskip("numpy")
+    assert is_valid_many(["360305000104"], autopad=False).tolist() == [False]
+
+
+def test_is_valid_many_matches_is_valid():
+    pytest.importorskip("numpy")
+    samples = [random(formatted=False) for _ in range(50)]
+    samples += [cnpj[:-1] + str((int(cnpj[-1]) + 1) % 10) for cnpj in samples]
+    assert is_valid_many(samples).tolist() == [is_valid(cnpj) for cnpj in samples]
+
+
+def test_is_valid_many_integers():
+    np = pytest.importorskip("numpy")
+    samples = np.array([60746948000112, 360305000104, 60746948000113], dtype=np.uint64)
+    assert is_valid_many(samples).tolist() == [True, True, False]
+
+
+def test_verification_digits_many():
+    pytest.importorskip("numpy")
+    stems = ("607469480001", "607011900001", "003603050001", "614726760001", "58160789000128")
+    expected = [list(verification_digits(stem)) for stem in stems]
+    assert verification_digits_many(stems).tolist() == expected
+
+
+def test_verification_digits_ignore_check_digits():
+    # the check digits of the complete CNPJ are wrong, and don't change the result
+    assert verification_digits("58160789000138") == verification_digits("581607890001") == (2, 8)
+    assert verification_digits("58160789000199") == (2, 8)
+
+
+def test_verification_digits_many_complete_cnpjs():
+    np = pytest.importorskip("numpy")
+    cnpjs = ["58160789000138", "58160789000199", "60746948000112"]
+    expected = [list(verification_digits(cnpj)) for cnpj in cnpjs]
+    assert verification_digits_many(cnpjs).tolist() == expected == [[2, 8], [2, 8], [1, 2]]
+    assert verification_digits_many(np.array([int(cnpj) for cnpj in cnpjs], dtype=np.uint64)).tolist() == expected
+
+
+def test_verification_digits_many_autopad():
+    pytest.importorskip("numpy")
+    assert verification_digits_many(["3603050001"], autopad=True).tolist() == [[0, 4]]
+
+    with pytest.raises(InvalidCnpjLengthError):
+        verification_digits_many(["607469480001", "3603050001"])
+
+
+@pytest.mark.parametrize(
+    "cnpj,expected",
+    (
+        (b"60746948000112", True),
+        (b"60.746.948/0001-12", True),
+        (bytearray(b"360305000104"), True),
+        (memoryview(b"xx58160789000128xx")[2:16], True),
+        (b"60746948000113", False),
+        (b"00000000000000", False),
+        (b"607469480001120", False),
+        (b"", False),
+    ),
+)
+def test_is_valid_bytes(cnpj, expected):
+    assert is_valid_bytes(cnpj) is expected
+
+
+def test_is_valid_bytes_without_autopad():
+    assert not is_valid_bytes(b"360305000104", autopad=False)
+
+
+@pytest.mark.parametrize(
+    "cnpj,expected",
+    (
+        ("11.222.333/0001-81", Reason.VALID),
+        ("191", Reason.VALID),
+        ("", Reason.EMPTY),
+        ("112223330001810", Reason.INVALID_LENGTH),
+        ("00.000.000/0000-00", Reason.ALL_ZEROS),
+        ("11.222.333/0001-91", Reason.FIRST_DIGIT),
+        ("11.222.333/0001-82", Reason.SECOND_DIGIT),
+    ),
+)
+def test_validate(cnpj, expected):
+    assert validate(cnpj) is expected
+
+
+def test_validate_without_autopad():
+    assert validate("191", autopad=False) is Reason.INVALID_LENGTH
+
+
+def test_validate_many():
+    pytest.importorskip("numpy")
+    samples = ["11.222.333/0001-81", "191", "", "112223330001810", "00000000000000", "11222333000191", "11222333000182"]
+    expected = [validate(cnpj) for cnpj in samples]
+    assert validate_many(samples).tolist() == expected
+    assert validate_many(["191"], autopad=False).tolist() == [Reason.INVALID_LENGTH]
+
+
+def test_generate_many():
+    pytest.importorskip("numpy")
+    generated = list(generate_many(1000, seed=42))
+    assert len(generated) == 1000
+    assert all(is_valid(cnpj=value) for value in generated)
+    assert list(generate_many(1000, seed=42)) == generated
+
+
+def test_generate_many_formatted_unique():
+    pytest.importorskip("numpy")
+    generated = list(generate_many(1000, seed=42, formatted=True, unique=True, chunksize=300))
+    assert len(set(generated)) == 1000
+    assert all(format(NONDIGIT_REGEX.sub("", value)) == value for value in generated)
+
+
+def test_verification_digits_many_truncates_integers():
+    np = pytest.importorskip("numpy")
+    # complete CNPJs, and the 12 first digits of another one
+    cnpjs = ["60746948000112", "58160789000128", "003603050001"]
+    expected = verification_digits_many(cnpjs).tolist()
+    assert expected == [[1, 2], [2, 8], [0, 4]]
+    assert verification_digits_many(np.array([int(cnpj) for cnpj in cnpjs], dtype=np.uint64)).tolist() == expected
+    assert verification_digits_many(np.array([60746948000112, 3603050001], dtype=np.int64)).tolist() == [[1, 2], [0, 4]]
@@ -0,0 +1,76 @@
+import pytest
+
+from brazilian_ids.columnar import KINDS
+from brazilian_ids.functions.validation import Reason
+
+pa = pytest.importorskip("pyarrow")
+pd = pytest.importorskip("pandas")
+
+from brazilian_ids import columnar  # noqa: E402
+
+SAMPLES = {
+    "cpf": ["529.982.247-25", "52998224725", "1234567890", "529.982.247-26", "00000000000", "529982247250"],
+    "cnpj": ["11.222.333/0001-81", "11222333000181", "11.222.333/0001-82", "123", "00000000000000"],
+    "pis_pasep": ["273.3354.924-6", "27333549246", "27333549247", "0", "abc"],
+    "cno": ["35.238.66461/20", "352386646120", "352386646121", "3523866461203"],
+    "sql": ["27100300205", "271.003.0020-5", "100300022", "27100300206"],
+}
+COMMON = ["", "  ", "abc-def", "1.2.3"]
+
+
+def expected(kind, values, autopad=True):
+    module = KINDS[kind]
+    args = {} if kind == "sql" else {"autopad": autopad}
+    return [value is not None and module.validate(value, **args) is Reason.VALID for value in values]
+
+
+def formatted(kind, values, autopad=True):
+    module = KINDS[kind]
+    result = []
+
+    for value, valid in zip(values, expected(kind, values, autopad)):
+        digits = "".join(char for char in value if char.isdigit()).zfill(module.EXPECTED_DIGITS) if valid else None
+        result.append(module.format(digits) if valid else None)
+
+    return result
+
+
+@pytest.mark.parametrize("kind", KINDS)
+@pytest.mark.parametrize("autopad", (True, False))
+def test_is_valid_arrow(kind, autopad):
+    values = SAMPLES[kind] + COMMON + [None]
+    assert columnar.is_valid(pa.array(values), kind, autopad=autopad).to_pylist() == expected(kind, values, autopad)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_is_valid_pandas(kind):
+    values = SAMPLES[kind] + COMMON + [None]
+    series = pd.Series(values, index=range(10, 10 + len(values)), name="document")
+    result = columnar.is_valid(series, kind)
+    assert result.tolist() == expected(kind, values)
+    assert result.index.equals(series.index)
+    assert result.name == "document"
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_format(kind):
+    values = SAMPLES[kind] + COMMON
+    assert columnar.format(pa.array(values), kind).to_pylist() == formatted(kind, values)
+    assert any(formatted(kind, values))
+
+
+def test_format_pandas():
+    series = pd.Series(["52998224725", "foo", None])
+    assert columnar.format(series, "cpf").tolist()[0] == "529.982.247-25"
+    assert columnar.format(series, "cpf").isna().tolist() == [False, True, True]
+
+
+def test_chunked_and_integers():
+    chunked = pa.chunked_array([["529.982.247-25"], ["11.222.333/0001-81"]])
+    assert columnar.is_valid(chunked, "cpf").to_pylist() == [True, False]
+    assert columnar.is_valid(pa.array([52998224725, 1234567890, None]), "cpf").to_pylist() == [True, True, False]
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        columnar.is_valid(pa.array(["1"]), "cep")
@@ -1,14 +1,22 @@
+import mmap
 import os
 import pytest
 from collections import deque, namedtuple
 
 from brazilian_ids.functions.person.cpf import (
     is_valid,
+    is_valid_many,
+    is_valid_bytes,
     InvalidCpfError,
     format,
     verification_digits,
     random,
+    validate,
+    validate_many,
+    generate_many,
 )
+from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.validation import Reason
 
 
 csv = os.path.join("tests", "fixtures", "cpf.csv")
@@ -68,3 +76,127 @@ def test_random_raw(read_csv):
 def test_random_formated(read_csv):
     for cpf in read_csv:
         assert is_valid(random(formatted=True))
+
+
+def test_is_valid_many(read_csv):
+    pytest.importorskip("numpy")
+    raw = [cpf.raw_cpf for cpf in read_csv]
+    formatted = [cpf.formated_cpf for cpf in read_csv]
+    assert is_valid_many(raw).all()
+    assert is_valid_many(formatted).all()
+
+
+def test_is_valid_many_matches_is_valid(read_csv):
+    pytest.importorskip("numpy")
+    samples = [cpf.raw_cpf for cpf in read_csv]
+    # corrupt the last digit of every other CPF
+    samples = [
+        cpf if i % 2 else cpf[:-1] + str((int(cpf[-1]) + 1) % 10)
+        for i, cpf in enumerate(samples)
+    ]
+    expected = [is_valid(cpf) for cpf in samples]
+    assert is_valid_many(samples).tolist() == expected
+
+
+def test_is_valid_many_invalid_lengths():
+    pytest.importorskip("numpy")
+    result = is_valid_many(["", "123456789101", "00000000000", "12345"], autopad=False)
+    assert result.tolist() == [False, False, False, False]
+
+
+def test_is_valid_many_autopad():
+    pytest.importorskip("numpy")
+    assert is_valid_many(["191"]).tolist() == [True]
+    assert is_valid_many(["191"], autopad=False).tolist() == [False]
+
+
+def test_is_valid_many_integers(read_csv):
+    np = pytest.importorskip("numpy")
+    samples = np.array([int(cpf.raw_cpf) for cpf in read_csv], dtype=np.uint64)
+    assert is_valid_many(samples).all()
+    assert not is_valid_many(np.array([0, 10**11], dtype=np.uint64)).any()
+
+
+def test_is_valid_bytes(read_csv):
+    for cpf in read_csv:
+        assert is_valid_bytes(cpf.raw_cpf.encode("ascii"))
+        assert is_valid_bytes(cpf.formated_cpf.encode("ascii"))
+
+
+@pytest.mark.parametrize(
+    "cpf", (b"96881134259", b"00000000000", b"", b"123456789101", b"  abc  ")
+)
+def test_is_not_valid_bytes(cpf):
+    assert not is_valid_bytes(cpf)
+
+
+def test_is_valid_bytes_autopad():
+    assert is_valid_bytes(b"191")
+    assert not is_valid_bytes(b"191", autopad=False)
+    assert not is_valid_bytes(b"123456")
+
+
+def test_is_valid_bytes_memory_mapped(read_csv, tmp_path):
+    path = tmp_path / "cpfs.txt"
+    path.write_bytes(b"".join(cpf.raw_cpf.encode("ascii") + b"|" for cpf in read_csv))
+
+    with open(path, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+
+        try:
+            for i in range(len(read_csv)):
+                assert is_valid_bytes(view[i * 12:i * 12 + 11])
+        finally:
+            view.release()
+
+
+@pytest.mark.parametrize(
+    "cpf,expected",
+    (
+        ("529.982.247-25", Reason.VALID),
+        ("191", Reason.VALID),
+        ("", Reason.EMPTY),
+        ("---", Reason.EMPTY),
+        ("123456789101", Reason.INVALID_LENGTH),
+        ("000.000.000-00", Reason.ALL_ZEROS),
+        ("529.982.247-35", Reason.FIRST_DIGIT),
+        ("529.982.247-26", Reason.SECOND_DIGIT),
+        ("123456", Reason.FIRST_DIGIT),
+    ),
+)
+def test_validate(cpf, expected):
+    assert validate(cpf) is expected
+
+
+def test_validate_without_autopad():
+    assert validate("191", autopad=False) is Reason.INVALID_LENGTH
+
+
+def test_validate_many(read_csv):
+    pytest.importorskip("numpy")
+    samples = [cpf.raw_cpf for cpf in read_csv[:10]] + [
+        "",
+        "123456789101",
+        "00000000000",
+        "52998224735",
+        "52998224726",
+        "123456",
+    ]
+    expected = [validate(cpf) for cpf in samples]
+    assert validate_many(samples).tolist() == expected
+    assert validate_many(["191"], autopad=False).tolist() == [Reason.INVALID_LENGTH]
+
+
+def test_generate_many():
+    pytest.importorskip("numpy")
+    generated = list(generate_many(1000, seed=42))
+    assert len(generated) == 1000
+    assert all(is_valid(cpf=value) for value in generated)
+    assert list(generate_many(1000, seed=42)) == generated
+
+
+def test_generate_many_formatted_unique():
+    pytest.importorskip("numpy")
+    generated = list(generate_many(1000, seed=42, formatted=True, unique=True, chunksize=300))
+    assert len(set(generated)) == 1000
+    assert all(format(NONDIGIT_REGEX.sub("", value)) == value for value in generated)
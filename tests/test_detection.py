@@ -0,0 +1,49 @@
+import pytest
+
+from brazilian_ids.functions.detection import detect, detect_many
+from brazilian_ids.functions.company.cnpj import random as random_cnpj
+from brazilian_ids.functions.person.cpf import random as random_cpf
+from brazilian_ids.functions.person.pis_pasep import random as random_pis_pasep
+from brazilian_ids.functions.real_state.cno import random as random_cno
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        ("968.811.342-58", ("cpf",)),
+        ("96881134258", ("cpf",)),
+        ("273.3354.924-6", ("pis_pasep",)),
+        ("271.003.0020-5", ("sql",)),
+        ("35.238.66461/20", ("cno",)),
+        ("58.160.789/0001-28", ("cnpj",)),
+        ("6236737-83.2024.4.02.5398", ("nupj",)),
+        ("01310-200", ("cep",)),
+        ("72000-000", ()),
+        ("968.811.342-59", ()),
+        ("", ()),
+        ("foobar", ()),
+        ("123", ()),
+    ),
+)
+def test_detect(value, expected):
+    assert detect(value) == expected
+
+
+@pytest.mark.parametrize(
+    "generator,expected",
+    (
+        (random_cpf, "cpf"),
+        (random_cnpj, "cnpj"),
+        (random_pis_pasep, "pis_pasep"),
+        (random_cno, "cno"),
+    ),
+)
+def test_detect_random(generator, expected):
+    for _ in range(20):
+        assert expected in detect(generator())
+
+
+def test_detect_many():
+    values = ["968.811.342-58", "58.160.789/0001-28", "foobar"]
+    assert detect_many(values) == [("cpf",), ("cnpj",), ()]
+    assert detect_many(iter(values)) == [detect(value) for value in values]
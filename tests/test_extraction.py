@@ -0,0 +1,62 @@
+import io
+
+import pytest
+
+from brazilian_ids.functions.extraction import Extracted, extract
+
+TEXT = (
+    "Contrato entre 529.982.247-25 (CPF) e 11.222.333/0001-81, com sede no CEP 01310-100. "
+    "Processo 6236737-83.2024.4.02.5398, obra 50.874.38599/45. "
+    "Também 52998224725 e 11222333000181. "
+    "Inválidos: 529.982.247-26, 11.222.333/0001-82, 1529.982.247-25, 529.982.247-250, 00100-000. "
+    "Telefone 11 98765-4321."
+)
+
+EXPECTED = [
+    ("cpf", "529.982.247-25"),
+    ("cnpj", "11.222.333/0001-81"),
+    ("cep", "01310-100"),
+    ("nupj", "6236737-83.2024.4.02.5398"),
+    ("cno", "50.874.38599/45"),
+    ("cpf", "52998224725"),
+    ("cnpj", "11222333000181"),
+]
+
+
+def test_extract():
+    found = list(extract(TEXT))
+    assert [(item.kind, item.value) for item in found] == EXPECTED
+
+    for item in found:
+        assert TEXT[item.start:item.end] == item.value
+        assert item.digits == item.value.replace(".", "").replace("-", "").replace("/", "")
+
+
+def test_lazy():
+    result = extract(TEXT)
+    assert result.__class__.__name__ == "generator"
+    assert next(result) == Extracted("cpf", "529.982.247-25", "52998224725", 15, 29)
+
+
+def test_kinds():
+    assert [item.value for item in extract(TEXT, kinds=["cnpj"])] == ["11.222.333/0001-81", "11222333000181"]
+
+    with pytest.raises(ValueError):
+        extract(TEXT, kinds=["cpf", "rg"])
+
+
+@pytest.mark.parametrize("chunksize", (1, 5, 26, 27, 100))
+def test_stream(chunksize):
+    assert list(extract(io.StringIO(TEXT), chunksize=chunksize)) == list(extract(TEXT))
+
+
+@pytest.mark.parametrize("size", (1, 7, 30))
+def test_iterable(size):
+    chunks = [TEXT[i:i + size] for i in range(0, len(TEXT), size)]
+    assert list(extract(chunks)) == list(extract(TEXT))
+
+
+def test_empty():
+    assert list(extract("")) == []
+    assert list(extract(io.StringIO(""))) == []
+    assert list(extract([])) == []
@@ -0,0 +1,46 @@
+import io
+
+import pytest
+
+from brazilian_ids.functions.generation import TooManyIdsError, _generate, write
+from brazilian_ids.functions.person import cpf
+
+
+def complete(stems):
+    return stems.reshape(-1, 1) % 10
+
+
+def test_generate_unique_covers_everything():
+    pytest.importorskip("numpy")
+    assert sorted(_generate(10, 10, complete, unique=True, chunksize=3)) == [str(i) for i in range(10)]
+
+
+def test_generate_too_many_unique():
+    pytest.importorskip("numpy")
+
+    with pytest.raises(TooManyIdsError):
+        _generate(11, 10, complete, unique=True)
+
+
+def test_generate_template():
+    pytest.importorskip("numpy")
+    assert set(_generate(5, 10, complete, template="(#)", seed=1)) <= {f"({i})" for i in range(10)}
+
+
+@pytest.mark.parametrize("n,chunksize", ((-1, 10), (1, 0)))
+def test_generate_invalid_arguments(n, chunksize):
+    with pytest.raises(ValueError):
+        _generate(n, 10, complete, chunksize=chunksize)
+
+
+def test_write_stream():
+    pytest.importorskip("numpy")
+    stream = io.StringIO()
+    assert write(cpf.generate_many(25, seed=1), stream, chunksize=10) == 25
+    assert stream.getvalue().splitlines() == list(cpf.generate_many(25, seed=1))
+
+
+def test_write_path(tmp_path):
+    path = tmp_path / "ids.txt"
+    assert write(["1", "2"], path) == 2
+    assert path.read_text() == "1\n2\n"
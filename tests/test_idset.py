@@ -0,0 +1,122 @@
+import pytest
+
+from brazilian_ids import idset
+from brazilian_ids.functions.company import cnpj
+from brazilian_ids.functions.person import cpf
+from brazilian_ids.idset import IdSet, InvalidIdSetFileError
+
+
+@pytest.fixture(params=("numpy", "python"))
+def merge(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(idset, "_optional_numpy", lambda: None)
+
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def cpfs():
+    return sorted({cpf.random(formatted=False) for _ in range(300)})
+
+
+def test_membership(merge, cpfs):
+    ids = IdSet("cpf", cpfs[:200])
+    assert len(ids) == 200
+    assert cpfs[0] in ids
+    assert cpf.format(cpfs[1]) in ids
+    assert int(cpfs[2]) in ids
+    assert cpfs[250] not in ids
+    assert "123" not in ids
+    assert None not in ids
+    assert list(ids) == cpfs[:200]
+
+
+def test_repeated_and_padded(merge):
+    ids = IdSet("cpf", ["529.982.247-25", "52998224725", "1234567890", 1234567890])
+    assert list(ids) == ["01234567890", "52998224725"]
+    assert "1234567890" in ids
+    assert "1234567890" not in IdSet("cpf", ids, autopad=False)
+
+
+def test_invalid(merge):
+    with pytest.raises(cpf.InvalidCpfError):
+        IdSet("cpf", ["529.982.247-25", "529.982.247-26"])
+
+    with pytest.raises(cnpj.InvalidCnpjError):
+        IdSet("cnpj").add("11.222.333/0001-82")
+
+    ids = IdSet("cpf", ["529.982.247-25", "529.982.247-26", "", "1" * 12, -1], skip_invalid=True)
+    assert list(ids) == ["52998224725"]
+
+
+def test_unsupported_kind():
+    with pytest.raises(ValueError):
+        IdSet("nupj")
+
+
+def test_set_operations(merge, cpfs):
+    a = IdSet("cpf", cpfs[:200])
+    b = IdSet("cpf", cpfs[100:])
+    assert list(a | b) == cpfs
+    assert list(a & b) == cpfs[100:200]
+    assert list(a - b) == cpfs[:100]
+    assert list(b - a) == cpfs[200:]
+    assert a.union(IdSet("cpf")) == a
+    assert len(a.intersection(IdSet("cpf"))) == 0
+    assert a.difference(a) == IdSet("cpf")
+
+    with pytest.raises(TypeError):
+        a | IdSet("cnpj")
+
+
+def test_add_update_discard(merge, cpfs):
+    ids = IdSet("cpf", cpfs[10:20])
+    ids.add(cpfs[0])
+    ids.add(cpfs[0])
+    ids.update(cpfs[15:30])
+    ids.discard(cpfs[12])
+    ids.discard("123")
+    assert list(ids) == [cpfs[0], *cpfs[10:12], *cpfs[13:30]]
+
+
+def test_cnpj(merge):
+    ids = IdSet("cnpj", ["11.222.333/0001-81", "11222333000181"])
+    assert ids.kind == "cnpj"
+    assert list(ids) == ["11222333000181"]
+
+
+@pytest.mark.parametrize("use_mmap", (True, False))
+def test_save_load(tmp_path, cpfs, use_mmap):
+    path = tmp_path / "cpfs.bin"
+    ids = IdSet("cpf", cpfs)
+    ids.save(path)
+    assert path.stat().st_size == 24 + 8 * len(cpfs)
+
+    with IdSet.load(path, use_mmap=use_mmap) as loaded:
+        assert loaded == ids
+        assert loaded.kind == "cpf"
+        assert cpfs[5] in loaded
+        assert list(loaded & IdSet("cpf", cpfs[:5])) == cpfs[:5]
+        loaded.add("529.982.247-25")
+        assert "52998224725" in loaded
+        assert len(loaded) == len(cpfs) + 1
+
+
+def test_load_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    IdSet("cnpj").save(path)
+
+    with IdSet.load(path) as loaded:
+        assert len(loaded) == 0
+        assert loaded.kind == "cnpj"
+
+
+@pytest.mark.parametrize("content", (b"", b"not an IdSet file at all", idset.MAGIC + b"cpf\0\0\0\0\0" + b"\x02" + bytes(7 + 8)))
+def test_load_invalid(tmp_path, content):
+    path = tmp_path / "invalid.bin"
+    path.write_bytes(content)
+
+    with pytest.raises(InvalidIdSetFileError):
+        IdSet.load(path)
@@ -0,0 +1,81 @@
+"""Regression tests of the modules required to import the package.
+
+Each test imports something in a new interpreter and checks which modules
+were imported. That is what makes an import slow, and unlike timings, it
+doesn't depend on how fast or busy the machine is.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+SCRIPT = """
+import json
+import sys
+
+before = set(sys.modules)
+{code}
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def imported_modules(code: str) -> list[str]:
+    """Run ``code`` in a new interpreter, returning the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(code=code)],
+        capture_output=True,
+        check=True,
+        cwd=SRC,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_package():
+    imported = imported_modules("import brazilian_ids")
+    assert [module for module in imported if module.startswith("brazilian_ids")] == ["brazilian_ids"]
+
+
+@pytest.mark.parametrize(
+    "name,module",
+    (
+        ("cpf", "brazilian_ids.functions.person.cpf"),
+        ("cnpj", "brazilian_ids.functions.company.cnpj"),
+        ("nupj", "brazilian_ids.functions.labor_dispute.nupj"),
+        ("cep", "brazilian_ids.functions.location.cep"),
+        ("municipio", "brazilian_ids.functions.location.municipio"),
+    ),
+)
+def test_single_module(name, module):
+    imported = imported_modules(f"import brazilian_ids; brazilian_ids.{name}")
+    ids = {other for other in imported if other.startswith("brazilian_ids.functions.") and other.count(".") == 3}
+    assert ids == {module}
+    # optional or only required on first use
+    assert not {"numpy", "gzip", "importlib.resources"} & set(imported)
+
+
+def test_cpf_without_dataclasses():
+    imported = imported_modules("import brazilian_ids; brazilian_ids.cpf")
+    assert "dataclasses" not in imported
+
+
+def test_attributes():
+    imported = imported_modules("import brazilian_ids; brazilian_ids.Reason")
+    assert "brazilian_ids.functions.validation" in imported
+    assert "brazilian_ids.functions.person.cpf" not in imported
+
+
+def test_nupj_tables_built_on_first_use():
+    code = """
+from brazilian_ids.functions.labor_dispute import nupj
+assert vars(nupj)["__courts_trs"] is None and vars(nupj)["__allowed_courts"] is None
+assert nupj.is_valid("6236737-83.2024.4.02.5398")
+assert vars(nupj)["__allowed_courts"] is not None
+assert nupj.COURTS_TRS[9] == {"13", "21", "26"}
+"""
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=SRC)
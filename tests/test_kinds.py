@@ -0,0 +1,53 @@
+import pytest
+
+from brazilian_ids import pipeline
+from brazilian_ids.functions.location import cep
+from brazilian_ids.functions.person import cpf
+from brazilian_ids.kinds import KINDS, UnknownKindError, check, check_many, format_value, modules
+
+
+def test_modules():
+    assert modules({"doc": "cpf", "zip": "cep"}) == {"doc": cpf, "zip": cep}
+
+    with pytest.raises(UnknownKindError) as error:
+        modules({"doc": "rg"})
+
+    assert error.value.kind == "rg"
+
+
+def test_pipeline_api():
+    assert pipeline.KINDS is KINDS
+    assert pipeline.UnknownKindError is UnknownKindError
+
+
+@pytest.mark.parametrize(
+    "kind,value,expected",
+    (
+        ("cpf", "529.982.247-25", True),
+        ("cpf", 52998224725, True),
+        ("cpf", "52998224726", False),
+        ("cpf", None, False),
+        ("cnpj", "1122233300018x", False),
+        ("cep", "01310-200", True),
+        ("cep", "abcd", False),
+        ("cep", "00000-000", False),
+    ),
+)
+def test_check(kind, value, expected):
+    assert check(KINDS[kind], value) is expected
+
+
+@pytest.mark.parametrize("kind", list(KINDS))
+def test_check_many(kind):
+    pytest.importorskip("numpy")
+    module = KINDS[kind]
+    values = [None, "", "abc", 191, "191", "0" * 20, "7635445a", "01310-200", "3550308", "2201911", "35.50308"]
+    values += ["529.982.247-25", 52998224725, "11.222.333/0001-81", "6236737-83.2024.4.02.5398", "120.54866.70-2"]
+    values += [module.random() for _ in range(20)] if hasattr(module, "random") else []
+    assert check_many(module, values) == [check(module, value) for value in values]
+
+
+def test_format_value():
+    assert format_value(cpf, 52998224725) == "529.982.247-25"
+    assert format_value(cep, "01310200") == "01310-200"
+    assert format_value(cep, "abcd") == ""
@@ -2,10 +2,20 @@ import pytest
 
 from brazilian_ids.functions.location.municipio import (
     Municipio,
+    MunicipioTable,
+    InvalidMunicipioFederalUnitError,
+    FEDERAL_UNITS,
     is_valid,
+    is_valid_many,
+    verification_digit,
+    InvalidMunicipioLengthError,
+    is_registered,
     INVALID,
     parse,
+    validate,
+    validate_many,
 )
+from brazilian_ids.functions.validation import Reason
 
 
 @pytest.mark.parametrize("county", [county for county in INVALID.keys()])
@@ -18,7 +28,9 @@ def test_is_valid(county):
     assert is_valid(county)
 
 
-@pytest.mark.parametrize("county", ("1800013", "200020", "0300306"))
+@pytest.mark.parametrize(
+    "county", ("1800013", "200020", "0300306", "1200014", "2900300", "12000a3")
+)
 def test_not_is_valid(county):
     assert not is_valid(county)
 
@@ -27,3 +39,118 @@ def test_parse():
     assert parse("1200013") == Municipio(
         unidade_federativa="12", municipio="000", control_digits="13"
     )
+
+
+def test_municipio_attributes():
+    instance = parse("3550308")
+    assert instance.code == "3550308"
+    assert instance.name == "São Paulo"
+    assert instance.federal_unit == "São Paulo"
+    assert str(instance) == "503 in São Paulo"
+    assert not hasattr(instance, "__dict__")
+
+
+def test_municipio_table_singleton():
+    assert MunicipioTable() is MunicipioTable()
+
+
+def test_municipio_table():
+    table = MunicipioTable()
+    assert len(table) > 5500
+    assert table.name("5300108") == "Brasília"
+    assert table.name("1800013") is None
+    assert "2927408" in table
+    assert {code[:2] for code, _ in table} == set(FEDERAL_UNITS)
+
+
+@pytest.mark.parametrize("county", [county for county in INVALID.keys()])
+def test_is_registered_with_exceptions(county):
+    assert is_registered(county)
+
+
+@pytest.mark.parametrize("county", ("1800013", "3550309", "0300306"))
+def test_not_is_registered(county):
+    assert not is_registered(county)
+
+
+def test_municipio_table_search():
+    found = MunicipioTable().search("sao paulo")
+    assert ("3550308", "São Paulo") in found
+    assert all(name.startswith("São Paulo") for _, name in found)
+    assert MunicipioTable().search("xyzxyz") == []
+
+
+def test_municipio_table_by_federal_unit():
+    table = MunicipioTable()
+    assert table.by_federal_unit("53") == [("5300108", "Brasília")]
+    codes = [code for code, _ in table.by_federal_unit("12")]
+    assert codes == sorted(codes)
+    assert "1200013" in codes
+
+    with pytest.raises(InvalidMunicipioFederalUnitError):
+        table.by_federal_unit("99")
+
+
+@pytest.mark.parametrize(
+    "county,digit", (("1200013", 3), ("290020", 7), ("3550308", 8), ("2201919", 9))
+)
+def test_verification_digit(county, digit):
+    assert verification_digit(county) == digit
+
+
+def test_verification_digit_too_short():
+    with pytest.raises(InvalidMunicipioLengthError):
+        verification_digit("12000")
+
+
+def test_is_valid_registered():
+    assert all(is_valid(code) for code, _ in MunicipioTable())
+
+
+def test_is_valid_many():
+    pytest.importorskip("numpy")
+    samples = list(INVALID) + ["1200013", "2900207", "1800013", "200020", "0300306", "1200014"]
+    expected = [is_valid(county) for county in samples]
+    assert is_valid_many(samples).tolist() == expected
+    assert expected.count(True) == len(INVALID) + 2
+
+
+def test_is_valid_many_registered():
+    np = pytest.importorskip("numpy")
+    codes = [code for code, _ in MunicipioTable()]
+    assert is_valid_many(codes).all()
+    assert is_valid_many(np.array([int(code) for code in codes], dtype=np.uint32)).all()
+
+
+@pytest.mark.parametrize(
+    "municipio,expected",
+    (
+        ("3550308", Reason.VALID),
+        ("2201919", Reason.VALID),
+        ("", Reason.EMPTY),
+        ("355030", Reason.INVALID_LENGTH),
+        ("35.5030", Reason.INVALID_CHARACTERS),
+        ("0550308", Reason.UNKNOWN_FEDERAL_UNIT),
+        ("9950308", Reason.UNKNOWN_FEDERAL_UNIT),
+        ("3550309", Reason.FIRST_DIGIT),
+    ),
+)
+def test_validate(municipio, expected):
+    assert validate(municipio) is expected
+
+
+def test_validate_many():
+    pytest.importorskip("numpy")
+    samples = ["3550308", "2201919", "", "355030", "0550308", "9950308", "3550309", "35.50308", "35.5030"]
+    expected = [validate(municipio) for municipio in samples]
+    assert validate_many(samples).tolist() == expected
+
+
+def test_validate_many_invalid_stems():
+    np = pytest.importorskip("numpy")
+    # same stem of a code in INVALID, but another verification digit
+    samples = ["2201911", "2201919", "5203962", "5203960"]
+    expected = [validate(municipio) for municipio in samples]
+    assert expected == [Reason.FIRST_DIGIT, Reason.VALID, Reason.VALID, Reason.FIRST_DIGIT]
+    assert validate_many(samples).tolist() == expected
+    assert validate_many(np.array([int(code) for code in samples], dtype=np.uint32)).tolist() == expected
@@ -3,6 +3,7 @@ import inspect
 
 from brazilian_ids.functions.labor_dispute.nupj import (
     is_valid,
+    is_valid_many,
     parse,
     pad,
     NUPJ,
@@ -10,7 +11,10 @@ from brazilian_ids.functions.labor_dispute.nupj import (
     Courts,
     InvalidCourtIdError,
     InvalidSegmentIdError,
+    validate,
+    validate_many,
 )
+from brazilian_ids.functions.validation import Reason
 
 # NUPJ generator
 # https://processogerador.paulosales.com.br/
@@ -69,6 +73,57 @@ def test_parse(given, expected):
     assert parse(given) == expected
 
 
+@pytest.mark.parametrize(
+    "nupj",
+    (
+        "6236737-84.2024.4.02.5398",  # wrong verification digits
+        "6236737-83.2024.4.02.5397",  # wrong city
+        "6236737-83.2007.4.02.5398",  # before 2008
+        "6236737-83.2024.0.02.5398",  # no segment 0
+        "6236737-83.2024.4.07.5398",  # no TRF07
+        "62367378320244025398000",  # too long
+        "",
+        "---",
+    ),
+)
+def test_is_not_valid(nupj):
+    assert not is_valid(nupj)
+
+
+def with_digits(nupj: str) -> str:
+    """Calculate the verification digits of a NUPJ with "00" as placeholder."""
+    number = int(nupj[:7] + nupj[9:] + "00")
+    return "{0}{1:02d}{2}".format(nupj[:7], 98 - number % 97, nupj[9:])
+
+
+@pytest.mark.parametrize(
+    "nupj",
+    ("00012340020084010001", "99999990020259260000", "12345670020235900000", "12345670020089130042"),
+)
+def test_is_valid_with_generated(nupj):
+    assert is_valid(with_digits(nupj))
+
+
+def test_is_valid_many():
+    pytest.importorskip("numpy")
+    samples = [
+        "62367378320244025398",
+        "7666699020243004820",
+        "6236737-83.2024.4.02.5398",
+        "6236737-84.2024.4.02.5398",
+        "6236737-83.2007.4.02.5398",
+        "6236737-83.2024.0.02.5398",
+        "6236737-83.2024.4.07.5398",
+        "62367378320244025398000",
+        "",
+        with_digits("99999990020259260000"),
+        with_digits("12345670020235900000"),
+    ]
+    expected = [True, True, True, False, False, False, False, False, False, True, True]
+    assert [is_valid(nupj) for nupj in samples] == expected
+    assert is_valid_many(samples).tolist() == expected
+
+
 def test_court_class():
     assert inspect.isclass(Court)
 
@@ -142,3 +197,38 @@ def test_courts_segment_invalid_id():
 
     with pytest.raises(InvalidSegmentIdError):
         Courts.segment(99)
+
+
+@pytest.mark.parametrize(
+    "nupj,expected",
+    (
+        ("6236737-83.2024.4.02.5398", Reason.VALID),
+        ("", Reason.EMPTY),
+        ("62367378320244025398000", Reason.INVALID_LENGTH),
+        ("6236737-83.2007.4.02.5398", Reason.INVALID_YEAR),
+        ("6236737-83.2024.0.02.5398", Reason.INVALID_SEGMENT),
+        ("6236737-83.2024.4.07.5398", Reason.INVALID_COURT),
+        ("6236737-93.2024.4.02.5398", Reason.FIRST_DIGIT),
+        ("6236737-84.2024.4.02.5398", Reason.SECOND_DIGIT),
+    ),
+)
+def test_validate(nupj, expected):
+    assert validate(nupj) is expected
+
+
+def test_validate_many():
+    pytest.importorskip("numpy")
+    samples = [
+        "6236737-83.2024.4.02.5398",
+        "7666699020243004820",
+        "",
+        "62367378320244025398000",
+        "6236737-83.2007.4.02.5398",
+        "6236737-83.2024.0.02.5398",
+        "6236737-83.2024.4.07.5398",
+        "6236737-93.2024.4.02.5398",
+        "6236737-84.2024.4.02.5398",
+        with_digits("12345670020235900000"),
+    ]
+    expected = [validate(nupj) for nupj in samples]
+    assert validate_many(samples).tolist() == expected
@@ -0,0 +1,30 @@
+import pytest
+
+import brazilian_ids
+from brazilian_ids.functions.detection import detect
+from brazilian_ids.functions.extraction import extract
+from brazilian_ids.functions.labor_dispute import nupj
+from brazilian_ids.functions.person import cpf
+from brazilian_ids.functions.validation import Reason
+from brazilian_ids.idset import IdSet
+
+
+def test_modules():
+    assert brazilian_ids.cpf is cpf
+    assert brazilian_ids.nupj is nupj
+
+
+def test_attributes():
+    assert brazilian_ids.detect is detect
+    assert brazilian_ids.extract is extract
+    assert brazilian_ids.Reason is Reason
+    assert brazilian_ids.IdSet is IdSet
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        brazilian_ids.foobar
+
+
+def test_dir():
+    assert set(brazilian_ids.__all__) <= set(dir(brazilian_ids))
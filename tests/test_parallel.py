@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from brazilian_ids.functions.company import cnpj
+from brazilian_ids.functions.labor_dispute import nupj
+from brazilian_ids.functions.person.cpf import is_valid, random
+from brazilian_ids.parallel import pack, validate, validate_shared
+from brazilian_ids.pipeline import UnknownKindError
+
+
+@pytest.fixture(scope="module")
+def cpfs():
+    samples = [random(formatted=False) for _ in range(200)]
+    # corrupt some of them, keeping the length
+    return [cpf if i % 3 else cpf[:-1] + str((int(cpf[-1]) + 1) % 10) for i, cpf in enumerate(samples)]
+
+
+def test_validate_processes(cpfs):
+    result = validate(cpfs, kind="cpf", workers=2, chunksize=7)
+    assert result.__class__.__name__ == "generator"
+    assert list(result) == [is_valid(cpf) for cpf in cpfs]
+
+
+def test_validate_single_worker(cpfs):
+    assert list(validate(cpfs, kind="cpf", workers=1, chunksize=50)) == [is_valid(cpf) for cpf in cpfs]
+
+
+def test_validate_invalid_values():
+    assert list(validate(["123456", "", "96881134258"], workers=1)) == [False, False, True]
+
+
+def test_validate_backpressure(cpfs):
+    consumed = []
+
+    def source():
+        for cpf in cpfs:
+            consumed.append(cpf)
+            yield cpf
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = validate(source(), kind="cpf", workers=2, chunksize=10, max_pending=3, executor=executor)
+        next(result)
+        assert len(consumed) <= 30
+        assert len(list(result)) == len(cpfs) - 1
+
+
+def test_validate_unknown_kind():
+    with pytest.raises(UnknownKindError):
+        next(validate(["123"], kind="rg"))
+
+
+def test_validate_invalid_chunksize():
+    with pytest.raises(ValueError):
+        next(validate(["123"], chunksize=0))
+
+
+def test_pack():
+    packed, packable = pack(["968.811.342-58", "191", "", "123456789012"], kind="cpf")
+    assert packed == bytearray(b"96881134258000000001910000000000000000000000")
+    assert packable == [True, True, False, False]
+
+
+def test_pack_without_autopad():
+    assert pack(["100300022"], kind="sql")[1] == [False]
+
+
+@pytest.mark.parametrize("workers", (1, 3))
+def test_validate_shared(cpfs, workers):
+    assert validate_shared(cpfs, kind="cpf", workers=workers) == [is_valid(cpf) for cpf in cpfs]
+
+
+def test_validate_shared_packed(cpfs):
+    packed = "".join(cpfs).encode("ascii")
+    assert validate_shared(memoryview(packed), kind="cpf", workers=2) == [is_valid(cpf) for cpf in cpfs]
+
+
+def test_validate_shared_executor():
+    samples = [cnpj.random() for _ in range(20)] + ["60746948000113", "", "360305000104"]
+    expected = [cnpj.is_valid(sample) for sample in samples[:-2]] + [False, True]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert validate_shared(samples, kind="cnpj", workers=2, executor=executor) == expected
+
+
+def test_validate_shared_nupj():
+    samples = ["6236737-83.2024.4.02.5398", "766669-90.2024.3.00.4820", "6236737-84.2024.4.02.5398"]
+    assert validate_shared(samples, kind="nupj", workers=1) == [nupj.is_valid(sample) for sample in samples]
+
+
+def test_validate_shared_empty():
+    assert validate_shared([], kind="cpf") == []
+
+
+def test_validate_shared_invalid_packed_size():
+    with pytest.raises(ValueError):
+        validate_shared(b"1234567890", kind="cpf")
+
+
+def test_validate_shared_unknown_kind():
+    with pytest.raises(UnknownKindError):
+        validate_shared(["123"], kind="cep")
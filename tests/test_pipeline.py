@@ -0,0 +1,103 @@
+import io
+import json
+
+import pytest
+
+from brazilian_ids.pipeline import (
+    Stats,
+    UnknownKindError,
+    added_columns,
+    read_rows,
+    run,
+    validate_rows,
+)
+
+
+CSV_INPUT = """name,document,company
+Alice,968.811.342-58,58160789000128
+Bob,96881134259,58.160.789/0001-29
+Carol,,360305000104
+"""
+
+
+def test_read_rows_csv():
+    rows = read_rows(io.StringIO(CSV_INPUT), "csv")
+    assert rows.__class__.__name__ == "generator"
+    assert next(rows) == {"name": "Alice", "document": "968.811.342-58", "company": "58160789000128"}
+
+
+def test_read_rows_jsonl():
+    stream = io.StringIO('{"cpf": "96881134258"}\n\n{"cpf": 123}\n')
+    assert list(read_rows(stream, "jsonl")) == [{"cpf": "96881134258"}, {"cpf": 123}]
+
+
+def test_read_rows_invalid_format():
+    with pytest.raises(ValueError):
+        list(read_rows(io.StringIO(""), "xml"))
+
+
+def test_validate_rows():
+    rows = [{"cpf": "96881134258"}, {"cpf": "123456"}, {"cpf": None}, {}]
+    stats = Stats(["cpf"])
+    result = list(validate_rows(rows, {"cpf": "cpf"}, apply_format=True, stats=stats))
+    assert [row["cpf_valid"] for row in result] == [True, False, False, False]
+    assert [row["cpf_formatted"] for row in result] == ["968.811.342-58", "", "", ""]
+    assert stats.rows == 4
+    assert stats.valid == {"cpf": 1}
+    assert stats.invalid == {"cpf": 3}
+
+
+def test_validate_rows_cep_with_non_digits():
+    rows = [{"cep": "01310-200"}, {"cep": "abcd"}, {"cep": "1234-5678x"}, {"cep": "7635445a"}, {"cep": "00000-000"}]
+    result = list(validate_rows(rows, {"cep": "cep"}, apply_format=True))
+    assert [(row["cep_valid"], row["cep_formatted"]) for row in result] == [
+        (True, "01310-200"),
+        (False, ""),
+        (False, ""),
+        (False, ""),
+        (False, ""),
+    ]
+
+
+def test_validate_rows_without_format_function():
+    result = list(validate_rows([{"code": "3550308"}], {"code": "municipio"}, apply_format=True))
+    assert result == [{"code": "3550308", "code_valid": True}]
+
+
+def test_validate_rows_unknown_kind():
+    with pytest.raises(UnknownKindError):
+        list(validate_rows([{}], {"doc": "rg"}))
+
+
+def test_added_columns():
+    columns = {"doc": "cpf", "case": "nupj"}
+    assert added_columns(columns) == ["doc_valid", "case_valid"]
+    assert added_columns(columns, apply_format=True) == ["doc_valid", "doc_formatted", "case_valid"]
+
+
+def test_run_csv():
+    output = io.StringIO()
+    stats = run(io.StringIO(CSV_INPUT), output, {"document": "cpf", "company": "cnpj"}, apply_format=True)
+    lines = output.getvalue().splitlines()
+    assert lines[0] == "name,document,company,document_valid,document_formatted,company_valid,company_formatted"
+    assert lines[1] == "Alice,968.811.342-58,58160789000128,True,968.811.342-58,True,58.160.789/0001-28"
+    assert lines[2] == "Bob,96881134259,58.160.789/0001-29,False,,False,"
+    assert lines[3] == "Carol,,360305000104,False,,True,00.360.305/0001-04"
+    assert stats.rows == 3
+    assert stats.valid == {"document": 1, "company": 2}
+    assert stats.finished is not None
+    assert "3 rows" in stats.report()
+
+
+def test_run_csv_to_jsonl():
+    output = io.StringIO()
+    run(io.StringIO(CSV_INPUT), output, {"company": "cnpj"}, output_format="jsonl")
+    rows = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [row["company_valid"] for row in rows] == [True, False, True]
+
+
+def test_run_empty_csv():
+    output = io.StringIO()
+    stats = run(io.StringIO("cpf\n"), output, {"cpf": "cpf"})
+    assert output.getvalue().splitlines() == ["cpf,cpf_valid"]
+    assert stats.rows == 0
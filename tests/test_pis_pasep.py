@@ -2,12 +2,19 @@ import pytest
 
 from brazilian_ids.functions.person.pis_pasep import (
     random,
+    is_valid,
+    is_valid_bytes,
     format,
     validation_digit,
     pad,
     InvalidPISPASEPError,
     InvalidPISPASEPLengthError,
+    validate,
+    validate_many,
+    generate_many,
 )
+from brazilian_ids.functions.util import NONDIGIT_REGEX
+from brazilian_ids.functions.validation import Reason
 
 
 def test_random():
@@ -45,3 +52,64 @@ def test_pad():
 def test_pad_with_exception():
     with pytest.raises(InvalidPISPASEPError):
         pad(pis_pasep="0000000000", validate=True)
+
+
+@pytest.mark.parametrize(
+    "pis_pasep,expected",
+    (
+        (b"27333549246", True),
+        (b"273.3354.924-6", True),
+        (memoryview(b"27333549246"), True),
+        (b"27333549247", False),
+        (b"00000000000", False),
+        (b"", False),
+    ),
+)
+def test_is_valid_bytes(pis_pasep, expected):
+    assert is_valid_bytes(pis_pasep) is expected
+
+
+def test_is_valid_bytes_random():
+    for _ in range(20):
+        sample = random()
+        assert is_valid_bytes(sample.encode("ascii")) == is_valid(sample)
+
+
+@pytest.mark.parametrize(
+    "pis_pasep,expected",
+    (
+        ("273.3354.924-6", Reason.VALID),
+        ("", Reason.EMPTY),
+        ("273335492461", Reason.INVALID_LENGTH),
+        ("00000000000", Reason.ALL_ZEROS),
+        ("27333549247", Reason.FIRST_DIGIT),
+    ),
+)
+def test_validate(pis_pasep, expected):
+    assert validate(pis_pasep) is expected
+
+
+def test_validate_without_autopad():
+    assert validate("3333549246", autopad=False) is Reason.INVALID_LENGTH
+
+
+def test_validate_many():
+    pytest.importorskip("numpy")
+    samples = ["273.3354.924-6", "", "273335492461", "00000000000", "27333549247", random(), random(formatted=False)]
+    expected = [validate(pis_pasep) for pis_pasep in samples]
+    assert validate_many(samples).tolist() == expected
+
+
+def test_generate_many():
+    pytest.importorskip("numpy")
+    generated = list(generate_many(1000, seed=42))
+    assert len(generated) == 1000
+    assert all(is_valid(pis_pasep=value) for value in generated)
+    assert list(generate_many(1000, seed=42)) == generated
+
+
+def test_generate_many_formatted_unique():
+    pytest.importorskip("numpy")
+    generated = list(generate_many(1000, seed=42, formatted=True, unique=True, chunksize=300))
+    assert len(set(generated)) == 1000
+    assert all(format(NONDIGIT_REGEX.sub("", value)) == value for value in generated)
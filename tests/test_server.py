@@ -0,0 +1,200 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from brazilian_ids.server import Server, endpoints, main
+
+
+async def request(port: int, method: str, path: str, body=None, raw: bytes | None = None) -> tuple[int, dict]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = raw if raw is not None else (b"" if body is None else json.dumps(body).encode())
+
+    try:
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode()
+            + data
+        )
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    return (int(head.split()[1]), json.loads(body))
+
+
+def run(server: Server, scenario):
+    """Run a coroutine function with the port of the server, which is started before and closed after it."""
+
+    async def wrapper():
+        listening = await server.start("127.0.0.1", 0)
+        port = listening.sockets[0].getsockname()[1]
+
+        try:
+            return await scenario(port)
+        finally:
+            await server.close()
+
+    return asyncio.run(wrapper())
+
+
+def test_endpoints():
+    paths = endpoints()
+    assert paths["/validate/cpf"] == ("validate", "cpf")
+    assert paths["/parse/cnpj"] == ("parse", "cnpj")
+    assert "/format/nupj" not in paths
+    assert "/parse/cpf" not in paths
+
+
+def test_validate():
+    async def scenario(port):
+        return [
+            await request(port, "POST", "/validate/cpf", {"value": "529.982.247-25"}),
+            await request(port, "POST", "/validate/cpf", {"values": ["52998224726", "", 52998224725]}),
+        ]
+
+    single, many = run(Server(window=0), scenario)
+    assert single == (200, {"valid": True, "reason": "VALID"})
+    assert many == (
+        200,
+        {
+            "results": [
+                {"valid": False, "reason": "SECOND_DIGIT"},
+                {"valid": False, "reason": "EMPTY"},
+                {"valid": True, "reason": "VALID"},
+            ]
+        },
+    )
+
+
+def test_validate_municipio():
+    async def scenario(port):
+        return await request(port, "POST", "/validate/municipio", {"values": ["2201911", "35.50308", "2201919"]})
+
+    # the same reasons of municipio.validate, which the batches use without NumPy
+    assert run(Server(window=0), scenario) == (
+        200,
+        {
+            "results": [
+                {"valid": False, "reason": "FIRST_DIGIT"},
+                {"valid": False, "reason": "INVALID_LENGTH"},
+                {"valid": True, "reason": "VALID"},
+            ]
+        },
+    )
+
+
+def test_format_and_parse():
+    async def scenario(port):
+        return [
+            await request(port, "POST", "/format/cnpj", {"values": ["11222333000181", "123"]}),
+            await request(port, "POST", "/parse/cnpj", {"value": "11.222.333/0001-81"}),
+            await request(port, "POST", "/parse/municipio", {"value": "3550308"}),
+            await request(port, "POST", "/parse/nupj", {"value": "abc"}),
+        ]
+
+    formatted, cnpj, municipio, nupj = run(Server(window=0), scenario)
+    assert formatted == (200, {"results": [{"formatted": "11.222.333/0001-81"}, {"formatted": None}]})
+    assert cnpj == (
+        200,
+        {
+            "parsed": {
+                "cnpj": "11.222.333/0001-81",
+                "firm": 11222333,
+                "establishment": 1,
+                "first_digit": 8,
+                "second_digit": 1,
+            }
+        },
+    )
+    assert municipio[1]["parsed"]["name"] == "São Paulo"
+    assert nupj == (200, {"parsed": None})
+
+
+def test_cep_with_non_digits():
+    async def scenario(port):
+        return [
+            await request(port, "POST", "/validate/cep", {"value": "abcd"}),
+            await request(port, "POST", "/format/cep", {"value": "7635445a"}),
+        ]
+
+    assert run(Server(window=0), scenario) == [
+        (200, {"valid": False, "reason": "INVALID_CHARACTERS"}),
+        (200, {"formatted": None}),
+    ]
+
+
+def test_errors():
+    async def scenario(port):
+        return [
+            await request(port, "POST", "/validate/rg", {"value": "1"}),
+            await request(port, "GET", "/validate/cpf"),
+            await request(port, "POST", "/validate/cpf", raw=b"{"),
+            await request(port, "POST", "/validate/cpf", {"value": "1", "values": ["1"]}),
+            await request(port, "POST", "/validate/cpf", {"values": [None]}),
+        ]
+
+    statuses = [status for status, _ in run(Server(window=0), scenario)]
+    assert statuses == [404, 405, 400, 400, 400]
+
+
+def test_coalesces_concurrent_requests():
+    server = Server(window=0.05, max_batch=1000)
+
+    async def scenario(port):
+        results = await asyncio.gather(
+            *(request(port, "POST", "/validate/cpf", {"value": "529.982.247-25"}) for _ in range(20))
+        )
+        return (results, await request(port, "GET", "/stats"))
+
+    results, stats = run(server, scenario)
+    assert all(result == (200, {"valid": True, "reason": "VALID"}) for result in results)
+    assert stats == (200, {"requests": 21, "batches": 1, "values": 20})
+
+
+def test_max_batch():
+    server = Server(window=10, max_batch=5)
+
+    async def scenario(port):
+        return await request(port, "POST", "/validate/cpf", {"values": ["52998224725"] * 5})
+
+    # would wait for the window if the batch wasn't full
+    assert run(server, scenario)[1]["results"][4] == {"valid": True, "reason": "VALID"}
+    assert server.batches == 1
+
+
+def test_keep_alive():
+    async def scenario(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        body = b'{"value": "52998224725"}'
+        responses = []
+
+        for _ in range(3):
+            writer.write(b"POST /validate/cpf HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = int(head.lower().split(b"content-length: ")[1].split(b"\r\n")[0])
+            responses.append(json.loads(await reader.readexactly(length)))
+
+        writer.close()
+        return responses
+
+    assert run(Server(window=0), scenario) == [{"valid": True, "reason": "VALID"}] * 3
+
+
+def test_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+
+        async def scenario(port):
+            return await request(port, "POST", "/format/cpf", {"value": "52998224725"})
+
+        assert run(Server(window=0, executor=executor), scenario) == (200, {"formatted": "529.982.247-25"})
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        Server(max_batch=0)
+
+    with pytest.raises(SystemExit):
+        main(["--window", "-1"])
@@ -5,9 +5,13 @@ from brazilian_ids.functions.real_state.sql import (
     format,
     pad,
     is_valid,
+    is_valid_bytes,
     verification_digit,
     EXPECTED_DIGITS,
+    validate,
+    validate_many,
 )
+from brazilian_ids.functions.validation import Reason
 
 
 def test_format():
@@ -52,3 +56,38 @@ def test_verification_digit_with_length_validated(sql, expected_digit):
 def test_verification_digit_with_exception():
     with pytest.raises(InvalidSqlLengthError):
         assert verification_digit("100300022", True)
+
+
+@pytest.mark.parametrize(
+    "sql,expected",
+    (
+        (b"27100300205", True),
+        (b"271.003.0020-5", True),
+        (memoryview(b"00100300022"), True),
+        (b"27100300206", False),
+        (b"100300022", False),
+    ),
+)
+def test_is_valid_bytes(sql, expected):
+    assert is_valid_bytes(sql) is expected
+
+
+@pytest.mark.parametrize(
+    "sql,expected",
+    (
+        ("271.003.0020-5", Reason.VALID),
+        ("", Reason.EMPTY),
+        ("100300022", Reason.INVALID_LENGTH),
+        ("271003002051", Reason.INVALID_LENGTH),
+        ("27100300206", Reason.FIRST_DIGIT),
+    ),
+)
+def test_validate(sql, expected):
+    assert validate(sql) is expected
+
+
+def test_validate_many():
+    pytest.importorskip("numpy")
+    samples = ["271.003.0020-5", "00100300022", "", "100300022", "271003002051", "27100300206"]
+    expected = [validate(sql) for sql in samples]
+    assert validate_many(samples).tolist() == expected
@@ -0,0 +1,112 @@
+import sqlite3
+
+import pytest
+
+from brazilian_ids import sqlite
+from brazilian_ids.functions.person import cpf
+from brazilian_ids.functions.validation import Reason
+from brazilian_ids.kinds import check
+from brazilian_ids.pipeline import UnknownKindError
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute('CREATE TABLE "customer list" (id INTEGER PRIMARY KEY, document TEXT)')
+
+    with conn:
+        conn.executemany(
+            'INSERT INTO "customer list" (document) VALUES (?)',
+            [("529.982.247-25",), ("52998224726",), (None,), ("",), ("96881134258",), ("abc",)] * 5,
+        )
+
+    yield conn
+    conn.close()
+
+
+def test_register(conn):
+    names = sqlite.register(conn)
+    assert {"cpf_is_valid", "cpf_format", "cpf_reason", "cnpj_format", "nupj_is_valid", "cep_state"} <= set(names)
+
+    row = conn.execute(
+        "SELECT cpf_is_valid('529.982.247-25'), cpf_is_valid('52998224726'), cpf_format('52998224725'),"
+        " cpf_format('52998224726'), cpf_reason('52998224726'), cnpj_is_valid('11.222.333/0001-81'),"
+        " nupj_is_valid('6236737-83.2024.4.02.5398'), cep_state('01310-100'), cep_state('123'),"
+        " cpf_is_valid(NULL), cpf_format(NULL), cep_state(NULL), cpf_is_valid(52998224725)"
+    ).fetchone()
+    assert row == (1, 0, "529.982.247-25", None, Reason.SECOND_DIGIT, 1, 1, "SP", None, None, None, None, 1)
+
+
+def test_cep_with_non_digits(conn):
+    sqlite.register(conn, ["cep"])
+    row = conn.execute("SELECT cep_is_valid('abcd'), cep_format('7635445a'), cep_is_valid('01310-200')").fetchone()
+    assert row == (0, None, 1)
+
+
+def test_register_kinds(conn):
+    assert sqlite.register(conn, ["cep"]) == ["cep_is_valid", "cep_format", "cep_reason", "cep_state"]
+
+    with pytest.raises(UnknownKindError):
+        sqlite.register(conn, ["rg"])
+
+
+def test_deterministic_index(conn):
+    sqlite.register(conn, ["cpf"])
+    conn.execute('CREATE INDEX formatted ON "customer list" (cpf_format(document))')
+    plan = conn.execute(
+        """EXPLAIN QUERY PLAN SELECT id FROM "customer list" WHERE cpf_format(document) = '529.982.247-25'"""
+    ).fetchall()
+    assert "USING INDEX formatted" in plan[0][-1]
+    assert len(conn.execute("""SELECT id FROM "customer list" WHERE cpf_format(document) = '529.982.247-25'""").fetchall()) == 5
+
+
+@pytest.mark.parametrize("batch_size", (1, 4, 100))
+def test_validate_table(conn, batch_size):
+    stats = sqlite.validate_table(conn, "customer list", "document", "cpf", apply_format=True, batch_size=batch_size)
+    assert (stats.rows, stats.valid["document"], stats.invalid["document"]) == (30, 10, 20)
+    assert stats.finished is not None
+
+    rows = conn.execute('SELECT document_valid, document_formatted FROM "customer list" WHERE id <= 6 ORDER BY id')
+    assert rows.fetchall() == [
+        (1, "529.982.247-25"),
+        (0, None),
+        (0, None),
+        (0, None),
+        (1, "968.811.342-58"),
+        (0, None),
+    ]
+    assert not conn.in_transaction
+
+
+def test_validate_table_same_as_check(conn):
+    values = [None, 52998224725, "191", "00000000191", "abc", "529.982.247-25", "52998224726"]
+    conn.executemany("""INSERT INTO "customer list" (document) VALUES (?)""", ((value,) for value in values))
+    conn.commit()
+    sqlite.validate_table(conn, "customer list", "document", "cpf", batch_size=4)
+    rows = conn.execute("""SELECT document, document_valid FROM "customer list" ORDER BY id""").fetchall()
+    assert [valid for _, valid in rows] == [int(check(cpf, value)) for value, _ in rows]
+    assert [valid for _, valid in rows[-len(values):]] == [0, 1, 0, 1, 0, 1, 0]
+
+
+def test_validate_table_again(conn):
+    sqlite.validate_table(conn, "customer list", "document", "cpf")
+    conn.execute("""UPDATE "customer list" SET document = '11.222.333/0001-81'""")
+    conn.commit()
+    stats = sqlite.validate_table(conn, "customer list", "document", "cnpj")
+    assert stats.valid["document"] == 30
+    columns = [row[1] for row in conn.execute("""PRAGMA table_info("customer list")""")]
+    assert columns == ["id", "document", "document_valid"]
+
+
+def test_validate_table_errors(conn):
+    with pytest.raises(UnknownKindError):
+        sqlite.validate_table(conn, "customer list", "document", "rg")
+
+    with pytest.raises(ValueError):
+        sqlite.validate_table(conn, "customers", "document", "cpf")
+
+    with pytest.raises(ValueError):
+        sqlite.validate_table(conn, "customer list", "cpf", "cpf")
+
+    with pytest.raises(ValueError):
+        sqlite.validate_table(conn, "customer list", "document", "cpf", batch_size=0)